@@ -15,25 +15,44 @@ import subprocess
 import shutil
 import tempfile
 import zipfile
+import io
+import codecs
+import posixpath
+import multiprocessing
 import base64
 import hashlib
+import html
+import functools
+import bisect
+import difflib
+import heapq
+import zlib
 import threading
 import time
 import webbrowser
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
 import argparse
 import logging
-from dataclasses import dataclass, asdict
+import uuid
+from array import array
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor,
+                                TimeoutError as FutureTimeoutError, wait)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict, field, fields, replace
 import importlib.util
+import importlib.metadata
 import ast
+import tokenize
 import re
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import requests
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for, session
+from flask import Flask, Request, render_template, request, jsonify, send_file, flash, redirect, url_for, session, Response, stream_with_context
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.security import generate_password_hash, check_password_hash
 import sqlite3
 from contextlib import contextmanager
@@ -44,17 +63,77 @@ TEMPLATES_FOLDER = 'templates'
 STATIC_FOLDER = 'static'
 OUTPUT_FOLDER = 'output'
 DATABASE_PATH = 'converter.db'
-ALLOWED_EXTENSIONS = {'.py', '.pyw'}
+DB_POOL_SIZE = 8  # Connexions SQLite libres gardées ouvertes
+DB_BUSY_TIMEOUT = 10.0  # Secondes d'attente d'un verrou avant "database is locked"
+DB_MMAP_SIZE = 256 * 1024 * 1024  # Pages lues par mmap
+DB_CACHE_KB = 16 * 1024  # Cache de pages par connexion
+DB_STATEMENT_CACHE = 256  # Requêtes préparées gardées par connexion
+SOURCE_CHUNK_SIZE = 256 * 1024  # Lecture en flux des sources stockés
+SOURCE_PREVIEW_CHARS = 2000  # Caractères du source affichés sur la page projet
+PROJECTS_PAGE_SIZE = 50  # Projets par page de /api/projects
+PROJECTS_PAGE_MAX = 500  # Limite haute du paramètre limit
+INDEX_PROJECTS_SHOWN = 10  # Projets par page d'accueil
+SEARCH_PAGE_SIZE = 20  # Résultats par page de /api/search
+SEARCH_PAGE_MAX = 100  # Limite haute du paramètre limit
+SEARCH_CHUNK_LINES = 40  # Lignes de source par document de l'index plein texte
+SEARCH_CHUNK_BITS = 20  # rowid d'un morceau = id du projet << SEARCH_CHUNK_BITS | numéro du morceau
+SEARCH_INDEX_MAX_CHARS = 8 * 1024 * 1024  # Début du source indexé pour la recherche
+REVISION_SNAPSHOT_INTERVAL = 20  # Une révision complète toutes les N révisions (au plus N-1 deltas à appliquer)
+REVISION_DIFF_MAX_LINES = 50000  # Au-delà, la zone modifiée est stockée telle quelle plutôt que comparée
+ALLOWED_EXTENSIONS = {'.py', '.pyw', '.zip'}
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+BUILD_WORKERS = int(os.environ.get('BUILD_WORKERS', '2'))  # Constructions en parallèle
+BUILD_HISTORY_SIZE = 200  # Tâches terminées conservées en mémoire
+BUILD_CACHE_FOLDER = os.path.join(OUTPUT_FOLDER, '.build_cache')
+BUILD_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2GB
+BUILD_WORK_FOLDER = os.path.join(OUTPUT_FOLDER, '.build_work')  # Répertoires de travail persistants
+BUILD_LOG_BUFFER_LINES = 1000  # Lignes de log gardées en mémoire par construction
+BUILD_LOG_TAIL_LINES = 200  # Lignes de log reprises dans le message d'erreur
+SSE_KEEPALIVE_SECONDS = 15
+BUILD_METRICS_WINDOW = 5000  # Constructions récentes prises en compte par /api/metrics/builds
+BUILDER_IN_PROCESS = os.environ.get('BUILDER_IN_PROCESS', '1') == '1'  # Workers PyInstaller pré-chargés
+BUILDER_WORKER_MAX_BUILDS = 20  # Constructions par worker avant recyclage
+BUILDER_WORKER_RETRY_DELAY = 5.0  # Secondes sans worker après un échec de démarrage (doublées à chaque échec)
+BUILDER_WORKER_RETRY_MAX = 300.0  # Délai maximal entre deux tentatives
+STARTUP_PROBE_ENV = 'PYAPP_STARTUP_PROBE'  # Active la sonde de démarrage des wrappers
+BENCHMARK_RUNS = 10  # Lancements par exécutable en mode benchmark
+BENCHMARK_TIMEOUT = 60  # Secondes avant d'abandonner un lancement
+EXTRACTION_PAYLOAD_NAME = 'pyapp_payload.zip'  # Application embarquée par le lanceur à extraction persistante
+ANALYSIS_CACHE_MEMORY_ENTRIES = 256  # Analyses gardées en mémoire
+ANALYSIS_CACHE_MEMORY_BYTES = 32 * 1024 * 1024  # 32MB
+ANALYSIS_CACHE_DB_ENTRIES = 5000  # Analyses persistées dans converter.db
+ANALYSIS_CACHE_DB_BYTES = 256 * 1024 * 1024  # 256MB
+ANALYSIS_CACHE_EVICT_RATIO = 0.9  # Éviction jusqu'à 90% des limites (pas de parcours de table à chaque ajout)
+ANALYSIS_CACHE_ACCESS_BATCH = 64  # Lectures de la base notées avant d'écrire leur last_access
+INCREMENTAL_MAX_SESSIONS = 64  # Projets suivis par l'analyse incrémentale
+ANALYSIS_MAX_SOURCE_CHARS = 2 * 1024 * 1024  # Au-delà, pas de parsing (ast.parse ne peut être interrompu)
+ANALYSIS_MAX_NODES = 2_000_000  # Nœuds d'AST visités par analyse
+ANALYSIS_TIME_BUDGET = 5.0  # Secondes par analyse, parsing compris
+HOTSPOTS_SHOWN = 10  # Fonctions listées dans les points chauds de la page projet
+SUMMARY_TOP_N = 10  # Éléments de chaque classement du résumé d'analyse
+ANALYSIS_PAGE_SIZE = 200  # Enregistrements par liste détaillée dans les réponses de l'API
+ANALYSIS_PAGE_MAX = 2000  # Limite haute du paramètre limit
+SYMBOL_TEXT_MAX = 200  # Caractères gardés d'un décorateur ou d'une classe de base
+ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', str(min(4, os.cpu_count() or 1))))
+ANALYSIS_TASK_TIMEOUT = 15.0  # Délai dur par analyse dans le pool (démarrage du processus compris)
+ANALYSIS_WORKER_MEMORY = 2 * 1024 * 1024 * 1024  # Espace d'adressage max d'un processus d'analyse
+ANALYSIS_INLINE_CHARS = 64 * 1024  # En dessous, analyse dans le thread de la requête
+ANALYSIS_BATCH_MAX = 1000  # Sources par appel de /api/analyze/batch
+BACKGROUND_ANALYSIS_WORKERS = 2  # Threads des analyses complètes lancées après l'upload
+HEADER_SCAN_MAX_LINES = 2000  # Lignes lues au plus par la détection rapide du framework
+DISTRIBUTION_INDEX_CHECK_INTERVAL = 5.0  # Secondes entre deux vérifications de site-packages
+PROJECT_BATCH_BYTES = 64 * 1024  # Sources par tâche du pool d'analyse (un module plus gros forme sa propre tâche)
+PROJECT_MAX_MODULES = 20000  # Modules .py acceptés dans une archive
+PROJECT_MAX_SOURCE_BYTES = 512 * 1024 * 1024  # Sources décompressées (protection zip bomb)
 
-# Configuration des logs
+# Configuration des logs. converter.log est ouvert par main(): les workers
+# d'analyse (spawn) réimportent ce module et n'y écrivent pas en parallèle
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE = 'converter.log'
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('converter.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    format=LOG_FORMAT,
+    handlers=[logging.StreamHandler(sys.stdout)]
 )
 logger = logging.getLogger(__name__)
 
@@ -76,6 +155,10 @@ class ProjectConfig:
     one_file: bool = True
     upx_compress: bool = False
     debug_mode: bool = False
+    incremental_build: bool = True
+    auto_excludes: bool = True
+    extraction_cache: bool = False
+    analysis_only: bool = False  # Projet créé depuis une archive: seul le point d'entrée est stocké
     created_at: str = ""
     
     def __post_init__(self):
@@ -84,26 +167,184 @@ class ProjectConfig:
         if not self.created_at:
             self.created_at = datetime.now().isoformat()
 
+def _path_size(path: str) -> int:
+    """Taille d'un fichier ou de l'ensemble des fichiers d'un répertoire"""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+def _percentiles(values: List[float], percents=(50, 95, 99)) -> Dict[str, Any]:
+    """Percentiles (rang le plus proche) d'une série de valeurs"""
+    ordered = sorted(values)
+    summary: Dict[str, Any] = {'count': len(ordered)}
+    for percent in percents:
+        if ordered:
+            rank = max(0, -(-percent * len(ordered) // 100) - 1)
+            summary[f'p{percent}'] = ordered[rank]
+        else:
+            summary[f'p{percent}'] = None
+    return summary
+
+class ConnectionPool:
+    """Connexions SQLite réutilisées entre les threads
+    
+    Une connexion ne sert qu'à un thread à la fois; rendue au pool, elle garde
+    son cache de pages et ses requêtes préparées. Au-delà de max_idle connexions
+    libres, les connexions rendues sont fermées.
+    """
+    
+    def __init__(self, db_path: str, max_idle: int = DB_POOL_SIZE):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=DB_BUSY_TIMEOUT, check_same_thread=False,
+                               cached_statements=DB_STATEMENT_CACHE)
+        conn.row_factory = sqlite3.Row
+        # En WAL, NORMAL ne synchronise qu'aux checkpoints: seule une panne système
+        # peut perdre les dernières transactions, jamais corrompre la base
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = -{DB_CACHE_KB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+    
+    def acquire(self) -> sqlite3.Connection:
+        """Connexion libre, ou nouvelle connexion si le pool est vide"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+    
+    def release(self, conn: sqlite3.Connection, reusable: bool = True):
+        """Rend une connexion (fermée si inutilisable ou si le pool est plein)"""
+        if reusable and not conn.in_transaction:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+    
+    def close(self):
+        """Ferme les connexions libres"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+class SourceDelta:
+    """Delta par lignes entre deux versions d'un source
+    
+    Un delta est une liste d'opérations: [début, fin] recopie les lignes
+    [début:fin] de la version de base, une chaîne insère du texte. Les lignes
+    gardent leur fin de ligne: la reconstruction est exacte. None signifie
+    « source identique ».
+    """
+    
+    @staticmethod
+    def compute(old_lines: List[str], new_lines: List[str]) -> List[Union[List[int], str]]:
+        """Delta de old_lines vers new_lines"""
+        limit = min(len(old_lines), len(new_lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+            suffix += 1
+        
+        ops: List[Union[List[int], str]] = [[0, prefix]] if prefix else []
+        old_middle = old_lines[prefix:len(old_lines) - suffix]
+        new_middle = new_lines[prefix:len(new_lines) - suffix]
+        if old_middle and new_middle and len(old_middle) + len(new_middle) <= REVISION_DIFF_MAX_LINES:
+            matcher = difflib.SequenceMatcher(None, old_middle, new_middle)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag == 'equal':
+                    ops.append([prefix + i1, prefix + i2])
+                elif j2 > j1:
+                    ops.append(''.join(new_middle[j1:j2]))
+        elif new_middle:
+            ops.append(''.join(new_middle))
+        if suffix:
+            ops.append([len(old_lines) - suffix, len(old_lines)])
+        return ops
+    
+    @staticmethod
+    def apply(old_lines: List[str], ops: Optional[List[Union[List[int], str]]]) -> List[str]:
+        """Lignes de la nouvelle version"""
+        if ops is None:
+            return old_lines
+        new_lines: List[str] = []
+        for op in ops:
+            if isinstance(op, str):
+                new_lines.extend(op.splitlines(keepends=True))
+            else:
+                new_lines.extend(old_lines[op[0]:op[1]])
+        return new_lines
+
 class DatabaseManager:
     """Gestionnaire de base de données SQLite"""
     
+    # Messages SQLite d'une requête MATCH invalide (les autres erreurs ne sont pas du client)
+    FTS_QUERY_ERRORS = ('fts5:', 'syntax error', 'unterminated string', 'unknown special query',
+                        'no such column')
+    
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
+        self.pool = ConnectionPool(db_path)
+        self.search_enabled = False
+        # Cache d'analyses: totaux tenus en mémoire, accès écrits par lots
+        self.analysis_cache_entries = 0
+        self.analysis_cache_bytes = 0
+        self._analysis_accesses: Dict[Tuple[str, int], float] = {}
+        self._analysis_lock = threading.Lock()
         self.init_database()
     
     def init_database(self):
         """Initialise la base de données"""
         with self.get_connection() as conn:
+            # WAL (persistant dans le fichier): les lectures ne bloquent plus derrière une écriture
+            journal_mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            if journal_mode.lower() != 'wal':
+                logger.warning(f"Mode WAL indisponible pour {self.db_path} (journal: {journal_mode})")
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS projects (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT UNIQUE NOT NULL,
                     config TEXT NOT NULL,
-                    source_code TEXT,
+                    source_digest TEXT,
+                    gui_framework TEXT,
+                    author TEXT,
+                    symbols_digest TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
                 
+                CREATE TABLE IF NOT EXISTS source_blobs (
+                    id INTEGER PRIMARY KEY,
+                    digest TEXT UNIQUE NOT NULL,
+                    size INTEGER NOT NULL,
+                    content BLOB NOT NULL
+                );
+                
+                CREATE TABLE IF NOT EXISTS project_revisions (
+                    project_id INTEGER NOT NULL,
+                    revision INTEGER NOT NULL,
+                    config TEXT NOT NULL,
+                    source_digest TEXT,
+                    snapshot INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    data BLOB NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (project_id, revision),
+                    FOREIGN KEY (project_id) REFERENCES projects (id)
+                );
+                
                 CREATE TABLE IF NOT EXISTS users (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     username TEXT UNIQUE NOT NULL,
@@ -118,180 +359,2429 @@ class DatabaseManager:
                     status TEXT NOT NULL,
                     log_output TEXT,
                     output_path TEXT,
+                    gui_framework TEXT,
+                    duration REAL,
+                    phase_timings TEXT,
+                    artifact_size INTEGER,
+                    peak_rss INTEGER,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (project_id) REFERENCES projects (id)
                 );
                 
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    digest TEXT NOT NULL,
+                    analyzer_version INTEGER NOT NULL,
+                    result TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (digest, analyzer_version)
+                );
+                
+                CREATE TABLE IF NOT EXISTS distribution_index (
+                    module TEXT NOT NULL,
+                    distribution TEXT NOT NULL,
+                    version TEXT,
+                    fingerprint TEXT NOT NULL,
+                    PRIMARY KEY (module, distribution)
+                );
+                
                 CREATE INDEX IF NOT EXISTS idx_projects_name ON projects(name);
                 CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
                 CREATE INDEX IF NOT EXISTS idx_conversion_history_project_id ON conversion_history(project_id);
+                CREATE INDEX IF NOT EXISTS idx_analysis_cache_last_access ON analysis_cache(last_access);
+            """)
+            
+            # Colonnes ajoutées depuis la création des bases existantes
+            inline_sources = self._ensure_columns(conn, 'projects', {
+                'source_digest': 'TEXT',
+                'gui_framework': 'TEXT',
+                'author': 'TEXT',
+                'symbols_digest': 'TEXT'  # Source dont les symboles sont dans l'index de recherche
+            })
+            # Index de la liste paginée (ordre updated_at, id), avec ou sans filtre
+            conn.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_projects_source_digest ON projects(source_digest);
+                CREATE INDEX IF NOT EXISTS idx_projects_updated ON projects(updated_at, id);
+                CREATE INDEX IF NOT EXISTS idx_projects_framework_updated ON projects(gui_framework, updated_at, id);
+                CREATE INDEX IF NOT EXISTS idx_projects_author_updated ON projects(author, updated_at, id);
             """)
+            if 'source_code' in inline_sources:
+                self._migrate_inline_sources(conn)
+            self._backfill_listing_columns(conn)
+            self._init_search(conn)
+            self._ensure_columns(conn, 'conversion_history', {
+                'gui_framework': 'TEXT',
+                'duration': 'REAL',
+                'phase_timings': 'TEXT',
+                'artifact_size': 'INTEGER',
+                'peak_rss': 'INTEGER'
+            })
+            self._init_analysis_cache(conn)
+    
+    def _init_analysis_cache(self, conn):
+        """Purge les analyses d'une autre version de l'analyseur et relève la taille du cache"""
+        purged = conn.execute("DELETE FROM analysis_cache WHERE analyzer_version != ?",
+                              (CodeAnalyzer.VERSION,)).rowcount
+        if purged:
+            logger.info(f"{purged} analyses d'une version précédente de l'analyseur supprimées")
+        self.analysis_cache_entries, self.analysis_cache_bytes = conn.execute("""
+            SELECT COUNT(*), COALESCE(SUM(size), 0) FROM analysis_cache
+        """).fetchone()
+    
+    @staticmethod
+    def _ensure_columns(conn, table: str, columns: Dict[str, str]) -> set:
+        """Ajoute les colonnes manquantes d'une table; retourne les colonnes existantes"""
+        existing = {row['name'] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for name, column_type in columns.items():
+            if name not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+        return existing
+    
+    def _migrate_inline_sources(self, conn):
+        """Déplace les sources stockés dans projects.source_code vers source_blobs"""
+        ids = [row['id'] for row in conn.execute("SELECT id FROM projects WHERE source_code IS NOT NULL")]
+        for project_id in ids:
+            source_code = conn.execute("SELECT source_code FROM projects WHERE id = ?",
+                                       (project_id,)).fetchone()['source_code']
+            digest = self._store_source(conn, source_code)
+            conn.execute("UPDATE projects SET source_digest = ?, source_code = NULL WHERE id = ?",
+                         (digest, project_id))
+        if ids:
+            logger.info(f"{len(ids)} sources de projets déplacés vers source_blobs")
+    
+    @staticmethod
+    def _backfill_listing_columns(conn):
+        """Recopie framework et auteur depuis la configuration JSON des projets existants"""
+        rows = conn.execute("SELECT id, config FROM projects WHERE gui_framework IS NULL").fetchall()
+        conn.executemany("UPDATE projects SET gui_framework = ?, author = ? WHERE id = ?",
+                         [(config.get('gui_framework', ''), config.get('author', ''), row['id'])
+                          for row in rows for config in [json.loads(row['config'])]])
+    
+    def _init_search(self, conn):
+        """Index plein texte (FTS5): métadonnées et symboles par projet, source par morceaux
+        
+        Le source est découpé en morceaux de SEARCH_CHUNK_LINES lignes: snippet()
+        reste rapide (son coût croît avec les occurrences dans un document) et
+        chaque résultat donne sa ligne.
+        """
+        try:
+            conn.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS project_search USING fts5(name, description, author, symbols);
+                CREATE VIRTUAL TABLE IF NOT EXISTS source_search USING fts5(text, first_line UNINDEXED);
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Recherche plein texte indisponible (FTS5): {e}")
+            return
+        self.search_enabled = True
+        
+        # Projets enregistrés avant l'index de recherche
+        missing = [row['id'] for row in conn.execute("""
+            SELECT id FROM projects p WHERE NOT EXISTS (SELECT 1 FROM project_search s WHERE s.rowid = p.id)
+        """)]
+        for project_id in missing:
+            row = conn.execute("""
+                SELECT p.config, b.content FROM projects p
+                LEFT JOIN source_blobs b ON b.digest = p.source_digest WHERE p.id = ?
+            """, (project_id,)).fetchone()
+            source_code = row['content'].decode('utf-8', errors='replace') if row['content'] else ""
+            self._index_project(conn, project_id, ProjectConfig(**json.loads(row['config'])), source_code, "")
+        if missing:
+            logger.info(f"{len(missing)} projets ajoutés à l'index de recherche")
+    
+    def _index_project(self, conn, project_id: int, config: ProjectConfig, source_code: str, symbols: str):
+        """Ajoute un projet à l'index plein texte"""
+        if not self.search_enabled:
+            return
+        conn.execute("""
+            INSERT INTO project_search (rowid, name, description, author, symbols) VALUES (?, ?, ?, ?, ?)
+        """, (project_id, config.name, config.description, config.author, symbols))
+        text = source_code[:SEARCH_INDEX_MAX_CHARS].encode('utf-8', errors='replace').decode('utf-8')
+        lines = text.split('\n')
+        base = project_id << SEARCH_CHUNK_BITS
+        conn.executemany("INSERT INTO source_search (rowid, text, first_line) VALUES (?, ?, ?)",
+                         ((base + index, '\n'.join(lines[start:start + SEARCH_CHUNK_LINES]), start + 1)
+                          for index, start in enumerate(range(0, len(lines), SEARCH_CHUNK_LINES))))
+    
+    def _unindex_project(self, conn, project_id: int):
+        """Retire un projet de l'index plein texte"""
+        if not self.search_enabled:
+            return
+        conn.execute("DELETE FROM project_search WHERE rowid = ?", (project_id,))
+        base = project_id << SEARCH_CHUNK_BITS
+        conn.execute("DELETE FROM source_search WHERE rowid BETWEEN ? AND ?",
+                     (base, base + (1 << SEARCH_CHUNK_BITS) - 1))
+    
+    @staticmethod
+    def _store_source(conn, source_code: str, digest: Optional[str] = None) -> str:
+        """Stocke un source une seule fois par contenu; retourne son empreinte
+        
+        L'empreinte est celle d'AnalysisCache.digest(): elle sert aussi de clé
+        d'analyse en cache.
+        """
+        digest = digest or AnalysisCache.digest(source_code)
+        if not conn.execute("SELECT 1 FROM source_blobs WHERE digest = ?", (digest,)).fetchone():
+            data = source_code.encode('utf-8', errors='surrogatepass')
+            conn.execute("INSERT INTO source_blobs (digest, size, content) VALUES (?, ?, ?)",
+                         (digest, len(data), sqlite3.Binary(data)))
+        return digest
+    
+    @staticmethod
+    def _release_source(conn, digest: Optional[str]):
+        """Supprime un source qu'aucun projet ne référence plus"""
+        if digest:
+            conn.execute("""
+                DELETE FROM source_blobs WHERE digest = ?
+                AND NOT EXISTS (SELECT 1 FROM projects WHERE source_digest = ?)
+            """, (digest, digest))
+    
+    @staticmethod
+    def _blob_text(conn, digest: Optional[str]) -> str:
+        """Source stocké sous cette empreinte, dans la transaction en cours"""
+        row = conn.execute("SELECT content FROM source_blobs WHERE digest = ?", (digest,)).fetchone()
+        return row['content'].decode('utf-8', errors='surrogatepass') if row else ""
+    
+    def _record_revision(self, conn, project_id: int, config_json: str, digest: str,
+                         source_code: Optional[str], previous: Optional[sqlite3.Row]):
+        """Ajoute une révision: delta zlib contre la précédente, ou source complet
+        
+        Une révision sur REVISION_SNAPSHOT_INTERVAL est complète, de même que
+        toute révision dont le delta ne serait pas nettement plus petit que le
+        source: reconstruire une version applique au plus N-1 deltas.
+        source_code None signifie source inchangé (configuration seule): il n'est
+        lu que pour une révision complète.
+        """
+        last = conn.execute("SELECT MAX(revision) FROM project_revisions WHERE project_id = ?",
+                            (project_id,)).fetchone()[0]
+        previous_source = None
+        if previous and last is None:
+            # Projet enregistré avant l'historique: son état actuel devient la révision 1
+            previous_source = self._blob_text(conn, previous['source_digest'])
+            data = previous_source.encode('utf-8', errors='surrogatepass')
+            conn.execute("""
+                INSERT INTO project_revisions (project_id, revision, config, source_digest, snapshot, size, data)
+                VALUES (?, 1, ?, ?, 1, ?, ?)
+            """, (project_id, previous['config'], previous['source_digest'], len(data),
+                  sqlite3.Binary(zlib.compress(data))))
+            last = 1
+        
+        revision = (last or 0) + 1
+        unchanged = previous is not None and previous['source_digest'] == digest
+        if source_code is None and not unchanged:
+            raise ValueError("source_code requis quand le source change")
+        data = source_code.encode('utf-8', errors='surrogatepass') if source_code is not None else None
+        payload = None
+        if last is not None and (revision - 1) % REVISION_SNAPSHOT_INTERVAL:
+            if unchanged:
+                payload = b'null'
+            else:
+                if previous_source is None:
+                    previous_source = self._blob_text(conn, previous['source_digest'])
+                delta = json.dumps(SourceDelta.compute(previous_source.splitlines(keepends=True),
+                                                       source_code.splitlines(keepends=True)),
+                                   separators=(',', ':')).encode('utf-8')
+                if len(delta) < len(data) // 2:
+                    payload = delta
+        
+        if payload is None and data is None:
+            source_code = previous_source if previous_source is not None else self._blob_text(conn, digest)
+            data = source_code.encode('utf-8', errors='surrogatepass')
+        if data is not None:
+            size = len(data)
+        else:
+            row = conn.execute("SELECT size FROM source_blobs WHERE digest = ?", (digest,)).fetchone()
+            size = row['size'] if row else 0
+        conn.execute("""
+            INSERT INTO project_revisions (project_id, revision, config, source_digest, snapshot, size, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (project_id, revision, config_json, digest, int(payload is None), size,
+              sqlite3.Binary(zlib.compress(payload if payload is not None else data))))
+    
+    @contextmanager
+    def get_connection(self):
+        """Context manager pour les connexions à la base de données (prises dans le pool)"""
+        conn = self.pool.acquire()
+        reusable = True
+        try:
+            yield conn
+            conn.commit()
+        except Exception as e:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                reusable = False
+            if isinstance(e, sqlite3.OperationalError) and 'locked' in str(e):
+                logger.error(f"Base verrouillée plus de {DB_BUSY_TIMEOUT}s: {e}")
+            else:
+                logger.error(f"Erreur base de données: {e}")
+            raise
+        finally:
+            self.pool.release(conn, reusable)
+    
+    def close(self):
+        """Écrit les accès au cache d'analyses en attente puis ferme les connexions du pool"""
+        with self._analysis_lock:
+            accesses, self._analysis_accesses = self._analysis_accesses, {}
+        if accesses:
+            try:
+                with self.get_connection() as conn:
+                    self._write_analysis_accesses(conn, accesses)
+            except sqlite3.Error:
+                pass
+        self.pool.close()
+    
+    def save_project(self, config: ProjectConfig, source_code: str = "",
+                     digest: Optional[str] = None) -> int:
+        """Sauvegarde un projet (digest: AnalysisCache.digest(source_code) s'il est connu)
+        
+        Un projet existant garde son identifiant (et donc son historique de
+        conversions); chaque changement de source ou de configuration ajoute
+        une révision.
+        """
+        config_json = json.dumps(asdict(config))
+        with self.get_connection() as conn:
+            previous = conn.execute("""
+                SELECT id, config, source_digest, symbols_digest FROM projects WHERE name = ?
+            """, (config.name,)).fetchone()
+            digest = self._store_source(conn, source_code, digest)
+            source_changed = not previous or previous['source_digest'] != digest
+            
+            if previous:
+                project_id = previous['id']
+                # Symboles indexés conservés si le source n'a pas changé
+                symbols_digest = None if source_changed else previous['symbols_digest']
+                conn.execute("""
+                    UPDATE projects SET config = ?, source_digest = ?, gui_framework = ?, author = ?,
+                                        symbols_digest = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (config_json, digest, config.gui_framework, config.author, symbols_digest, project_id))
+            else:
+                project_id = conn.execute("""
+                    INSERT INTO projects (name, config, source_digest, gui_framework, author)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (config.name, config_json, digest, config.gui_framework, config.author)).lastrowid
+            
+            if source_changed or previous['config'] != config_json:
+                self._record_revision(conn, project_id, config_json, digest, source_code, previous)
+            
+            if source_changed:
+                if previous:
+                    self._unindex_project(conn, project_id)
+                    self._release_source(conn, previous['source_digest'])
+                self._index_project(conn, project_id, config, source_code, "")
+            elif self.search_enabled:
+                conn.execute("UPDATE project_search SET description = ?, author = ? WHERE rowid = ?",
+                             (config.description, config.author, project_id))
+            return project_id
+    
+    def update_project_config(self, config: ProjectConfig) -> bool:
+        """Met à jour la configuration d'un projet sans réécrire son source (nouvelle révision)"""
+        config_json = json.dumps(asdict(config))
+        with self.get_connection() as conn:
+            previous = conn.execute("SELECT id, config, source_digest FROM projects WHERE name = ?",
+                                    (config.name,)).fetchone()
+            if not previous:
+                return False
+            if previous['config'] == config_json:
+                return True
+            conn.execute("""
+                UPDATE projects SET config = ?, gui_framework = ?, author = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (config_json, config.gui_framework, config.author, previous['id']))
+            self._record_revision(conn, previous['id'], config_json, previous['source_digest'], None, previous)
+            if self.search_enabled:
+                conn.execute("UPDATE project_search SET description = ?, author = ? WHERE rowid = ?",
+                             (config.description, config.author, previous['id']))
+            return True
+    
+    def update_search_symbols(self, name: str, digest: str, symbols: str) -> bool:
+        """Indexe les symboles extraits d'un source, si c'est toujours celui du projet"""
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT id FROM projects WHERE name = ? AND source_digest = ?",
+                               (name, digest)).fetchone()
+            if not row:
+                return False
+            conn.execute("UPDATE projects SET symbols_digest = ? WHERE id = ?", (digest, row['id']))
+            if self.search_enabled:
+                conn.execute("UPDATE project_search SET symbols = ? WHERE rowid = ?", (symbols, row['id']))
+            return True
+    
+    def list_projects_without_symbols(self) -> List[Tuple[str, str]]:
+        """Projets (nom, empreinte) dont les symboles du source actuel ne sont pas indexés"""
+        with self.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT name, source_digest FROM projects
+                WHERE source_digest IS NOT NULL AND symbols_digest IS NOT source_digest
+            """).fetchall()
+            return [(row['name'], row['source_digest']) for row in rows]
+    
+    def search_projects(self, query: str, limit: int = SEARCH_PAGE_SIZE, offset: int = 0,
+                        fields: Tuple[str, ...] = ('name', 'description', 'author', 'symbols', 'source')
+                        ) -> Tuple[List[Dict], int]:
+        """Recherche plein texte classée (bm25); retourne une page de résultats et leur nombre
+        
+        Un projet correspond si ses métadonnées ou l'un des morceaux de son source
+        contiennent tous les termes. Les extraits sont en HTML échappé, les
+        occurrences entre <mark>.
+        """
+        match = self._fts_query(query)
+        meta_fields = [name for name in ('name', 'description', 'author', 'symbols') if name in fields]
+        branches, params = [], []
+        if meta_fields:
+            branches.append("""SELECT rowid AS project_id, 0 AS part, bm25(project_search, 10.0, 2.0, 2.0, 5.0) AS score
+                               FROM project_search WHERE project_search MATCH ?""")
+            params.append(f"{{{' '.join(meta_fields)}}} : ({match})")
+        if 'source' in fields:
+            branches.append(f"""SELECT rowid >> {SEARCH_CHUNK_BITS}, 1, bm25(source_search)
+                                FROM source_search WHERE source_search MATCH ?""")
+            params.append(match)
+        # Score d'un projet: meilleur score des métadonnées + meilleur morceau de source
+        # (LIMIT -1 empêche d'aplatir la sous-requête: bm25() hors d'un agrégat)
+        hits = f"""
+            SELECT project_id, SUM(best) AS score FROM (
+                SELECT project_id, part, MIN(score) AS best FROM ({' UNION ALL '.join(branches)} LIMIT -1)
+                GROUP BY project_id, part
+            ) GROUP BY project_id
+        """
+        
+        try:
+            with self.get_connection() as conn:
+                total = conn.execute(f"SELECT COUNT(*) FROM ({hits})", params).fetchone()[0]
+                rows = conn.execute(f"""
+                    SELECT p.id, p.name, p.gui_framework, p.author, p.updated_at, hits.score
+                    FROM ({hits}) hits JOIN projects p ON p.id = hits.project_id
+                    ORDER BY hits.score, p.id LIMIT ? OFFSET ?
+                """, params + [limit, offset]).fetchall()
+                results = [self._search_result(conn, dict(row), match, meta_fields, 'source' in fields)
+                           for row in rows]
+        except sqlite3.OperationalError as e:
+            # Seules les erreurs de la requête FTS5 sont des erreurs client (400);
+            # verrou, E/S... restent des erreurs serveur
+            if not any(marker in str(e) for marker in self.FTS_QUERY_ERRORS):
+                raise
+            raise ValueError(f"Requête de recherche invalide: {e}")
+        return results, total
+    
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        """Requête FTS5 sûre: chaque terme (ou "phrase") devient une phrase, préfixe si terminé par *"""
+        terms = []
+        for phrase, word in re.findall(r'"([^"]*)"|(\S+)', query):
+            prefix = bool(word) and word.endswith('*')
+            text = word.rstrip('*') if prefix else (phrase or word)
+            if text.strip():
+                terms.append('"' + text.replace('"', '""') + '"' + ('*' if prefix else ''))
+        if not terms:
+            raise ValueError("Requête de recherche vide")
+        return ' '.join(terms)
+    
+    @staticmethod
+    def _search_result(conn, result: Dict[str, Any], match: str, meta_fields: List[str],
+                       in_source: bool) -> Dict[str, Any]:
+        """Extraits surlignés d'un résultat: métadonnées et meilleur morceau de source"""
+        def mark(text: str) -> str:
+            return html.escape(text).replace('\x02', '<mark>').replace('\x03', '</mark>')
+        
+        result['highlights'] = {}
+        if meta_fields:
+            row = conn.execute("""
+                SELECT highlight(project_search, 0, char(2), char(3)) AS name,
+                       snippet(project_search, 1, char(2), char(3), '...', 24) AS description,
+                       highlight(project_search, 2, char(2), char(3)) AS author,
+                       snippet(project_search, 3, char(2), char(3), '...', 12) AS symbols
+                FROM project_search WHERE project_search MATCH ? AND rowid = ?
+            """, (f"{{{' '.join(meta_fields)}}} : ({match})", result['id'])).fetchone()
+            if row:
+                result['highlights'] = {name: mark(row[name]) for name in meta_fields
+                                        if '\x02' in (row[name] or '')}
+        if in_source:
+            base = result['id'] << SEARCH_CHUNK_BITS
+            row = conn.execute("""
+                SELECT snippet(source_search, 0, char(2), char(3), '...', 24) AS snippet,
+                       highlight(source_search, 0, char(2), char(3)) AS chunk, first_line
+                FROM source_search WHERE source_search MATCH ? AND rowid BETWEEN ? AND ?
+                ORDER BY bm25(source_search) LIMIT 1
+            """, (match, base, base + (1 << SEARCH_CHUNK_BITS) - 1)).fetchone()
+            if row:
+                result['highlights']['source'] = mark(row['snippet'])
+                result['line'] = row['first_line'] + row['chunk'][:row['chunk'].find('\x02')].count('\n')
+        return result
+    
+    def load_project(self, name: str) -> Optional[Tuple[ProjectConfig, str]]:
+        """Charge un projet"""
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                SELECT p.config, b.content FROM projects p
+                LEFT JOIN source_blobs b ON b.digest = p.source_digest
+                WHERE p.name = ?
+            """, (name,)).fetchone()
+            
+            if row:
+                config_dict = json.loads(row['config'])
+                config = ProjectConfig(**config_dict)
+                content = row['content']
+                return config, content.decode('utf-8', errors='surrogatepass') if content else ""
+            return None
+    
+    def load_project_config(self, name: str) -> Optional[Tuple[ProjectConfig, Optional[str]]]:
+        """Charge la configuration d'un projet et l'empreinte de son source, sans lire le source"""
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT config, source_digest FROM projects WHERE name = ?",
+                               (name,)).fetchone()
+            if row:
+                return ProjectConfig(**json.loads(row['config'])), row['source_digest']
+            return None
+    
+    def load_source(self, digest: str) -> Optional[str]:
+        """Source stocké sous cette empreinte"""
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT content FROM source_blobs WHERE digest = ?", (digest,)).fetchone()
+            return row['content'].decode('utf-8', errors='surrogatepass') if row else None
+    
+    def iter_source(self, digest: str, chunk_size: int = SOURCE_CHUNK_SIZE) -> Iterator[bytes]:
+        """Lit un source stocké (UTF-8) par morceaux, sans le charger entièrement"""
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT id, size FROM source_blobs WHERE digest = ?", (digest,)).fetchone()
+            if not row:
+                return
+            if hasattr(conn, 'blobopen'):  # Python 3.11+: lecture incrémentale du BLOB
+                with conn.blobopen('source_blobs', 'content', row['id'], readonly=True) as blob:
+                    while True:
+                        chunk = blob.read(chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+            else:
+                for offset in range(0, row['size'], chunk_size):
+                    yield conn.execute("SELECT substr(content, ?, ?) FROM source_blobs WHERE id = ?",
+                                       (offset + 1, chunk_size, row['id'])).fetchone()[0]
+    
+    def list_revisions(self, name: str) -> Optional[List[Dict]]:
+        """Révisions d'un projet, de la plus récente à la plus ancienne (None si le projet n'existe pas)"""
+        with self.get_connection() as conn:
+            project = conn.execute("SELECT id FROM projects WHERE name = ?", (name,)).fetchone()
+            if not project:
+                return None
+            rows = conn.execute("""
+                SELECT revision, source_digest, snapshot, size, length(data) AS stored_size, created_at
+                FROM project_revisions WHERE project_id = ? ORDER BY revision DESC
+            """, (project['id'],)).fetchall()
+            return [{**dict(row), 'snapshot': bool(row['snapshot'])} for row in rows]
+    
+    def load_revision(self, name: str, revision: int) -> Optional[Tuple[ProjectConfig, str]]:
+        """Reconstruit une révision: dernière révision complète puis ses deltas"""
+        with self.get_connection() as conn:
+            project = conn.execute("SELECT id FROM projects WHERE name = ?", (name,)).fetchone()
+            if not project:
+                return None
+            base = conn.execute("""
+                SELECT MAX(revision) FROM project_revisions
+                WHERE project_id = ? AND revision <= ? AND snapshot = 1
+            """, (project['id'], revision)).fetchone()[0]
+            if base is None:
+                return None
+            rows = conn.execute("""
+                SELECT revision, config, snapshot, data FROM project_revisions
+                WHERE project_id = ? AND revision BETWEEN ? AND ? ORDER BY revision
+            """, (project['id'], base, revision)).fetchall()
+        if rows[-1]['revision'] != revision:
+            return None
+        
+        lines: List[str] = []
+        for row in rows:
+            payload = zlib.decompress(row['data'])
+            if row['snapshot']:
+                lines = payload.decode('utf-8', errors='surrogatepass').splitlines(keepends=True)
+            else:
+                lines = SourceDelta.apply(lines, json.loads(payload))
+        return ProjectConfig(**json.loads(rows[-1]['config'])), ''.join(lines)
+    
+    def list_projects(self, limit: int = PROJECTS_PAGE_SIZE, cursor: Optional[str] = None,
+                      gui_framework: Optional[str] = None,
+                      author: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """Page de projets, du plus récemment modifié au plus ancien
+        
+        Pagination par curseur sur (updated_at, id): chaque page est un parcours
+        d'index, quelle que soit sa position. Ne lit ni la configuration JSON ni
+        le source. Retourne la page et le curseur de la suivante (None à la fin).
+        """
+        query = "SELECT id, name, gui_framework, author, created_at, updated_at FROM projects"
+        conditions, params = [], []
+        if gui_framework:
+            conditions.append("gui_framework = ?")
+            params.append(gui_framework)
+        if author:
+            conditions.append("author = ?")
+            params.append(author)
+        if cursor:
+            conditions.append("(updated_at, id) < (?, ?)")
+            params.extend(self._decode_cursor(cursor))
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY updated_at DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+        
+        with self.get_connection() as conn:
+            rows = [dict(row) for row in conn.execute(query, params)]
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, self._encode_cursor(rows[-1]['updated_at'], rows[-1]['id'])
+    
+    @staticmethod
+    def _encode_cursor(updated_at: str, project_id: int) -> str:
+        return base64.urlsafe_b64encode(json.dumps([updated_at, project_id]).encode()).decode()
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, int]:
+        """Position (updated_at, id) d'un curseur; ValueError s'il est invalide"""
+        try:
+            updated_at, project_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError):
+            raise ValueError("Curseur de pagination invalide")
+        # bool est un int et SQLite refuse (OverflowError) les entiers hors 64 bits
+        if (not isinstance(updated_at, str) or type(project_id) is not int
+                or not -2 ** 63 <= project_id < 2 ** 63):
+            raise ValueError("Curseur de pagination invalide")
+        return updated_at, project_id
+    
+    def delete_project(self, name: str) -> bool:
+        """Supprime un projet, ses révisions et son source s'il n'est partagé avec aucun autre"""
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT id, source_digest FROM projects WHERE name = ?", (name,)).fetchone()
+            cursor = conn.execute("DELETE FROM projects WHERE name = ?", (name,))
+            if row:
+                conn.execute("DELETE FROM project_revisions WHERE project_id = ?", (row['id'],))
+                self._unindex_project(conn, row['id'])
+                self._release_source(conn, row['source_digest'])
+            return cursor.rowcount > 0
+    
+    def get_project_id(self, name: str) -> Optional[int]:
+        """Retourne l'identifiant d'un projet"""
+        with self.get_connection() as conn:
+            row = conn.execute("SELECT id FROM projects WHERE name = ?", (name,)).fetchone()
+            return row['id'] if row else None
+    
+    def add_conversion(self, project_id: Optional[int], status: str,
+                       compressed_log: bytes, output_path: Optional[str] = None,
+                       gui_framework: Optional[str] = None,
+                       metrics: Optional[Dict[str, Any]] = None) -> int:
+        """Enregistre une construction avec son log compressé (zlib) et ses métriques"""
+        metrics = metrics or {}
+        phases = metrics.get('phases')
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                INSERT INTO conversion_history (project_id, status, log_output, output_path,
+                                                gui_framework, duration, phase_timings,
+                                                artifact_size, peak_rss)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (project_id, status, sqlite3.Binary(compressed_log), output_path,
+                  gui_framework, metrics.get('duration'),
+                  json.dumps(phases) if phases else None,
+                  metrics.get('artifact_size'), metrics.get('peak_rss')))
+            return cursor.lastrowid
+    
+    def list_build_metrics(self, limit: int = BUILD_METRICS_WINDOW,
+                           days: Optional[int] = None) -> List[Dict]:
+        """Métriques des constructions réussies les plus récentes"""
+        query = """
+            SELECT gui_framework, duration, phase_timings, artifact_size, peak_rss
+            FROM conversion_history
+            WHERE status = 'succeeded' AND phase_timings IS NOT NULL
+        """
+        params: List[Any] = []
+        if days is not None:
+            query += " AND created_at >= datetime('now', ?)"
+            params.append(f"-{int(days)} days")
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        
+        with self.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+            metrics = []
+            for row in rows:
+                entry = dict(row)
+                entry['phase_timings'] = json.loads(entry['phase_timings'])
+                metrics.append(entry)
+            return metrics
+    
+    def get_conversion_log(self, history_id: int) -> Optional[str]:
+        """Retourne le log décompressé d'une construction"""
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                SELECT log_output FROM conversion_history WHERE id = ?
+            """, (history_id,)).fetchone()
+            
+            if not row or row['log_output'] is None:
+                return None
+            log_output = row['log_output']
+            if isinstance(log_output, bytes):
+                return zlib.decompress(log_output).decode('utf-8', errors='replace')
+            return log_output
+    
+    def get_cached_analysis(self, digest: str, analyzer_version: int) -> Optional[str]:
+        """Retourne une analyse persistée (JSON) et la marque comme récemment utilisée
+        
+        L'accès est noté en mémoire: last_access n'est écrit que par lots de
+        ANALYSIS_CACHE_ACCESS_BATCH, une lecture n'ouvre donc pas de transaction d'écriture.
+        """
+        with self.get_connection() as conn:
+            row = conn.execute("""
+                SELECT result FROM analysis_cache WHERE digest = ? AND analyzer_version = ?
+            """, (digest, analyzer_version)).fetchone()
+            if not row:
+                return None
+            with self._analysis_lock:
+                self._analysis_accesses[(digest, analyzer_version)] = time.time()
+                accesses = None
+                if len(self._analysis_accesses) >= ANALYSIS_CACHE_ACCESS_BATCH:
+                    accesses, self._analysis_accesses = self._analysis_accesses, {}
+            if accesses:
+                self._write_analysis_accesses(conn, accesses)
+            return row['result']
+    
+    def put_cached_analysis(self, digest: str, analyzer_version: int, result: str,
+                            max_entries: int = ANALYSIS_CACHE_DB_ENTRIES,
+                            max_bytes: int = ANALYSIS_CACHE_DB_BYTES):
+        """Persiste une analyse; au-delà des limites, évince les moins récemment utilisées
+        
+        Le nombre d'entrées et la taille totale sont tenus en mémoire; la table
+        n'est parcourue qu'au dépassement, pour revenir à ANALYSIS_CACHE_EVICT_RATIO
+        des limites.
+        """
+        size = len(result.encode('utf-8'))
+        with self.get_connection() as conn:
+            previous = conn.execute("""
+                SELECT size FROM analysis_cache WHERE digest = ? AND analyzer_version = ?
+            """, (digest, analyzer_version)).fetchone()
+            conn.execute("""
+                INSERT OR REPLACE INTO analysis_cache (digest, analyzer_version, result, size, last_access)
+                VALUES (?, ?, ?, ?, ?)
+            """, (digest, analyzer_version, result, size, time.time()))
+            
+            with self._analysis_lock:
+                if previous:
+                    self.analysis_cache_bytes += size - previous['size']
+                else:
+                    self.analysis_cache_entries += 1
+                    self.analysis_cache_bytes += size
+                if self.analysis_cache_entries <= max_entries and self.analysis_cache_bytes <= max_bytes:
+                    return
+                accesses, self._analysis_accesses = self._analysis_accesses, {}
+            
+            # Ordre LRU à jour, puis totaux exacts (la base peut être partagée entre processus)
+            self._write_analysis_accesses(conn, accesses)
+            count, total = conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(size), 0) FROM analysis_cache
+            """).fetchone()
+            target_entries = int(max_entries * ANALYSIS_CACHE_EVICT_RATIO)
+            target_bytes = int(max_bytes * ANALYSIS_CACHE_EVICT_RATIO)
+            evicted = []
+            for row in conn.execute("SELECT rowid, size FROM analysis_cache ORDER BY last_access"):
+                if count <= target_entries and total <= target_bytes:
+                    break
+                evicted.append((row['rowid'],))
+                count -= 1
+                total -= row['size']
+            conn.executemany("DELETE FROM analysis_cache WHERE rowid = ?", evicted)
+            with self._analysis_lock:
+                self.analysis_cache_entries, self.analysis_cache_bytes = count, total
+    
+    @staticmethod
+    def _write_analysis_accesses(conn, accesses: Dict[Tuple[str, int], float]):
+        """Écrit les last_access notés en mémoire"""
+        conn.executemany("""
+            UPDATE analysis_cache SET last_access = ? WHERE digest = ? AND analyzer_version = ?
+        """, [(accessed, digest, version) for (digest, version), accessed in accesses.items()])
+
+    def load_distribution_index(self, fingerprint: str) -> Optional[List[Tuple[str, str, str]]]:
+        """Index module -> distribution persisté, ou None s'il a été construit pour un autre environnement"""
+        with self.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT module, distribution, version FROM distribution_index WHERE fingerprint = ?
+            """, (fingerprint,)).fetchall()
+            return [tuple(row) for row in rows] or None
+    
+    def save_distribution_index(self, fingerprint: str, rows: List[Tuple[str, str, str]]):
+        """Remplace l'index module -> distribution persisté"""
+        with self.get_connection() as conn:
+            conn.execute("DELETE FROM distribution_index")
+            conn.executemany("""
+                INSERT OR IGNORE INTO distribution_index (module, distribution, version, fingerprint)
+                VALUES (?, ?, ?, ?)
+            """, [(module, distribution, version, fingerprint) for module, distribution, version in rows])
+
+class RecordTable:
+    """Suite d'enregistrements (FunctionInfo, VariableInfo...) stockée en colonnes
+    
+    Les entiers sont rangés dans des array, les chaînes internées dans un pool
+    propre à la table (un tuple de chaînes y est joint par \\x1f): quelques
+    octets par enregistrement au lieu d'un objet et de ses tuples. Remplie à la
+    construction puis traitée comme immuable; les enregistrements ne sont
+    matérialisés qu'à l'accès et to_rows() produit directement les dicts JSON.
+    """
+    SEPARATOR = '\x1f'
+    _layouts: Dict[type, Tuple[Tuple[str, str], ...]] = {}
+    
+    def __init__(self, record_type: type, records: Iterable = ()):
+        self.record_type = record_type
+        self.layout = self._layout(record_type)
+        self.columns = {name: array('i' if kind == 'int' else 'I') for name, kind in self.layout}
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        for record in records:
+            self.append(*(getattr(record, name) for name, _ in self.layout))
+    
+    @classmethod
+    def _layout(cls, record_type: type) -> Tuple[Tuple[str, str], ...]:
+        """Type de colonne de chaque champ: int, str, optional (str ou None), strings"""
+        layout = cls._layouts.get(record_type)
+        if layout is None:
+            kinds = {int: 'int', bool: 'int', str: 'str', Optional[str]: 'optional',
+                     Tuple[str, ...]: 'strings'}
+            layout = cls._layouts[record_type] = tuple((f.name, kinds[f.type]) for f in fields(record_type))
+        return layout
+    
+    @classmethod
+    def from_rows(cls, record_type: type, rows: Iterable[Dict[str, Any]]) -> 'RecordTable':
+        """Reconstruit une table depuis sa représentation JSON"""
+        table = cls(record_type)
+        for row in rows:
+            table.append(*(row[name] for name, _ in table.layout))
+        return table
+    
+    @classmethod
+    def concat(cls, record_type: type, tables: Iterable['RecordTable']) -> 'RecordTable':
+        """Concatène des tables en réinternant leurs chaînes"""
+        result = cls(record_type)
+        for table in tables:
+            result.extend(table)
+        return result
+    
+    def _intern(self, text: str) -> int:
+        string_id = self._string_ids.get(text)
+        if string_id is None:
+            string_id = self._string_ids[text] = len(self._strings)
+            self._strings.append(text)
+        return string_id
+    
+    def append(self, *values):
+        """Ajoute un enregistrement (valeurs dans l'ordre des champs)"""
+        for (name, kind), value in zip(self.layout, values):
+            if kind == 'int':
+                encoded = value
+            elif kind == 'str':
+                encoded = self._intern(value)
+            elif kind == 'optional':
+                encoded = 0 if value is None else self._intern(value) + 1
+            else:
+                encoded = self._intern(self.SEPARATOR.join(value))
+            self.columns[name].append(encoded)
+    
+    def extend(self, other: 'RecordTable'):
+        """Ajoute les enregistrements d'une autre table du même type"""
+        remap = [self._intern(text) for text in other._strings]
+        for name, kind in self.layout:
+            column = other.columns[name]
+            if kind == 'int':
+                self.columns[name].extend(column)
+            elif kind == 'optional':
+                self.columns[name].extend(remap[i - 1] + 1 if i else 0 for i in column)
+            else:
+                self.columns[name].extend(remap[i] for i in column)
+    
+    def _decoder(self, kind: str) -> Callable[[int], Any]:
+        strings = self._strings
+        if kind == 'int':
+            return int
+        if kind == 'str':
+            return strings.__getitem__
+        if kind == 'optional':
+            return lambda i: strings[i - 1] if i else None
+        return lambda i: tuple(strings[i].split(self.SEPARATOR)) if strings[i] else ()
+    
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[Any, ...]]:
+        """Valeurs décodées des enregistrements [start:stop], en tuples"""
+        decoders = [self._decoder(kind) for _, kind in self.layout]
+        columns = [self.columns[name][start:stop] for name, _ in self.layout]
+        for raw in zip(*columns):
+            yield tuple(decode(value) for decode, value in zip(decoders, raw))
+    
+    def to_rows(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Représentation JSON des enregistrements [start:stop]"""
+        names = [name for name, _ in self.layout]
+        return [dict(zip(names, row)) for row in self.rows(start, stop)]
+    
+    def column(self, name: str) -> Iterator[Any]:
+        """Valeurs décodées d'un seul champ"""
+        decode = self._decoder(dict(self.layout)[name])
+        return map(decode, self.columns[name])
+    
+    def counts(self, name: str) -> Counter:
+        """Occurrences de chaque valeur d'un champ texte (comptées sur les identifiants internés)"""
+        kind = dict(self.layout)[name]
+        ids = Counter(self.columns[name])
+        if kind == 'optional':
+            ids.pop(0, None)
+            return Counter({self._strings[i - 1]: n for i, n in ids.items()})
+        return Counter({self._strings[i]: n for i, n in ids.items()})
+    
+    def shifted(self, delta: int, names: Tuple[str, ...] = ('line', 'end_line')) -> 'RecordTable':
+        """Copie dont les champs de ligne sont décalés de delta (le pool est partagé)"""
+        table = RecordTable.__new__(RecordTable)
+        table.record_type, table.layout = self.record_type, self.layout
+        table._strings, table._string_ids = self._strings, self._string_ids
+        table.columns = {name: array('i', (v + delta for v in column)) if name in names else column
+                         for name, column in self.columns.items()}
+        return table
+    
+    def __len__(self) -> int:
+        return len(self.columns[self.layout[0][0]])
+    
+    def __iter__(self):
+        for values in self.rows():
+            yield self.record_type(*values)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            return [self.record_type(*values) for values in self.rows(start, stop)][::step]
+        start = range(len(self))[index]
+        return self.record_type(*next(self.rows(start, start + 1)))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RecordTable):
+            return (self.record_type is other.record_type and len(self) == len(other)
+                    and all(a == b for a, b in zip(self.rows(), other.rows())))
+        if isinstance(other, (tuple, list)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash((self.record_type, tuple(self.rows())))
+    
+    def __repr__(self) -> str:
+        return f"RecordTable({self.record_type.__name__}, {len(self)} enregistrements)"
+    
+    def nbytes(self) -> int:
+        """Taille approximative des colonnes et du pool de chaînes"""
+        return (sum(column.itemsize * len(column) for column in self.columns.values())
+                + sum(len(text) for text in self._strings))
+
+@dataclass(frozen=True)
+class FunctionInfo:
+    """Fonction trouvée par l'analyse"""
+    name: str
+    line: int
+    args: Tuple[str, ...]
+    decorators: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class ClassInfo:
+    """Classe trouvée par l'analyse"""
+    name: str
+    line: int
+    bases: Tuple[str, ...]
+    methods: Tuple[str, ...] = ()
+
+@dataclass(frozen=True)
+class VariableInfo:
+    """Variable affectée au niveau d'un nom simple"""
+    name: str
+    line: int
+
+@dataclass(frozen=True)
+class ImportInfo:
+    """Instruction d'import (level > 0 pour un import relatif)"""
+    module: Optional[str]
+    names: Tuple[str, ...]
+    level: int
+    line: int
+
+@dataclass(frozen=True)
+class ScopeMetrics:
+    """Métriques d'une fonction ou d'une classe (une classe totalise ses méthodes)"""
+    name: str  # Nom qualifié (Classe.methode)
+    kind: str  # 'function' ou 'class'
+    line: int
+    end_line: int
+    complexity: int  # Complexité cyclomatique
+    max_nesting: int  # Profondeur maximale de blocs imbriqués
+    max_loop_nesting: int  # Boucles imbriquées (compréhensions comprises)
+    calls_in_loops: int  # Appels exécutés à chaque itération
+
+class AnalysisBudgetExceeded(Exception):
+    """Analyse interrompue: source trop volumineux, trop de nœuds ou trop long"""
+    pass
+
+class AnalysisBudget:
+    """Budget d'une analyse: nœuds visités et échéance"""
+    
+    def __init__(self, max_nodes: int = ANALYSIS_MAX_NODES, seconds: float = ANALYSIS_TIME_BUDGET):
+        self.nodes_left = max_nodes
+        self.deadline = time.perf_counter() + seconds
+    
+    @staticmethod
+    def check_size(source: str):
+        """Refuse un source trop volumineux avant même de le parser"""
+        if len(source) > ANALYSIS_MAX_SOURCE_CHARS:
+            raise AnalysisBudgetExceeded(
+                f"Source trop volumineux pour l'analyse ({len(source)} > {ANALYSIS_MAX_SOURCE_CHARS} caractères)")
+    
+    def spend(self, nodes: int = 0):
+        """Décompte des nœuds visités; lève AnalysisBudgetExceeded hors budget"""
+        self.nodes_left -= nodes
+        if self.nodes_left < 0:
+            raise AnalysisBudgetExceeded("Budget de nœuds de l'analyse dépassé")
+        if time.perf_counter() > self.deadline:
+            raise AnalysisBudgetExceeded("Budget de temps de l'analyse dépassé")
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    """Résultat immuable d'une analyse de code"""
+    imports: Tuple[str, ...]
+    functions: RecordTable  # FunctionInfo
+    classes: RecordTable  # ClassInfo
+    variables: RecordTable  # VariableInfo
+    gui_framework: str
+    complexity: int
+    lines_of_code: int
+    gui_indicators: Tuple[str, ...]
+    import_details: RecordTable = field(default_factory=lambda: RecordTable(ImportInfo))
+    main_guard: bool = False  # Bloc if __name__ == '__main__' au niveau module
+    metrics: RecordTable = field(default_factory=lambda: RecordTable(ScopeMetrics))
+    
+    # Listes détaillées paginées par render()
+    LIST_FIELDS = ('imports', 'functions', 'classes', 'variables', 'import_details', 'metrics',
+                   'gui_indicators')
+    COMPLEXITY_BUCKETS = (1, 5, 10, 20, 50)  # Bornes hautes des tranches des histogrammes
+    LENGTH_BUCKETS = (10, 50, 100, 500)
+    NESTING_BUCKETS = (0, 1, 2, 3, 5)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation JSON complète (cache); l'API passe par render()"""
+        return {f.name: (getattr(self, f.name).to_rows() if isinstance(getattr(self, f.name), RecordTable)
+                         else getattr(self, f.name))
+                for f in fields(self)}
+    
+    def symbol_names(self) -> str:
+        """Noms des fonctions, classes, modules et noms importés, pour l'index de recherche"""
+        names = set(self.functions.counts('name')) | set(self.classes.counts('name')) | set(self.imports)
+        for joined in self.import_details.counts('names'):
+            names.update(filter(None, joined.split(RecordTable.SEPARATOR)))
+        return ' '.join(sorted(names))
+    
+    def hotspots(self, top: int = HOTSPOTS_SHOWN) -> List[ScopeMetrics]:
+        """Fonctions les plus complexes (puis les plus imbriquées)"""
+        metrics = self.metrics
+        complexity, nesting = metrics.columns['complexity'], metrics.columns['max_nesting']
+        lines = metrics.columns['line']
+        candidates = (i for i, kind in enumerate(metrics.column('kind')) if kind == 'function')
+        return [metrics[i] for i in heapq.nsmallest(
+            top, candidates, key=lambda i: (-complexity[i], -nesting[i], lines[i]))]
+    
+    def summary(self, top: int = SUMMARY_TOP_N) -> Dict[str, Any]:
+        """Résumé de taille bornée: effectifs, classements et histogrammes"""
+        metrics = self.metrics
+        functions = [i for i, kind in enumerate(metrics.column('kind')) if kind == 'function']
+        lengths = {i: metrics.columns['end_line'][i] - metrics.columns['line'][i] + 1 for i in functions}
+        longest = heapq.nlargest(top, functions, key=lambda i: (lengths[i], -metrics.columns['line'][i]))
+        modules = Counter()
+        for module, n in self.import_details.counts('module').items():
+            modules[module.split('.')[0]] += n
+        decorators = Counter()
+        for joined, n in self.functions.counts('decorators').items():
+            for name in filter(None, joined.split(RecordTable.SEPARATOR)):
+                decorators[name] += n
+        return {
+            'counts': {name: len(getattr(self, name)) for name in self.LIST_FIELDS},
+            'top': {
+                'complex_functions': [asdict(m) for m in self.hotspots(top)],
+                'long_functions': [{'name': metrics[i].name, 'line': metrics[i].line, 'lines': lengths[i]}
+                                   for i in longest],
+                'frequent_variables': [{'name': name, 'count': n}
+                                       for name, n in self.variables.counts('name').most_common(top)],
+                'imported_modules': [{'module': name, 'count': n} for name, n in modules.most_common(top)],
+                'decorators': [{'name': name, 'count': n} for name, n in decorators.most_common(top)]
+            },
+            'histograms': {
+                'complexity': self._histogram((metrics.columns['complexity'][i] for i in functions),
+                                              self.COMPLEXITY_BUCKETS, 1),
+                'function_lines': self._histogram(lengths.values(), self.LENGTH_BUCKETS, 1),
+                'nesting': self._histogram((metrics.columns['max_nesting'][i] for i in functions),
+                                           self.NESTING_BUCKETS, 0)
+            }
+        }
+    
+    @staticmethod
+    def _histogram(values: Iterable[int], bounds: Tuple[int, ...], low: int) -> List[Dict[str, Any]]:
+        """Effectifs par tranche ('2-5', '51+'...) à partir de low, dans l'ordre des tranches"""
+        counts = [0] * (len(bounds) + 1)
+        for value in values:
+            counts[bisect.bisect_left(bounds, value)] += 1
+        labels = []
+        for bound in bounds:
+            labels.append(str(bound) if low == bound else f"{low}-{bound}")
+            low = bound + 1
+        labels.append(f"{low}+")
+        return [{'range': label, 'count': count} for label, count in zip(labels, counts)]
+    
+    @classmethod
+    def view_params(cls, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Paramètres de render() depuis une requête (view, offset, limit, fields); ValueError si invalides"""
+        view = params.get('view', 'details')
+        if view not in ('summary', 'details'):
+            raise ValueError("Paramètre view invalide (summary ou details)")
+        try:
+            offset = int(params.get('offset', 0))
+            limit = int(params.get('limit', ANALYSIS_PAGE_SIZE))
+        except (TypeError, ValueError):
+            raise ValueError("offset et limit doivent être des entiers")
+        if offset < 0 or not 0 < limit <= ANALYSIS_PAGE_MAX:
+            raise ValueError(f"Pagination invalide (offset >= 0, 0 < limit <= {ANALYSIS_PAGE_MAX})")
+        only = params.get('fields') or None
+        if isinstance(only, str):
+            only = only.split(',')
+        if only is not None:
+            if not isinstance(only, list) or not all(isinstance(name, str) for name in only):
+                raise ValueError("fields doit être une liste de noms (ou une chaîne séparée par des virgules)")
+            only = tuple(only)
+            unknown = set(only) - set(cls.LIST_FIELDS)
+            if unknown:
+                raise ValueError(f"Listes inconnues: {', '.join(sorted(map(str, unknown)))}")
+        return {'view': view, 'offset': offset, 'limit': limit, 'only': only}
+    
+    def render(self, view: str = 'details', offset: int = 0, limit: int = ANALYSIS_PAGE_SIZE,
+               only: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Représentation de taille bornée pour l'API
+        
+        'summary': valeurs globales et résumé seulement. 'details': en plus, une
+        page [offset:offset+limit] de chaque liste (ou des seules listes 'only'),
+        décrite dans 'pages' (total, next_offset).
+        """
+        data = {'gui_framework': self.gui_framework, 'complexity': self.complexity,
+                'lines_of_code': self.lines_of_code, 'main_guard': self.main_guard,
+                'summary': self.summary()}
+        if view == 'details':
+            pages = {}
+            for name in only or self.LIST_FIELDS:
+                values = getattr(self, name)
+                stop = min(offset + limit, len(values))
+                data[name] = (values.to_rows(offset, stop) if isinstance(values, RecordTable)
+                              else list(values[offset:stop]))
+                pages[name] = {'total': len(values), 'offset': offset, 'limit': limit,
+                               'next_offset': stop if stop < len(values) else None}
+            data['pages'] = pages
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AnalysisResult':
+        """Reconstruit un résultat depuis sa représentation JSON"""
+        return cls(
+            imports=tuple(data['imports']),
+            functions=RecordTable.from_rows(FunctionInfo, data['functions']),
+            classes=RecordTable.from_rows(ClassInfo, data['classes']),
+            variables=RecordTable.from_rows(VariableInfo, data['variables']),
+            gui_framework=data['gui_framework'],
+            complexity=data['complexity'],
+            lines_of_code=data['lines_of_code'],
+            gui_indicators=tuple(data['gui_indicators']),
+            import_details=RecordTable.from_rows(ImportInfo, data.get('import_details', ())),
+            main_guard=data.get('main_guard', False),
+            metrics=RecordTable.from_rows(ScopeMetrics, data.get('metrics', ()))
+        )
+
+class AnalysisCache:
+    """Cache des analyses par SHA-256 du source et version de l'analyseur
+    
+    Deux niveaux: un LRU en mémoire (résultats immuables partagés tels quels),
+    puis la table analysis_cache de converter.db qui survit aux redémarrages.
+    Chaque niveau est borné en nombre d'entrées et en octets (taille du JSON).
+    """
+    
+    def __init__(self, db: Optional[DatabaseManager] = None,
+                 max_entries: int = ANALYSIS_CACHE_MEMORY_ENTRIES,
+                 max_bytes: int = ANALYSIS_CACHE_MEMORY_BYTES):
+        self.db = db
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, Tuple[AnalysisResult, int]]" = OrderedDict()
+        self.size = 0
+        self.memory_hits = 0
+        self.database_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def digest(source: str) -> str:
+        """Empreinte SHA-256 d'un code source"""
+        return hashlib.sha256(source.encode('utf-8', errors='surrogatepass')).hexdigest()
+    
+    def get(self, digest: str, analyzer_version: int) -> Optional[AnalysisResult]:
+        """Retourne l'analyse en cache, ou None"""
+        key = f"{analyzer_version}:{digest}"
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry:
+                self.entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry[0]
+        
+        stored = None
+        if self.db:
+            try:
+                stored = self.db.get_cached_analysis(digest, analyzer_version)
+            except sqlite3.Error as e:
+                logger.warning(f"Cache d'analyse persistant indisponible: {e}")
+        
+        with self._lock:
+            if stored is None:
+                self.misses += 1
+                return None
+            self.database_hits += 1
+        result = AnalysisResult.from_dict(json.loads(stored))
+        self._remember(key, result, len(stored.encode('utf-8')))
+        return result
+    
+    def put(self, digest: str, analyzer_version: int, result: AnalysisResult):
+        """Met une analyse en cache (mémoire et base)"""
+        serialized = json.dumps(result.to_dict())
+        self._remember(f"{analyzer_version}:{digest}", result, len(serialized.encode('utf-8')))
+        if self.db:
+            try:
+                self.db.put_cached_analysis(digest, analyzer_version, serialized)
+            except sqlite3.Error as e:
+                logger.warning(f"Impossible de persister l'analyse: {e}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques du cache"""
+        with self._lock:
+            lookups = self.memory_hits + self.database_hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'size': self.size,
+                'max_entries': self.max_entries,
+                'max_size': self.max_bytes,
+                'memory_hits': self.memory_hits,
+                'database_hits': self.database_hits,
+                'misses': self.misses,
+                'hit_rate': (self.memory_hits + self.database_hits) / lookups if lookups else 0.0
+            }
+    
+    def _remember(self, key: str, result: AnalysisResult, size: int):
+        """Ajoute au LRU mémoire en évinçant au-delà des limites"""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self.entries.pop(key, None)
+            if previous:
+                self.size -= previous[1]
+            self.entries[key] = (result, size)
+            self.size += size
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                _, (_, evicted_size) = self.entries.popitem(last=False)
+                self.size -= evicted_size
+
+class DistributionIndex:
+    """Index nom de module importable -> distributions installées (nom, version)
+    
+    Construit une fois depuis importlib.metadata puis persisté dans converter.db
+    avec l'empreinte des entrées de sys.path (un pip install ou uninstall modifie
+    la date de leur répertoire). L'empreinte est revérifiée au plus toutes les
+    check_interval secondes; entre deux vérifications, une recherche est un
+    simple accès dictionnaire.
+    """
+    
+    def __init__(self, db: Optional[DatabaseManager] = None,
+                 check_interval: float = DISTRIBUTION_INDEX_CHECK_INTERVAL):
+        self.db = db
+        self.check_interval = check_interval
+        self.modules: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        self.current_fingerprint: Optional[str] = None
+        self.checked_at = 0.0
+        self.loaded_from: Optional[str] = None
+        self.build_duration: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def fingerprint() -> str:
+        """Empreinte des emplacements d'installation (chemins et dates de modification)"""
+        cwd = os.path.abspath(os.getcwd())
+        digest = hashlib.sha256(sys.prefix.encode())
+        for entry in sys.path:
+            # Le répertoire courant change à chaque écriture de la base: ignoré
+            if not entry or os.path.abspath(entry) == cwd:
+                continue
+            try:
+                digest.update(f"{entry}\0{os.stat(entry).st_mtime_ns}\n".encode())
+            except OSError:
+                continue
+        return digest.hexdigest()
+    
+    def lookup(self, module: str) -> Tuple[Tuple[str, str], ...]:
+        """Distributions (nom, version) fournissant le module de premier niveau"""
+        self._refresh()
+        return self.modules.get(module.split('.')[0], ())
+    
+    def resolve(self, modules) -> Dict[str, Any]:
+        """Classe des modules importés: fournis par une distribution, locaux, ou manquants
+        
+        Seuls les modules d'une distribution installée sont des requirements. Un
+        module importable sans distribution ('local') peut n'être qu'un fichier
+        du serveur lui-même (app, utils... sur son sys.path): il est signalé,
+        jamais ajouté aux requirements ni aux imports cachés.
+        """
+        self._refresh()
+        stdlib = getattr(sys, 'stdlib_module_names', frozenset())
+        requirements, distributions, local, missing = [], {}, [], []
+        for name in dict.fromkeys(module.split('.')[0] for module in modules):
+            if name in stdlib or name in sys.builtin_module_names or name == '__future__':
+                continue
+            found = self.modules.get(name)
+            if found:
+                requirements.append(name)
+                distributions[name] = [list(dist) for dist in found]
+            elif self._importable(name):
+                local.append(name)
+            else:
+                missing.append(name)
+        return {'requirements': requirements, 'distributions': distributions, 'local': local,
+                'missing': missing}
+    
+    def stats(self) -> Dict[str, Any]:
+        """État de l'index"""
+        self._refresh()
+        return {
+            'modules': len(self.modules),
+            'fingerprint': self.current_fingerprint,
+            'loaded_from': self.loaded_from,
+            'build_duration': self.build_duration
+        }
+    
+    @staticmethod
+    def _importable(name: str) -> bool:
+        """Module importable par le serveur hors distribution (chemin local, module vendu...)"""
+        try:
+            return importlib.util.find_spec(name) is not None
+        except (ImportError, ValueError):
+            return False
+    
+    def _refresh(self):
+        """Recharge ou reconstruit l'index si l'environnement a changé"""
+        if self.current_fingerprint and time.monotonic() - self.checked_at < self.check_interval:
+            return
+        
+        with self._lock:
+            fingerprint = self.fingerprint()
+            self.checked_at = time.monotonic()
+            if fingerprint == self.current_fingerprint:
+                return
+            
+            rows = None
+            if self.db:
+                try:
+                    rows = self.db.load_distribution_index(fingerprint)
+                except sqlite3.Error as e:
+                    logger.warning(f"Index des distributions persistant indisponible: {e}")
+            if rows:
+                self.loaded_from = 'database'
+            else:
+                start = time.perf_counter()
+                rows = self._build()
+                self.build_duration = time.perf_counter() - start
+                self.loaded_from = 'metadata'
+                logger.info(f"Index des distributions construit: {len(rows)} modules en {self.build_duration:.2f}s")
+                if self.db:
+                    try:
+                        self.db.save_distribution_index(fingerprint, rows)
+                    except sqlite3.Error as e:
+                        logger.warning(f"Impossible de persister l'index des distributions: {e}")
+            
+            modules: Dict[str, List[Tuple[str, str]]] = {}
+            for module, distribution, version in rows:
+                modules.setdefault(module, []).append((distribution, version))
+            self.modules = {module: tuple(dists) for module, dists in modules.items()}
+            self.current_fingerprint = fingerprint
+    
+    @staticmethod
+    def _build() -> List[Tuple[str, str, str]]:
+        """Parcourt les métadonnées installées: (module, distribution, version)"""
+        versions = {}
+        for dist in importlib.metadata.distributions():
+            name = dist.metadata['Name']
+            if name:
+                versions.setdefault(name, dist.version)
+        return [(module, distribution, versions.get(distribution, ''))
+                for module, distributions in importlib.metadata.packages_distributions().items()
+                for distribution in dict.fromkeys(distributions)
+                if module.isidentifier()]
+
+class CodeAnalyzer:
+    """Analyseur de code Python pour extraire les informations
+    
+    Sans état: chaque appel parcourt l'arbre une seule fois, de façon itérative
+    (pas de limite de récursion), et retourne un AnalysisResult immuable. Une
+    même instance peut donc servir des requêtes concurrentes.
+    """
+    
+    VERSION = 4  # À incrémenter quand le contenu d'AnalysisResult change (invalide le cache)
+    GUI_MODULES = ('tkinter', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'kivy')
+    GUI_FRAMEWORKS = {
+        'tkinter': ['tkinter', 'Tkinter'],
+        'PyQt5': ['PyQt5'],
+        'PyQt6': ['PyQt6'],
+        'PySide2': ['PySide2'],
+        'PySide6': ['PySide6'],
+        'kivy': ['kivy'],
+        'wxPython': ['wx', 'wxPython'],
+        'pygame': ['pygame'],
+        'flask': ['flask'],
+        'django': ['django'],
+        'fastapi': ['fastapi']
+    }
+    # Blocs qui augmentent l'imbrication (Match et TryStar selon la version de Python)
+    NESTING_NODES = tuple(getattr(ast, name) for name in
+                          ('If', 'For', 'AsyncFor', 'While', 'With', 'AsyncWith', 'Try', 'TryStar', 'Match')
+                          if hasattr(ast, name))
+    COMPREHENSION_NODES = (ast.ListComp, ast.SetComp, ast.GeneratorExp, ast.DictComp, ast.comprehension)
+    
+    def __init__(self, cache: Optional[AnalysisCache] = None,
+                 index: Optional[DistributionIndex] = None,
+                 pool: Optional['AnalysisPool'] = None):
+        self.cache = cache
+        self.index = index
+        self.pool = pool
+    
+    def analyze_file(self, file_path: str) -> Optional[AnalysisResult]:
+        """Analyse un fichier Python"""
+        try:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+        except OSError as e:
+            logger.error(f"Erreur lors de l'analyse du fichier {file_path}: {e}")
+            return None
+        
+        return self.analyze_source(content, file_path)
+    
+    def analyze_source(self, source: Union[str, bytes], origin: str = '<source>',
+                       digest: Optional[str] = None) -> Optional[AnalysisResult]:
+        """Analyse un code source en mémoire
+        
+        Les octets sont décodés comme le ferait l'interpréteur (BOM, déclaration
+        d'encodage PEP 263, UTF-8 par défaut). digest, s'il est connu, doit valoir
+        AnalysisCache.digest(source décodé): il évite de rehacher le source.
+        """
+        try:
+            if isinstance(source, bytes):
+                source = self.decode_source(source)
+            return self._analyze(source, digest)
+        except AnalysisBudgetExceeded as e:
+            logger.warning(f"Analyse de {origin} abandonnée: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Erreur lors de l'analyse de {origin}: {e}")
+            return None
+    
+    @classmethod
+    def scan_header_imports(cls, source: str, max_lines: int = HEADER_SCAN_MAX_LINES) -> Tuple[str, ...]:
+        """Imports de l'en-tête du module, par le tokenizer et sans AST
+        
+        Le parcours s'arrête à la première instruction de niveau module qui
+        n'appartient pas à l'en-tête (def, class, appel...). Sont admis: imports,
+        docstring, affectations de dunders et blocs try/if entourant des imports.
+        Les lignes sont lues à la demande: le coût ne dépend pas de la taille du
+        fichier. Le résultat suit la convention d'AnalysisResult.imports.
+        """
+        imports: Dict[str, None] = {}
+        statement: List[tokenize.TokenInfo] = []
+        depth = 0
+        
+        def header_continues(tokens: List[tokenize.TokenInfo]) -> bool:
+            first = tokens[0]
+            if first.type == tokenize.NAME and first.string in ('import', 'from'):
+                cls._record_header_import(tokens, imports)
+                return True
+            if depth:
+                return True  # Corps d'un try/if d'en-tête
+            if first.type == tokenize.STRING:
+                return True
+            if first.type == tokenize.NAME and first.string in ('try', 'except', 'else', 'elif', 'finally', 'if'):
+                return True
+            return first.type == tokenize.NAME and first.string.startswith('__') and first.string.endswith('__')
+        
+        try:
+            for token in tokenize.generate_tokens(cls._line_reader(source)):
+                if token.start[0] > max_lines:
+                    break
+                if token.type == tokenize.INDENT:
+                    depth += 1
+                elif token.type == tokenize.DEDENT:
+                    depth -= 1
+                elif token.type == tokenize.NEWLINE or (token.type == tokenize.OP and token.string == ';'):
+                    # ';' termine aussi une instruction (import os; import tkinter)
+                    if statement and not header_continues(statement):
+                        break
+                    statement = []
+                elif token.type not in (tokenize.COMMENT, tokenize.NL, tokenize.ENCODING):
+                    statement.append(token)
+        except (tokenize.TokenError, IndentationError, SyntaxError):
+            pass  # Source invalide: les imports déjà vus suffisent
+        return tuple(imports)
+    
+    @staticmethod
+    def _record_header_import(tokens: List[tokenize.TokenInfo], imports: Dict[str, None]):
+        """Ajoute les modules d'une instruction import/from (imports absolus)"""
+        words = [token.string for token in tokens]
+        if words[0] == 'from':
+            if len(words) > 1 and words[1] != '.' and not words[1].startswith('.'):
+                module = []
+                for word in words[1:]:
+                    if word == 'import':
+                        break
+                    module.append(word)
+                imports[''.join(module)] = None
+            return
+        
+        # import a.b as c, d
+        name: List[str] = []
+        skip = False
+        for word in words[1:] + [',']:
+            if word == ',':
+                if name:
+                    imports[''.join(name)] = None
+                name, skip = [], False
+            elif word == 'as':
+                skip = True
+            elif not skip:
+                name.append(word)
+    
+    @staticmethod
+    def _line_reader(source: str) -> Callable[[], str]:
+        """readline paresseux sur une chaîne (sans la découper entièrement)"""
+        position = 0
+        
+        def readline() -> str:
+            nonlocal position
+            end = source.find('\n', position)
+            end = len(source) if end < 0 else end + 1
+            line = source[position:end]
+            position = end
+            return line
+        return readline
+    
+    @classmethod
+    def detect_framework_fast(cls, source: str) -> Tuple[str, Tuple[str, ...]]:
+        """Framework GUI et imports d'après le seul en-tête du module"""
+        imports = cls.scan_header_imports(source)
+        return cls._detect_gui_framework(imports), imports
+    
+    def resolve_requirements(self, analysis: AnalysisResult) -> Dict[str, Any]:
+        """Modules tiers importés, avec leur distribution installée ou signalés manquants"""
+        index = self.index or DistributionIndex()
+        return index.resolve(i.module for i in analysis.import_details if not i.level and i.module)
+    
+    @staticmethod
+    def decode_source(data: bytes) -> str:
+        """Décode un source Python selon sa déclaration d'encodage"""
+        return importlib.util.decode_source(data)
+    
+    def cached(self, digest: str) -> Optional[AnalysisResult]:
+        """Analyse en cache pour cette empreinte de source, sans avoir à lire le source"""
+        return self.cache.get(digest, self.VERSION) if self.cache is not None else None
+    
+    def _analyze(self, content: str, digest: Optional[str] = None) -> AnalysisResult:
+        """Analyse un code source, via le cache si disponible"""
+        if self.cache is None:
+            return self._compute(content)
+        
+        digest = digest or AnalysisCache.digest(content)
+        result = self.cache.get(digest, self.VERSION)
+        if result is None:
+            result = self._compute(content)
+            self.cache.put(digest, self.VERSION, result)
+        return result
+    
+    def _compute(self, content: str) -> AnalysisResult:
+        """Analyse hors cache: dans le pool de processus pour les gros sources"""
+        AnalysisBudget.check_size(content)
+        if self.pool is None or len(content) < ANALYSIS_INLINE_CHARS:
+            return self._parse(content)
+        return self.pool.run(_parse_in_worker, content)
+    
+    def analyze_many(self, sources: List[Tuple[Any, str]]) -> Iterator[Tuple[Any, Optional[AnalysisResult], Optional[BaseException]]]:
+        """Analyse plusieurs sources; produit (clé, résultat, erreur) au fil des fins
+        
+        Les résultats en cache sortent d'abord; les autres sont répartis sur le
+        pool (sources identiques analysées une seule fois).
+        """
+        by_digest: Dict[str, List[Any]] = {}
+        contents: Dict[str, str] = {}
+        for key, content in sources:
+            try:
+                AnalysisBudget.check_size(content)
+            except AnalysisBudgetExceeded as e:
+                yield key, None, e
+                continue
+            digest = AnalysisCache.digest(content)
+            cached = self.cache.get(digest, self.VERSION) if self.cache else None
+            if cached is not None:
+                yield key, cached, None
+                continue
+            by_digest.setdefault(digest, []).append(key)
+            contents[digest] = content
+        
+        if self.pool is None:
+            completed = ((digest, *self._safe_parse(contents[digest])) for digest in by_digest)
+        else:
+            completed = self.pool.imap_unordered(
+                _parse_in_worker, [(digest, (contents[digest],)) for digest in by_digest])
+        for digest, result, error in completed:
+            if result is not None and self.cache:
+                self.cache.put(digest, self.VERSION, result)
+            for key in by_digest[digest]:
+                yield key, result, error
+    
+    def _safe_parse(self, content: str) -> Tuple[Optional[AnalysisResult], Optional[BaseException]]:
+        """Analyse en capturant l'erreur"""
+        try:
+            return self._parse(content), None
+        except Exception as e:
+            return None, e
+    
+    def _parse(self, content: str) -> AnalysisResult:
+        """Parcours unique et itératif de l'arbre syntaxique"""
+        AnalysisBudget.check_size(content)
+        budget = AnalysisBudget()
+        tree = ast.parse(content)
+        budget.spend()
+        return replace(self._walk(tree.body, budget), lines_of_code=len(content.splitlines()))
+    
+    def _walk(self, nodes: List[ast.stmt], budget: Optional['AnalysisBudget'] = None) -> AnalysisResult:
+        """Analyse d'une suite d'instructions de niveau module (lines_of_code à 0)
+        
+        Chaque entrée de la pile porte sa portée (fonction ou classe englobante),
+        sa profondeur d'imbrication et son nombre de boucles englobantes: les
+        métriques par portée sont calculées dans ce même parcours.
+        """
+        budget = budget or AnalysisBudget()
+        imports: Dict[str, None] = {}  # Ensemble ordonné
+        functions, classes = RecordTable(FunctionInfo), RecordTable(ClassInfo)
+        variables, import_details = RecordTable(VariableInfo), RecordTable(ImportInfo)
+        gui_indicators = []
+        scopes: List[list] = []  # [nom, type, ligne, fin, complexité, imbrication, boucles, appels, parent]
+        complexity = 1  # Complexité de base
+        visited = 0
+        
+        stack = [(node, None, 0, 0) for node in reversed(nodes)]
+        while stack:
+            node, scope, depth, loops = stack.pop()
+            visited += 1
+            if visited == 4096:
+                budget.spend(visited)
+                visited = 0
+            
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports[alias.name] = None
+                    import_details.append(alias.name, (), 0, node.lineno)
+            
+            elif isinstance(node, ast.ImportFrom):
+                import_details.append(node.module, tuple(a.name for a in node.names),
+                                      node.level, node.lineno)
+                if node.module:
+                    imports[node.module] = None
+                    # Détection d'indicateurs GUI
+                    if node.module in self.GUI_MODULES:
+                        gui_indicators.append(node.module)
+            
+            elif isinstance(node, ast.FunctionDef):
+                functions.append(node.name, node.lineno, tuple(arg.arg for arg in node.args.args),
+                                 tuple(self._expression_name(d) for d in node.decorator_list))
+            
+            elif isinstance(node, ast.ClassDef):
+                classes.append(node.name, node.lineno,
+                               tuple(self._expression_name(base) for base in node.bases), ())
+            
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        variables.append(target.id, node.lineno)
+            
+            # Complexité cyclomatique
+            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor, ast.comprehension,
+                                 ast.ExceptHandler)):
+                complexity += 1
+                if scope:
+                    scope[4] += 1
+            elif isinstance(node, ast.BoolOp):
+                complexity += len(node.values) - 1
+                if scope:
+                    scope[4] += len(node.values) - 1
+            elif isinstance(node, ast.Call) and loops and scope:
+                scope[7] += 1
+            
+            # Enfants empilés à l'envers: parcours en profondeur dans l'ordre du source
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                kind = 'class' if isinstance(node, ast.ClassDef) else 'function'
+                name = f"{scope[0]}.{node.name}" if scope else node.name
+                record = [name, kind, node.lineno, node.end_lineno, 0 if kind == 'class' else 1,
+                          0, 0, 0, scope]
+                scopes.append(record)
+                stack.extend((child, record, 0, 0) for child in reversed(list(ast.iter_child_nodes(node))))
+            elif isinstance(node, self.NESTING_NODES + self.COMPREHENSION_NODES):
+                if scope:
+                    if isinstance(node, self.NESTING_NODES):
+                        scope[5] = max(scope[5], depth + 1)
+                    if isinstance(node, (ast.For, ast.AsyncFor, ast.While, ast.comprehension)):
+                        scope[6] = max(scope[6], loops + 1)
+                stack.extend((child, scope, child_depth, child_loops) for child, child_depth, child_loops
+                             in reversed(self._nested_children(node, depth, loops)))
+            else:
+                stack.extend((child, scope, depth, loops) for child in reversed(list(ast.iter_child_nodes(node))))
+        budget.spend(visited)
+        
+        # Une classe totalise ses méthodes (les portées enfants suivent leur parent)
+        for record in reversed(scopes):
+            parent = record[8]
+            if parent and parent[1] == 'class':
+                parent[4] += record[4]
+                parent[5] = max(parent[5], record[5])
+                parent[6] = max(parent[6], record[6])
+                parent[7] += record[7]
+        
+        metrics = RecordTable(ScopeMetrics)
+        for record in scopes:
+            metrics.append(*record[:8])
+        
+        return AnalysisResult(
+            imports=tuple(imports),
+            functions=functions,
+            classes=classes,
+            variables=variables,
+            gui_framework=self._detect_gui_framework(imports),
+            complexity=complexity,
+            lines_of_code=0,
+            gui_indicators=tuple(gui_indicators),
+            import_details=import_details,
+            main_guard=any(self._is_main_guard(stmt) for stmt in nodes),
+            metrics=metrics
+        )
+    
+    @staticmethod
+    def _nested_children(node: ast.AST, depth: int, loops: int) -> List[Tuple[ast.AST, int, int]]:
+        """Enfants d'un bloc avec leur profondeur et leur nombre de boucles englobantes
+        
+        Seul ce qui est réévalué à chaque itération compte comme dans la boucle
+        (pas l'itérable d'un for); un elif reste au niveau de son if.
+        """
+        inner = depth + 1
+        if isinstance(node, (ast.For, ast.AsyncFor)):
+            return ([(node.target, depth, loops), (node.iter, depth, loops)]
+                    + [(child, inner, loops + 1) for child in node.body]
+                    + [(child, inner, loops) for child in node.orelse])
+        if isinstance(node, ast.While):
+            return ([(node.test, inner, loops + 1)]
+                    + [(child, inner, loops + 1) for child in node.body]
+                    + [(child, inner, loops) for child in node.orelse])
+        if isinstance(node, ast.comprehension):
+            return ([(node.target, depth, loops + 1), (node.iter, depth, loops)]
+                    + [(child, depth, loops + 1) for child in node.ifs])
+        if not isinstance(node, ast.comprehension) and isinstance(node, CodeAnalyzer.COMPREHENSION_NODES):
+            # Chaque générateur est une boucle de plus; l'élément est dans la plus interne
+            generators = len(node.generators)
+            elements = [node.key, node.value] if isinstance(node, ast.DictComp) else [node.elt]
+            return ([(child, depth, loops + generators) for child in elements]
+                    + [(g, depth, loops + i) for i, g in enumerate(node.generators)])
+        if isinstance(node, ast.If):
+            elif_chain = (len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If)
+                          and node.orelse[0].col_offset == node.col_offset)
+            return ([(node.test, depth, loops)]
+                    + [(child, inner, loops) for child in node.body]
+                    + [(child, depth if elif_chain else inner, loops) for child in node.orelse])
+        return [(child, inner, loops) for child in ast.iter_child_nodes(node)]
+    
+    @classmethod
+    def merge(cls, parts: List[AnalysisResult], lines_of_code: int) -> AnalysisResult:
+        """Combine les analyses de suites d'instructions consécutives"""
+        imports = dict.fromkeys(name for part in parts for name in part.imports)
+        return AnalysisResult(
+            imports=tuple(imports),
+            functions=RecordTable.concat(FunctionInfo, (part.functions for part in parts)),
+            classes=RecordTable.concat(ClassInfo, (part.classes for part in parts)),
+            variables=RecordTable.concat(VariableInfo, (part.variables for part in parts)),
+            gui_framework=cls._detect_gui_framework(imports),
+            complexity=1 + sum(part.complexity - 1 for part in parts),
+            lines_of_code=lines_of_code,
+            gui_indicators=tuple(g for part in parts for g in part.gui_indicators),
+            import_details=RecordTable.concat(ImportInfo, (part.import_details for part in parts)),
+            main_guard=any(part.main_guard for part in parts),
+            metrics=RecordTable.concat(ScopeMetrics, (part.metrics for part in parts))
+        )
+    
+    @staticmethod
+    def _is_main_guard(node: ast.stmt) -> bool:
+        """Reconnaît if __name__ == '__main__' (dans un sens ou dans l'autre)"""
+        if not (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)
+                and len(node.test.ops) == 1 and isinstance(node.test.ops[0], ast.Eq)):
+            return False
+        operands = [node.test.left, node.test.comparators[0]]
+        return (any(isinstance(o, ast.Name) and o.id == '__name__' for o in operands)
+                and any(isinstance(o, ast.Constant) and o.value == '__main__' for o in operands))
+    
+    @staticmethod
+    def _expression_name(node: ast.expr) -> str:
+        """Nom lisible d'un décorateur ou d'une classe de base (tronqué à SYMBOL_TEXT_MAX)"""
+        if isinstance(node, ast.Name):
+            return node.id
+        try:
+            text = ast.unparse(node)
+        except (ValueError, RecursionError):
+            return type(node).__name__
+        return text if len(text) <= SYMBOL_TEXT_MAX else text[:SYMBOL_TEXT_MAX - 3] + '...'
+    
+    @staticmethod
+    def collect_imports(source: str) -> set:
+        """Collecte les modules importés (absolus) d'un code source"""
+        imports = set()
+        for node in ast.walk(ast.parse(source)):
+            if isinstance(node, ast.Import):
+                imports.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                imports.add(node.module)
+        return imports
+    
+    @classmethod
+    def _detect_gui_framework(cls, imports) -> str:
+        """Détecte le framework GUI utilisé"""
+        for framework, modules in cls.GUI_FRAMEWORKS.items():
+            if any(module in imports for module in modules):
+                return framework
+        
+        return "console"
+
+class AnalysisTimeout(AnalysisBudgetExceeded):
+    """Analyse abandonnée après ANALYSIS_TASK_TIMEOUT secondes dans un processus du pool"""
+    pass
+
+def _init_analysis_worker(memory_limit: int):
+    """Initialisation d'un processus d'analyse: plafond d'espace d'adressage (POSIX)"""
+    try:
+        import resource
+    except ImportError:
+        return
+    if memory_limit:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            memory_limit = min(memory_limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+
+def _parse_in_worker(content: str) -> AnalysisResult:
+    """Analyse exécutée dans un processus du pool"""
+    try:
+        return CodeAnalyzer()._parse(content)
+    except MemoryError:
+        raise AnalysisBudgetExceeded("Limite mémoire de l'analyse dépassée")
+
+class AnalysisPool:
+    """Pool de processus pour les analyses lourdes, hors du GIL des requêtes
+    
+    Au plus max_workers tâches sont soumises à la fois, de sorte qu'une tâche
+    démarre dès sa soumission et que son délai ne compte pas l'attente. Une
+    tâche qui dépasse son délai ne peut être interrompue seule: le pool est
+    recyclé (processus tués) et les autres tâches alors en cours sont
+    resoumises une fois.
+    """
+    
+    def __init__(self, max_workers: int = ANALYSIS_WORKERS, timeout: float = ANALYSIS_TASK_TIMEOUT,
+                 memory_limit: int = ANALYSIS_WORKER_MEMORY):
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.recycled = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+    
+    def run(self, fn: Callable, *args) -> Any:
+        """Exécute fn(*args) dans le pool et attend son résultat"""
+        with self._slots:
+            for attempt in range(2):
+                executor = self._get_executor()
+                future = executor.submit(fn, *args)
+                try:
+                    return future.result(timeout=self.timeout)
+                except FutureTimeoutError:
+                    self._recycle(executor)
+                    raise AnalysisTimeout(f"Analyse interrompue après {self.timeout:.0f}s")
+                except BrokenProcessPool:
+                    # Pool recyclé pendant la tâche (délai d'une autre tâche, ou processus tué)
+                    self._recycle(executor)
+                    if attempt:
+                        raise AnalysisBudgetExceeded("Processus d'analyse interrompu")
+    
+    def imap_unordered(self, fn: Callable, tasks: List[Tuple[Any, tuple]]) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+        """Exécute fn(*args) pour chaque (clé, args); produit (clé, résultat, erreur) dans l'ordre de fin"""
+        pending = deque((key, args, 0) for key, args in tasks)
+        running: Dict[Any, Tuple[Any, tuple, int, float, ProcessPoolExecutor]] = {}
+        try:
+            while pending or running:
+                executor = self._get_executor()
+                while pending and self._slots.acquire(blocking=not running):
+                    key, args, attempts = pending.popleft()
+                    running[executor.submit(fn, *args)] = (key, args, attempts, time.monotonic(), executor)
+                
+                oldest = min(entry[3] for entry in running.values())
+                done, _ = wait(running, timeout=max(0.0, oldest + self.timeout - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    key, args, attempts, _, owner = running.pop(future)
+                    self._slots.release()
+                    try:
+                        yield key, future.result(), None
+                    except BrokenProcessPool:
+                        self._recycle(owner)
+                        if attempts:
+                            yield key, None, AnalysisBudgetExceeded("Processus d'analyse interrompu")
+                        else:
+                            pending.appendleft((key, args, attempts + 1))
+                    except Exception as e:
+                        yield key, None, e
+                
+                now = time.monotonic()
+                expired = [future for future, entry in running.items() if now - entry[3] >= self.timeout]
+                for future in expired:
+                    key, _, _, _, owner = running.pop(future)
+                    self._slots.release()
+                    self._recycle(owner)
+                    yield key, None, AnalysisTimeout(f"Analyse interrompue après {self.timeout:.0f}s")
+        finally:
+            # Client déconnecté en cours de flux: tâches restantes abandonnées
+            for future in running:
+                future.cancel()
+                self._slots.release()
+    
+    def stats(self) -> Dict[str, Any]:
+        """État du pool"""
+        with self._lock:
+            processes = len(self._executor._processes or {}) if self._executor else 0
+        return {'max_workers': self.max_workers, 'processes': processes, 'timeout': self.timeout,
+                'memory_limit': self.memory_limit, 'recycled': self.recycled}
+    
+    def shutdown(self):
+        """Arrête le pool"""
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: un fork depuis le serveur multi-thread pourrait hériter de verrous pris
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_analysis_worker, initargs=(self.memory_limit,))
+            return self._executor
+    
+    def _recycle(self, executor: ProcessPoolExecutor):
+        """Tue les processus d'un pool et le remplace au prochain appel"""
+        with self._lock:
+            if self._executor is not executor:
+                return  # Déjà recyclé
+            self._executor = None
+            self.recycled += 1
+        logger.warning("Pool d'analyse recyclé (délai dépassé ou processus interrompu)")
+        for process in list((executor._processes or {}).values()):
+            process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+@dataclass
+class _Segment:
+    """Instruction(s) de niveau module: lignes [start, end] et analyse partielle"""
+    start: int
+    end: int
+    fingerprint: str
+    analysis: AnalysisResult
+
+@dataclass
+class _IncrementalSession:
+    """Dernier état analysé d'un projet"""
+    lines: List[str]
+    segments: List[_Segment]
+    result: AnalysisResult
+    version: int = 1
+
+class IncrementalAnalyzer:
+    """Réanalyse incrémentale des sources en cours d'édition, par projet
+    
+    Chaque projet garde ses instructions de niveau module avec une empreinte
+    et leur analyse partielle. Une modification ne réanalyse que les lignes
+    touchées, étendues aux instructions qui les contiennent (plus la précédente,
+    qu'une ligne indentée peut prolonger); si ce fragment ne se parse pas seul,
+    le fichier entier est réanalysé. Le résultat est un diff de l'analyse.
+    """
     
-    @contextmanager
-    def get_connection(self):
-        """Context manager pour les connexions à la base de données"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Erreur base de données: {e}")
-            raise
-        finally:
-            conn.close()
+    DIFF_FIELDS = ('functions', 'classes', 'variables', 'import_details', 'metrics')
     
-    def save_project(self, config: ProjectConfig, source_code: str = "") -> int:
-        """Sauvegarde un projet"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT OR REPLACE INTO projects (name, config, source_code, updated_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            """, (config.name, json.dumps(asdict(config)), source_code))
-            return cursor.lastrowid
+    def __init__(self, analyzer: CodeAnalyzer, max_sessions: int = INCREMENTAL_MAX_SESSIONS):
+        self.analyzer = analyzer
+        self.max_sessions = max_sessions
+        self.sessions: "OrderedDict[str, _IncrementalSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
     
-    def load_project(self, name: str) -> Optional[Tuple[ProjectConfig, str]]:
-        """Charge un projet"""
-        with self.get_connection() as conn:
-            row = conn.execute("""
-                SELECT config, source_code FROM projects WHERE name = ?
-            """, (name,)).fetchone()
+    def update(self, key: str, source: str, version: Optional[int] = None) -> Dict[str, Any]:
+        """Analyse la nouvelle version du source d'un projet
+        
+        Sans session, ou si version ne correspond pas à celle du client, le
+        résultat complet est renvoyé ('full': True); sinon seulement le diff.
+        Lève SyntaxError si le source est invalide, AnalysisBudgetExceeded s'il
+        dépasse le budget d'analyse (la session reste alors inchangée).
+        """
+        AnalysisBudget.check_size(source)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            with self._lock:
+                session = self.sessions.get(key)
+            lines = source.replace('\r\n', '\n').replace('\r', '\n').split('\n')
             
-            if row:
-                config_dict = json.loads(row['config'])
-                config = ProjectConfig(**config_dict)
-                return config, row['source_code']
-            return None
+            if session is None:
+                session = self._full(lines, source)
+                payload = {'full': True, 'reparsed': [1, len(lines)]}
+            else:
+                base = session.version
+                payload = self._incremental(session, lines, source)
+                if version != base:
+                    payload = {'full': True, 'reparsed': payload['reparsed']}
+            if payload['full']:
+                payload['analysis'] = session.result.to_dict()
+            
+            with self._lock:
+                self.sessions[key] = session
+                self.sessions.move_to_end(key)
+                while len(self.sessions) > self.max_sessions:
+                    evicted, _ = self.sessions.popitem(last=False)
+                    self._key_locks.pop(evicted, None)
+            
+            payload.update(version=session.version, segments=len(session.segments))
+            return payload
     
-    def list_projects(self) -> List[Dict]:
-        """Liste tous les projets"""
-        with self.get_connection() as conn:
-            rows = conn.execute("""
-                SELECT name, created_at, updated_at FROM projects 
-                ORDER BY updated_at DESC
-            """).fetchall()
-            return [dict(row) for row in rows]
+    def discard(self, key: str):
+        """Oublie la session d'un projet"""
+        with self._lock:
+            self.sessions.pop(key, None)
+            self._key_locks.pop(key, None)
     
-    def delete_project(self, name: str) -> bool:
-        """Supprime un projet"""
-        with self.get_connection() as conn:
-            cursor = conn.execute("DELETE FROM projects WHERE name = ?", (name,))
-            return cursor.rowcount > 0
+    def _full(self, lines: List[str], source: str) -> _IncrementalSession:
+        """Analyse complète, découpée en segments"""
+        segments = self._segments(lines, 1, len(lines), {}, AnalysisBudget())
+        result = CodeAnalyzer.merge([s.analysis for s in segments], len(source.splitlines()))
+        return _IncrementalSession(lines=lines, segments=segments, result=result)
+    
+    def _incremental(self, session: _IncrementalSession, lines: List[str],
+                     source: str) -> Dict[str, Any]:
+        """Réanalyse la zone modifiée et met la session à jour"""
+        old = session.lines
+        if lines == old:
+            return {'full': False, 'unchanged': True, 'reparsed': None, 'diff': {}}
+        
+        # Lignes communes en tête et en queue
+        prefix = 0
+        limit = min(len(old), len(lines))
+        while prefix < limit and old[prefix] == lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+        delta = len(lines) - len(old)
+        
+        # Segments touchés (numéros de ligne de l'ancien source, base 1)
+        segments = session.segments
+        if segments:
+            first_changed, last_changed = prefix + 1, max(len(old) - suffix, prefix + 1)
+            i = min(bisect.bisect_left([s.end for s in segments], first_changed), len(segments) - 1)
+            j = max(i, bisect.bisect_right([s.start for s in segments], last_changed) - 1)
+            i = max(0, i - 1)
+            start = segments[i].start
+            old_end = segments[j].end if j < len(segments) - 1 else len(old)
+        else:
+            i, j, start, old_end = 0, -1, 1, len(old)
+        new_end = old_end + delta
+        
+        reused = {s.fingerprint: s for s in segments[i:j + 1]}
+        try:
+            region = self._segments(lines, start, new_end, reused, AnalysisBudget())
+        except SyntaxError:
+            # Fragment non autonome (bloc ouvert, chaîne multiligne...): analyse complète
+            updated = self._full(lines, source)
+            diff = self._diff(session.segments, updated.segments, session.result, updated.result, None)
+            session.lines, session.segments, session.result = updated.lines, updated.segments, updated.result
+            session.version += 1
+            return {'full': False, 'reparsed': [1, len(lines)], 'diff': diff}
+        
+        tail = segments[j + 1:]
+        if delta:
+            tail = [_Segment(s.start + delta, s.end + delta, s.fingerprint,
+                             self._shift(s.analysis, delta)) for s in tail]
+        removed = segments[i:j + 1]
+        new_segments = segments[:i] + region + tail
+        result = CodeAnalyzer.merge([s.analysis for s in new_segments], len(source.splitlines()))
+        
+        diff = self._diff(removed, region, session.result, result,
+                          {'after_line': old_end, 'delta': delta} if delta and tail else None)
+        session.lines, session.segments, session.result = lines, new_segments, result
+        session.version += 1
+        return {'full': False, 'reparsed': [start, max(start, new_end)], 'diff': diff}
+    
+    def _segments(self, lines: List[str], start: int, end: int, reused: Dict[str, _Segment],
+                  budget: AnalysisBudget) -> List[_Segment]:
+        """Parse les lignes [start, end] et les découpe en instructions de niveau module
+        
+        Les lignes vides et commentaires précédant une instruction lui sont
+        rattachés, les dernières lignes au dernier segment; les instructions
+        partageant une ligne forment un seul segment.
+        """
+        tree = ast.parse('\n'.join(lines[start - 1:end]))
+        budget.spend()
+        ast.increment_lineno(tree, start - 1)
+        
+        groups: List[Tuple[int, int, List[ast.stmt]]] = []
+        previous_end = start - 1
+        for node in tree.body:
+            first = min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', ())])
+            if groups and first <= groups[-1][1]:
+                groups[-1][2].append(node)
+                groups[-1] = (groups[-1][0], max(groups[-1][1], node.end_lineno), groups[-1][2])
+            else:
+                groups.append((previous_end + 1, node.end_lineno, [node]))
+            previous_end = groups[-1][1]
+        if groups:
+            # Le dernier segment absorbe les lignes finales: les segments couvrent tout le fichier
+            groups[-1] = (groups[-1][0], max(groups[-1][1], end), groups[-1][2])
+        
+        segments = []
+        for seg_start, seg_end, nodes in groups:
+            fingerprint = hashlib.blake2b('\n'.join(lines[seg_start - 1:seg_end]).encode(
+                'utf-8', errors='surrogatepass'), digest_size=16).hexdigest()
+            known = reused.get(fingerprint)
+            if known and known.end - known.start == seg_end - seg_start:
+                analysis = self._shift(known.analysis, seg_start - known.start)
+            else:
+                analysis = self.analyzer._walk(nodes, budget)
+            segments.append(_Segment(seg_start, seg_end, fingerprint, analysis))
+        return segments
+    
+    @staticmethod
+    def _shift(analysis: AnalysisResult, delta: int) -> AnalysisResult:
+        """Décale les numéros de ligne d'une analyse partielle"""
+        if not delta:
+            return analysis
+        return replace(
+            analysis,
+            functions=analysis.functions.shifted(delta),
+            classes=analysis.classes.shifted(delta),
+            variables=analysis.variables.shifted(delta),
+            import_details=analysis.import_details.shifted(delta),
+            metrics=analysis.metrics.shifted(delta)
+        )
+    
+    @classmethod
+    def _diff(cls, removed: List[_Segment], added: List[_Segment], before: AnalysisResult,
+              after: AnalysisResult, shift: Optional[Dict[str, int]]) -> Dict[str, Any]:
+        """Diff entre deux états: symboles retirés/ajoutés, décalage, champs modifiés
+        
+        Appliquer le diff: retirer 'removed', décaler de 'delta' les lignes
+        strictement supérieures à 'after_line', puis ajouter 'added'.
+        """
+        diff: Dict[str, Any] = {}
+        for field in cls.DIFF_FIELDS:
+            old_items = [item for s in removed for item in getattr(s.analysis, field)]
+            new_items = [item for s in added for item in getattr(s.analysis, field)]
+            old_set, new_set = set(old_items), set(new_items)
+            gone = [asdict(item) for item in old_items if item not in new_set]
+            came = [asdict(item) for item in new_items if item not in old_set]
+            if gone or came:
+                diff[field] = {'removed': gone, 'added': came}
+        
+        old_imports, new_imports = set(before.imports), set(after.imports)
+        if old_imports != new_imports:
+            diff['imports'] = {'removed': sorted(old_imports - new_imports),
+                               'added': sorted(new_imports - old_imports)}
+        changed = {field: getattr(after, field)
+                   for field in ('gui_framework', 'complexity', 'lines_of_code',
+                                 'gui_indicators', 'main_guard')
+                   if getattr(after, field) != getattr(before, field)}
+        if changed:
+            diff['changed'] = changed
+        if shift:
+            diff['shift'] = shift
+        return diff
 
-class CodeAnalyzer:
-    """Analyseur de code Python pour extraire les informations"""
+def _analyze_project_module(task: Tuple[str, str, bytes]) -> Dict[str, Any]:
+    """Analyse d'un module de projet, exécutée dans un processus du pool
     
-    def __init__(self):
-        self.imports = set()
-        self.functions = []
-        self.classes = []
-        self.variables = []
-        self.gui_indicators = []
+    Fonction de niveau module pour être sérialisable; ne renvoie qu'un résumé
+    compact afin de limiter les échanges entre processus.
+    """
+    name, path, data = task
+    try:
+        result = CodeAnalyzer()._parse(CodeAnalyzer.decode_source(data))
+    except (SyntaxError, ValueError, UnicodeDecodeError, RecursionError, MemoryError,
+            AnalysisBudgetExceeded) as e:
+        return {'name': name, 'path': path, 'error': f"{type(e).__name__}: {e}"}
+    return {
+        'name': name,
+        'path': path,
+        'imports': [(i.module, i.names, i.level) for i in result.import_details],
+        'main_guard': result.main_guard,
+        'gui_framework': result.gui_framework,
+        'functions': len(result.functions),
+        'classes': len(result.classes),
+        'complexity': result.complexity,
+        'lines_of_code': result.lines_of_code
+    }
+
+def _analyze_project_batch(tasks: List[Tuple[str, str, bytes]]) -> List[Dict[str, Any]]:
+    """Lot de modules analysé dans un processus du pool d'analyse"""
+    return [_analyze_project_module(task) for task in tasks]
+
+class ProjectAnalyzer:
+    """Analyse d'un projet multi-fichiers (archive zip) et graphe des imports
     
-    def analyze_file(self, file_path: str) -> Dict[str, Any]:
-        """Analyse un fichier Python"""
+    Les modules sont répartis par lots sur le pool d'analyse partagé (délai et
+    plafond mémoire par tâche); seul l'assemblage du graphe, linéaire dans le
+    nombre d'imports, reste dans le processus principal. Un répertoire est un
+    package s'il contient __init__.py.
+    """
+    
+    def __init__(self, pool: Optional['AnalysisPool'] = None):
+        self.pool = pool
+    
+    def analyze_zip(self, data: bytes) -> Dict[str, Any]:
+        """Analyse les modules Python d'une archive zip"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
-            self._analyze_node(tree)
-            
-            return {
-                'imports': list(self.imports),
-                'functions': self.functions,
-                'classes': self.classes,
-                'variables': self.variables,
-                'gui_framework': self._detect_gui_framework(),
-                'complexity': self._calculate_complexity(tree),
-                'lines_of_code': len(content.splitlines()),
-                'gui_indicators': self.gui_indicators
-            }
-        except Exception as e:
-            logger.error(f"Erreur lors de l'analyse du fichier {file_path}: {e}")
-            return {}
-    
-    def _analyze_node(self, node):
-        """Analyse récursive des nœuds AST"""
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                self.imports.add(alias.name)
-        
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                self.imports.add(node.module)
-                # Détection d'indicateurs GUI
-                if node.module in ['tkinter', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'kivy']:
-                    self.gui_indicators.append(node.module)
-        
-        elif isinstance(node, ast.FunctionDef):
-            self.functions.append({
-                'name': node.name,
-                'line': node.lineno,
-                'args': [arg.arg for arg in node.args.args],
-                'decorators': [d.id if isinstance(d, ast.Name) else str(d) for d in node.decorator_list]
-            })
+            archive = zipfile.ZipFile(io.BytesIO(data))
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Archive zip invalide: {e}")
         
-        elif isinstance(node, ast.ClassDef):
-            self.classes.append({
-                'name': node.name,
-                'line': node.lineno,
-                'bases': [base.id if isinstance(base, ast.Name) else str(base) for base in node.bases],
-                'methods': []
-            })
+        with archive:
+            members = [info for info in archive.infolist()
+                       if not info.is_dir() and self._is_source_path(info.filename)]
+            if len(members) > PROJECT_MAX_MODULES:
+                raise ValueError(f"Trop de modules ({len(members)} > {PROJECT_MAX_MODULES})")
+            if sum(info.file_size for info in members) > PROJECT_MAX_SOURCE_BYTES:
+                raise ValueError("Sources décompressées trop volumineuses")
+            try:
+                files = {info.filename: archive.read(info) for info in members}
+            except (zipfile.BadZipFile, zlib.error, EOFError, RuntimeError, NotImplementedError) as e:
+                # CRC invalide, membre chiffré ou méthode de compression non supportée
+                raise ValueError(f"Membre d'archive illisible: {e}")
+        
+        return self.analyze_files(files)
+    
+    def analyze_files(self, files: Dict[str, bytes]) -> Dict[str, Any]:
+        """Analyse un ensemble {chemin: contenu} et construit le graphe des imports"""
+        start = time.perf_counter()
+        modules, duplicates = self._module_names(files)
+        tasks = [(name, path, files[path]) for name, (path, _) in modules.items()]
+        records = list(self._map(tasks))
+        graph = self._build_graph(records, {name: is_package for name, (_, is_package) in modules.items()})
+        graph['duplicates'] = duplicates
+        graph['duration'] = time.perf_counter() - start
+        logger.info(f"Projet analysé: {len(records)} modules en {graph['duration']:.2f}s")
+        return graph
+    
+    def _map(self, tasks: List[Tuple[str, str, bytes]]) -> Iterator[Dict[str, Any]]:
+        """Analyse les modules, par lots dans le pool au-delà de ANALYSIS_INLINE_CHARS
+        
+        Un lot interrompu (délai, mémoire, processus tué) donne une erreur pour
+        chacun de ses modules; les autres lots sont conservés.
+        """
+        if self.pool is None or sum(len(task[2]) for task in tasks) < ANALYSIS_INLINE_CHARS:
+            return map(_analyze_project_module, tasks)
         
-        elif isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name):
-                    self.variables.append({
-                        'name': target.id,
-                        'line': node.lineno
-                    })
+        batches: List[List[Tuple[str, str, bytes]]] = [[]]
+        size = 0
+        for task in tasks:
+            if batches[-1] and size + len(task[2]) > PROJECT_BATCH_BYTES:
+                batches.append([])
+                size = 0
+            batches[-1].append(task)
+            size += len(task[2])
         
-        # Récursion sur les nœuds enfants
-        for child in ast.iter_child_nodes(node):
-            self._analyze_node(child)
+        records: List[Optional[List[Dict[str, Any]]]] = [None] * len(batches)
+        for index, result, error in self.pool.imap_unordered(
+                _analyze_project_batch, [(index, (batch,)) for index, batch in enumerate(batches)]):
+            records[index] = result if error is None else [
+                {'name': name, 'path': path, 'error': f"{type(error).__name__}: {error}"}
+                for name, path, _ in batches[index]]
+        return (record for batch in records for record in batch)
     
-    def _detect_gui_framework(self) -> str:
-        """Détecte le framework GUI utilisé"""
-        gui_frameworks = {
-            'tkinter': ['tkinter', 'Tkinter'],
-            'PyQt5': ['PyQt5'],
-            'PyQt6': ['PyQt6'],
-            'PySide2': ['PySide2'],
-            'PySide6': ['PySide6'],
-            'kivy': ['kivy'],
-            'wxPython': ['wx', 'wxPython'],
-            'pygame': ['pygame'],
-            'flask': ['flask'],
-            'django': ['django'],
-            'fastapi': ['fastapi']
-        }
+    @staticmethod
+    def _is_source_path(path: str) -> bool:
+        """Fichier .py à analyser (ni cache, ni répertoire caché, ni chemin suspect)"""
+        parts = path.replace('\\', '/').split('/')
+        return (path.endswith('.py') and '..' not in parts and not path.startswith('/')
+                and not any(part.startswith('.') or part == '__pycache__' for part in parts[:-1]))
+    
+    @staticmethod
+    def _module_names(files: Dict[str, bytes]) -> Tuple[Dict[str, Tuple[str, bool]], List[str]]:
+        """Nom pointé de chaque fichier: {nom: (chemin, est_package)}
         
-        for framework, modules in gui_frameworks.items():
-            if any(module in self.imports for module in modules):
-                return framework
+        La racine d'import d'un fichier est le parent du plus haut répertoire
+        package (avec __init__.py) qui le contient.
+        """
+        paths = {path.replace('\\', '/'): path for path in files}
+        packages = {posixpath.dirname(path) for path in paths if posixpath.basename(path) == '__init__.py'}
         
-        return "console"
+        modules: Dict[str, Tuple[str, bool]] = {}
+        duplicates = []
+        for normalized in sorted(paths):
+            directory, filename = posixpath.split(normalized)
+            parts = [] if filename == '__init__.py' else [filename[:-3]]
+            while directory in packages:
+                directory, package = posixpath.split(directory)
+                parts.insert(0, package)
+            if not parts or not all(part.isidentifier() for part in parts):
+                continue
+            name = '.'.join(parts)
+            if name in modules:
+                duplicates.append(paths[normalized])
+                continue
+            modules[name] = (paths[normalized], filename == '__init__.py')
+        return modules, duplicates
+    
+    @staticmethod
+    def _resolve(name: str, is_package: bool, module: Optional[str], level: int) -> str:
+        """Nom absolu visé par un import ('' s'il remonte au-delà de la racine)"""
+        if not level:
+            return module or ''
+        base = name.split('.') if is_package else name.split('.')[:-1]
+        if level - 1 > len(base):
+            return ''
+        base = base[:len(base) - (level - 1)]
+        return '.'.join(base + ([module] if module else []))
     
-    def _calculate_complexity(self, tree) -> int:
-        """Calcule la complexité cyclomatique"""
-        complexity = 1  # Base complexity
+    @classmethod
+    def _build_graph(cls, records: List[Dict[str, Any]], project: Dict[str, bool]) -> Dict[str, Any]:
+        """Assemble le graphe: arêtes internes, imports tiers et non résolus"""
+        stdlib = getattr(sys, 'stdlib_module_names', frozenset())
+        top_level = {name.split('.')[0] for name in project}
+        modules: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        imported_by: Dict[str, int] = {}
+        third_party_all: Dict[str, None] = {}
+        all_imports: Dict[str, None] = {}
         
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.AsyncFor, ast.comprehension)):
-                complexity += 1
-            elif isinstance(node, ast.ExceptHandler):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
+        for record in records:
+            name = record['name']
+            entry = {'path': record['path'], 'is_package': project[name],
+                     'imports': [], 'third_party': [], 'unresolved': []}
+            modules[name] = entry
+            if 'error' in record:
+                errors[name] = record['error']
+                continue
+            entry.update({key: record[key] for key in
+                          ('main_guard', 'gui_framework', 'functions', 'classes',
+                           'complexity', 'lines_of_code')})
+            
+            internal: Dict[str, None] = {}
+            third_party: Dict[str, None] = {}
+            unresolved: Dict[str, None] = {}
+            for module, names, level in record['imports']:
+                target = cls._resolve(name, project[name], module, level)
+                label = '.' * level + (module or '')
+                if not target:
+                    unresolved[label] = None
+                    continue
+                if not level:
+                    all_imports[target] = None
+                
+                # from package import nom: chaque nom peut être un sous-module
+                submodules = [f"{target}.{n}" for n in names if f"{target}.{n}" in project]
+                root = target.split('.')[0]
+                if target in project or submodules:
+                    if target in project:
+                        internal[target] = None
+                    internal.update(dict.fromkeys(submodules))
+                elif level or root in top_level:
+                    unresolved[label] = None
+                elif root not in stdlib:
+                    third_party[root] = None
+            
+            internal.pop(name, None)
+            entry['imports'] = sorted(internal)
+            entry['third_party'] = sorted(third_party)
+            entry['unresolved'] = sorted(unresolved)
+            third_party_all.update(third_party)
+            for target in internal:
+                imported_by[target] = imported_by.get(target, 0) + 1
+        
+        # Points d'entrée: __main__.py et modules protégés par if __name__ == '__main__'
+        entry_points = sorted(
+            (name for name, entry in modules.items()
+             if name.split('.')[-1] == '__main__' or entry.get('main_guard')),
+            key=lambda n: (n.split('.')[-1] != '__main__', imported_by.get(n, 0), n.count('.'), n)
+        )
+        roots = sorted(name for name in modules if not imported_by.get(name) and name not in errors)
+        for name, entry in modules.items():
+            entry['imported_by'] = imported_by.get(name, 0)
+            entry['is_entry_point'] = name in entry_points
         
-        return complexity
+        return {
+            'modules': modules,
+            'entry_points': entry_points,
+            'roots': roots,
+            'third_party': sorted(third_party_all),
+            'gui_framework': CodeAnalyzer._detect_gui_framework(all_imports),
+            'edges': sum(len(entry['imports']) for entry in modules.values()),
+            'errors': errors
+        }
 
 class TemplateGenerator:
     """Générateur de templates pour différents frameworks GUI"""
-    
+
+    # Sonde de démarrage insérée en tête de chaque wrapper. Inactive tant que la
+    # variable STARTUP_PROBE_ENV n'est pas définie; sinon _startup_probe() écrit
+    # les jalons (horloge murale) dans le fichier indiqué et termine l'application.
+    STARTUP_PROBE_CODE = '''
+import time as _probe_time
+_PROBE_MARKS = {'script_start': _probe_time.time()}
+
+def _startup_probe(mark):
+    """Jalon de démarrage pour le benchmark (sans effet hors benchmark)"""
+    import os
+    probe_file = os.environ.get(__PROBE_ENV__)
+    if not probe_file:
+        return
+    _PROBE_MARKS[mark] = _probe_time.time()
+    import sys
+    import json
+    # Date de création du processus: sous Linux, l'exécutable onefile relance
+    # l'application dans un processus enfant une fois l'archive extraite
+    process_start = None
+    try:
+        with open('/proc/self/stat') as f:
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        process_start = _probe_time.time() - uptime + start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    meipass = getattr(sys, '_MEIPASS', '')
+    with open(probe_file, 'w') as f:
+        json.dump({
+            'marks': _PROBE_MARKS,
+            'final_mark': mark,
+            'process_start': process_start,
+            'gui_framework': __GUI_FRAMEWORK__,
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            'one_file': os.path.basename(meipass).startswith('_MEI'),
+        }, f)
+    os._exit(0)
+'''
+
     def __init__(self):
         self.templates = {
             'tkinter': self._generate_tkinter_template,
@@ -301,25 +2791,34 @@ class TemplateGenerator:
             'console': self._generate_console_template
         }
     
-    def generate_gui_wrapper(self, original_code: str, config: ProjectConfig) -> str:
+    def generate_gui_wrapper(self, original_code: str, config: ProjectConfig,
+                             generated_at: Optional[datetime] = None) -> str:
         """Génère un wrapper GUI pour le code original"""
         framework = config.gui_framework
         if framework in self.templates:
-            return self.templates[framework](original_code, config)
+            return self.templates[framework](original_code, config, generated_at)
         else:
-            return self._generate_tkinter_template(original_code, config)
-    
-    def _generate_tkinter_template(self, original_code: str, config: ProjectConfig) -> str:
+            return self._generate_tkinter_template(original_code, config, generated_at)
+
+    def _startup_probe_code(self, config: ProjectConfig) -> str:
+        """Code de la sonde de démarrage pour un wrapper"""
+        return (self.STARTUP_PROBE_CODE
+                .replace('__PROBE_ENV__', repr(STARTUP_PROBE_ENV))
+                .replace('__GUI_FRAMEWORK__', repr(config.gui_framework)))
+
+    def _generate_tkinter_template(self, original_code: str, config: ProjectConfig,
+                                   generated_at: Optional[datetime] = None) -> str:
         """Template Tkinter"""
+        generated_at = generated_at or datetime.now()
         return f'''#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
 {config.name} - Application de bureau générée automatiquement
-Généré le: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Généré le: {generated_at.strftime("%Y-%m-%d %H:%M:%S")}
 Auteur: {config.author}
 Version: {config.version}
 """
-
+{self._startup_probe_code(config)}
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 import sys
@@ -329,6 +2828,10 @@ import subprocess
 from io import StringIO
 import traceback
 
+_PROBE_MARKS['imports_done'] = _probe_time.time()
+
+original_code = {original_code!r}
+
 class Application(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -357,7 +2860,7 @@ class Application(tk.Tk):
         """Configure l'interface utilisateur"""
         # Frame principal
         main_frame = ttk.Frame(self)
-        main_frame.pack(fill=tk.BOTH, expand=True, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Notebook pour les onglets
         self.notebook = ttk.Notebook(main_frame)
@@ -466,13 +2969,13 @@ Auteur: {config.author}
 Description: {config.description}
 
 Application generee automatiquement
-Date de generation: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Date de generation: {generated_at.strftime("%Y-%m-%d %H:%M:%S")}
 
 Framework GUI: Tkinter
 Architecture: {config.architecture}
 Mode Debug: {"Active" if config.debug_mode else "Desactive"}
 
-(c) {datetime.now().year} - Tous droits reserves
+(c) {generated_at.year} - Tous droits reserves
         """
         
         about_label = tk.Label(self.about_frame, text=about_text, justify=tk.LEFT, 
@@ -726,6 +3229,7 @@ def main():
     """Point d'entrée principal"""
     try:
         app = Application()
+        app.after(0, _startup_probe, 'first_window')
         app.mainloop()
     except Exception as e:
         print(f"Erreur critique: {{e}}")
@@ -737,15 +3241,17 @@ if __name__ == "__main__":
     main()
 '''
     
-    def _generate_pyqt5_template(self, original_code: str, config: ProjectConfig) -> str:
+    def _generate_pyqt5_template(self, original_code: str, config: ProjectConfig,
+                                 generated_at: Optional[datetime] = None) -> str:
         """Template PyQt5"""
+        generated_at = generated_at or datetime.now()
         return f'''#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
 {config.name} - Application PyQt5 générée automatiquement
-Généré le: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Généré le: {generated_at.strftime("%Y-%m-%d %H:%M:%S")}
 """
-
+{self._startup_probe_code(config)}
 import sys
 import os
 from PyQt5.QtWidgets import *
@@ -755,6 +3261,10 @@ import threading
 import traceback
 from io import StringIO
 
+_PROBE_MARKS['imports_done'] = _probe_time.time()
+
+original_code = {original_code!r}
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -902,25 +3412,29 @@ def main():
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    QTimer.singleShot(0, lambda: _startup_probe('first_window'))
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
     main()
 '''
     
-    def _generate_pyqt6_template(self, original_code: str, config: ProjectConfig) -> str:
+    def _generate_pyqt6_template(self, original_code: str, config: ProjectConfig,
+                                 generated_at: Optional[datetime] = None) -> str:
         """Template PyQt6 (similaire à PyQt5 avec adaptations)"""
-        return self._generate_pyqt5_template(original_code, config).replace("PyQt5", "PyQt6")
+        return self._generate_pyqt5_template(original_code, config, generated_at).replace("PyQt5", "PyQt6")
     
-    def _generate_flask_template(self, original_code: str, config: ProjectConfig) -> str:
+    def _generate_flask_template(self, original_code: str, config: ProjectConfig,
+                                 generated_at: Optional[datetime] = None) -> str:
         """Template Flask pour applications web"""
+        generated_at = generated_at or datetime.now()
         return f'''#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
 {config.name} - Application Flask générée automatiquement
-Généré le: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Généré le: {generated_at.strftime("%Y-%m-%d %H:%M:%S")}
 """
-
+{self._startup_probe_code(config)}
 from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
 import os
 import sys
@@ -929,6 +3443,8 @@ from io import StringIO
 import threading
 import subprocess
 
+_PROBE_MARKS['imports_done'] = _probe_time.time()
+
 app = Flask(__name__)
 app.secret_key = '{hashlib.md5(config.name.encode()).hexdigest()}'
 
@@ -1001,6 +3517,7 @@ def about():
                          description="{config.description}")
 
 if __name__ == '__main__':
+    _startup_probe('main')
     print(f"Démarrage de {{'{config.name}'}} sur http://localhost:5000")
     print("Appuyez sur Ctrl+C pour arrêter le serveur")
     
@@ -1009,21 +3526,25 @@ if __name__ == '__main__':
             port=5000)
 '''
     
-    def _generate_console_template(self, original_code: str, config: ProjectConfig) -> str:
+    def _generate_console_template(self, original_code: str, config: ProjectConfig,
+                                   generated_at: Optional[datetime] = None) -> str:
         """Template pour applications console avec interface texte"""
+        generated_at = generated_at or datetime.now()
         return f'''#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
 {config.name} - Application console générée automatiquement
-Généré le: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Généré le: {generated_at.strftime("%Y-%m-%d %H:%M:%S")}
 """
-
+{self._startup_probe_code(config)}
 import sys
 import os
 import traceback
 import subprocess
 from datetime import datetime
 
+_PROBE_MARKS['imports_done'] = _probe_time.time()
+
 class ConsoleApp:
     def __init__(self):
         self.app_name = "{config.name}"
@@ -1057,7 +3578,7 @@ class ConsoleApp:
         
         try:
             # Code original intégré
-            original_code = "{original_code}"
+            original_code = {original_code!r}
             
             # Exécution
             exec(compile(original_code, '<string>', 'exec'))
@@ -1077,7 +3598,7 @@ class ConsoleApp:
         print("\\n=== CODE SOURCE ===")
         print("-" * 40)
         
-        original_code = "{original_code}"
+        original_code = {original_code!r}
         
         lines = original_code.split('\\n')
         for i, line in enumerate(lines, 1):
@@ -1178,6 +3699,7 @@ class ConsoleApp:
 
 def main():
     """Point d'entrée principal"""
+    _startup_probe('main')
     app = ConsoleApp()
     app.run()
 
@@ -1185,22 +3707,584 @@ if __name__ == "__main__":
     main()
 '''
 
+class BuildPhaseTimer:
+    """Mesure la durée des phases PyInstaller à partir des lignes de son log
+    
+    Une phase commence à la ligne "checking <phase>" et dure jusqu'à la suivante;
+    "startup" couvre le démarrage de PyInstaller. UPX s'exécute pendant PKG ou
+    COLLECT: sa durée est comptée à part, en plus de celle de la phase parente.
+    """
+    
+    PHASES = ('Analysis', 'PYZ', 'PKG', 'EXE', 'COLLECT')
+    LOG_PREFIX_PATTERN = re.compile(r'^\d+ (?:DEBUG|INFO|WARNING|ERROR|CRITICAL): ')
+    PHASE_PATTERN = re.compile(r'^checking (Analysis|PYZ|PKG|EXE|COLLECT)$')
+    UPX_PATTERN = re.compile(r'^Executing: \S*upx\b')
+    
+    def __init__(self):
+        self.started = time.monotonic()
+        self.durations: Dict[str, float] = {}
+        self._phase = 'startup'
+        self._phase_start = self.started
+        self._upx_start: Optional[float] = None
+    
+    def feed(self, line: str):
+        """Traite une ligne au moment de sa réception"""
+        now = time.monotonic()
+        message = self.LOG_PREFIX_PATTERN.sub('', line, count=1)
+        self._close_upx(now)
+        
+        match = self.PHASE_PATTERN.match(message)
+        if match:
+            self._close_phase(now)
+            self._phase = match.group(1)
+            self._phase_start = now
+        elif self.UPX_PATTERN.match(message):
+            self._upx_start = now
+    
+    def finish(self) -> Dict[str, float]:
+        """Clôt la phase en cours et retourne les durées en secondes"""
+        now = time.monotonic()
+        self._close_upx(now)
+        self._close_phase(now)
+        return {phase: round(duration, 3) for phase, duration in self.durations.items()}
+    
+    def _close_phase(self, now: float):
+        self.durations[self._phase] = self.durations.get(self._phase, 0.0) + now - self._phase_start
+        self._phase_start = now
+    
+    def _close_upx(self, now: float):
+        if self._upx_start is not None:
+            self.durations['UPX'] = self.durations.get('UPX', 0.0) + now - self._upx_start
+            self._upx_start = None
+
+class ExcludeResolver:
+    """Calcule les modules à exclure du bundle à partir du graphe d'imports
+    
+    Sont candidats les modules lourds de la bibliothèque standard réservés au
+    développement et les toolkits GUI autres que celui du wrapper. Un candidat
+    est conservé dès que le code source, le wrapper ou les requirements
+    l'importent (lui, un parent ou un sous-module), ou qu'un build précédent
+    du projet a montré qu'une dépendance l'importe (voir report()).
+    """
+    
+    STDLIB_HEAVYWEIGHTS = ('unittest', 'doctest', 'pydoc', 'pydoc_data', 'test', 'lib2to3',
+                           'idlelib', 'turtledemo', 'ensurepip', 'venv')
+    GUI_TOOLKITS = ('tkinter', '_tkinter', 'turtle', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6',
+                    'wx', 'kivy')
+    # Candidats importés indirectement par un module utilisé
+    MODULE_DEPENDENCIES = {
+        'tkinter': ('_tkinter',),
+        'turtle': ('tkinter', '_tkinter'),
+        'flask': ('pydoc',),  # werkzeug.debug.repr importe pydoc
+        'werkzeug': ('pydoc',)
+    }
+    WARN_EXCLUDED_PATTERN = re.compile(r'^excluded module named (\S+) - imported by (.*)$')
+    WARN_IMPORTER_PATTERN = re.compile(r'([\w.]+) \([^)]*\)')
+    
+    # Exclusions retirées après un build, par projet (durée de vie du processus)
+    _required: Dict[str, set] = {}
+    _required_lock = threading.Lock()
+    
+    @classmethod
+    def resolve(cls, source_code: str, wrapper_code: str, config: ProjectConfig) -> List[str]:
+        """Retourne la liste des modules à exclure (vide si le code est illisible)"""
+        try:
+            used = CodeAnalyzer.collect_imports(source_code) | CodeAnalyzer.collect_imports(wrapper_code)
+        except SyntaxError:
+            return []
+        used.update(config.requirements)
+        for name in list(used):
+            used.update(cls.MODULE_DEPENDENCIES.get(name.split('.')[0], ()))
+        with cls._required_lock:
+            used.update(cls._required.get(config.name, ()))
+        
+        return [module for module in cls.STDLIB_HEAVYWEIGHTS + cls.GUI_TOOLKITS
+                if not any(cls._related(module, name) for name in used)]
+    
+    @classmethod
+    def report(cls, excludes: List[str], warn_file: str) -> Dict[str, Any]:
+        """Rapport des exclusions effectives d'après le fichier warn-*.txt de PyInstaller
+        
+        Seuls les modules exclus que le graphe d'imports référençait réellement sont
+        comptés; leur taille sur disque donne une estimation basse des octets
+        économisés (leurs propres dépendances, abandonnées aussi, ne sont pas comptées).
+        'required' liste les exclusions importées par un module embarqué (une
+        dépendance tierce, par exemple): l'exécutable échouerait à l'exécution.
+        """
+        referenced, required = set(), set()
+        try:
+            with open(warn_file, 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    match = cls.WARN_EXCLUDED_PATTERN.match(line.strip())
+                    if not match:
+                        continue
+                    modules = {module for module in excludes if cls._related(module, match.group(1))}
+                    referenced.update(modules)
+                    importers = cls.WARN_IMPORTER_PATTERN.findall(match.group(2))
+                    if any(not any(cls._related(module, importer) for module in excludes)
+                           for importer in importers):
+                        required.update(modules)
+        except OSError:
+            pass
+        
+        saved = {module: cls._module_size(module) for module in sorted(referenced - required)}
+        return {
+            'excludes': excludes,
+            'referenced': saved,
+            'required': sorted(required),
+            'estimated_bytes_saved': sum(saved.values())
+        }
+    
+    @classmethod
+    def remember(cls, project_name: str, modules: Iterable[str]):
+        """Ne plus exclure ces modules pour les prochains builds du projet"""
+        with cls._required_lock:
+            cls._required.setdefault(project_name, set()).update(modules)
+    
+    @staticmethod
+    def _related(module: str, name: str) -> bool:
+        """Vrai si name désigne module, un de ses sous-modules ou un de ses parents"""
+        return (name == module or name.startswith(module + '.')
+                or module.startswith(name + '.'))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _module_size(module: str) -> int:
+        """Taille sur disque d'un module ou d'un package installé"""
+        try:
+            spec = importlib.util.find_spec(module)
+        except (ImportError, ValueError):
+            return 0
+        if spec is None:
+            return 0
+        if spec.submodule_search_locations:
+            return sum(_path_size(location) for location in spec.submodule_search_locations)
+        if spec.origin and os.path.isfile(spec.origin):
+            return os.path.getsize(spec.origin)
+        return 0
+
+BUILDER_WORKER_SENTINEL = '__PYAPP_BUILDER__'
+
+# Script des workers pré-chargés: PyInstaller est importé une seule fois, puis
+# chaque requête JSON lue sur stdin est exécutée par PyInstaller.__main__.run.
+# La fin d'une construction est signalée par "<sentinelle> <code> <pic RSS>".
+BUILDER_WORKER_CODE = '''
+import json
+import os
+import sys
+import traceback
+
+import PyInstaller.__main__
+import PyInstaller.building.build_main
+import PyInstaller.configure
+
+SENTINEL = "__PYAPP_BUILDER__"
+configs = {}
+
+def reset_peak_rss():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+def peak_rss():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return 0
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+print(SENTINEL, "ready", flush=True)
+
+for request in sys.stdin:
+    job = json.loads(request)
+    args = job["args"]
+    upx_dir = args[args.index("--upx-dir") + 1] if "--upx-dir" in args else None
+    if upx_dir not in configs:
+        configs[upx_dir] = PyInstaller.configure.get_config(upx_dir=upx_dir)
+    
+    reset_peak_rss()
+    os.chdir(job["cwd"])
+    code = 0
+    try:
+        PyInstaller.__main__.run(args, dict(configs[upx_dir]))
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    
+    sys.stderr.flush()
+    print(SENTINEL, code, peak_rss(), flush=True)
+'''
+
+class BuilderWorker:
+    """Processus PyInstaller pré-chargé, réutilisé pour plusieurs constructions"""
+    
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, '-u', '-c', BUILDER_WORKER_CODE],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True
+        )
+        self.ready = False
+        self.builds = 0
+        self.result: Optional[Tuple[int, Optional[int]]] = None
+    
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+    
+    def wait_ready(self) -> bool:
+        """Attend la fin du pré-chargement de PyInstaller"""
+        if self.ready:
+            return self.alive
+        for line in iter(self.process.stdout.readline, ''):
+            if line.split() == [BUILDER_WORKER_SENTINEL, 'ready']:
+                self.ready = True
+                return True
+            logger.warning(f"Worker PyInstaller: {line.strip()}")
+        return False
+    
+    def run(self, args: List[str], cwd: str) -> Iterator[str]:
+        """Lance une construction et produit les lignes de sortie jusqu'à sa fin
+        
+        Le code de sortie et le pic de RSS sont ensuite disponibles dans result.
+        """
+        self.builds += 1
+        self.result = None
+        try:
+            self.process.stdin.write(json.dumps({'args': args, 'cwd': cwd}) + '\n')
+            self.process.stdin.flush()
+        except OSError:
+            self.result = (self.process.wait(), None)
+            return
+        
+        for line in iter(self.process.stdout.readline, ''):
+            if line.startswith(BUILDER_WORKER_SENTINEL):
+                _, code, peak_rss = line.split()
+                self.result = (int(code), int(peak_rss) or None)
+                return
+            yield line
+        
+        # Fin de flux: worker arrêté (annulation) ou planté
+        self.result = (self.process.wait(), None)
+    
+    def stop(self):
+        """Arrête le worker"""
+        if self.alive:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+class BuilderWorkerPool:
+    """Pool de workers PyInstaller pré-chargés, recyclés après max_builds constructions
+    
+    Les workers sont lancés à la première construction (pas au démarrage du
+    serveur, exécuté deux fois par le reloader en mode debug). Après un échec
+    de démarrage, les constructions passent en sous-processus pendant un délai
+    doublé à chaque échec, puis un nouveau worker est tenté.
+    """
+    
+    def __init__(self, size: int = BUILD_WORKERS, max_builds: int = BUILDER_WORKER_MAX_BUILDS):
+        self.size = max(1, size)
+        self.max_builds = max_builds
+        self._idle: List[BuilderWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._failures = 0
+        self._retry_at = 0.0
+    
+    def acquire(self) -> Optional[BuilderWorker]:
+        """Retourne un worker prêt, ou None si PyInstaller ne peut pas être pré-chargé"""
+        with self._lock:
+            if self._closed or time.monotonic() < self._retry_at:
+                return None
+            worker = self._idle.pop() if self._idle else None
+        
+        if worker is None:
+            worker = BuilderWorker()
+        if worker.wait_ready():
+            with self._lock:
+                self._failures = 0
+            return worker
+        
+        worker.stop()
+        with self._lock:
+            self._failures += 1
+            delay = min(BUILDER_WORKER_RETRY_MAX, BUILDER_WORKER_RETRY_DELAY * 2 ** (self._failures - 1))
+            self._retry_at = time.monotonic() + delay
+        logger.warning(f"Worker PyInstaller indisponible, lancement en sous-processus pendant {delay:g}s")
+        return None
+    
+    def release(self, worker: BuilderWorker):
+        """Rend un worker au pool, en le remplaçant s'il est mort ou usé"""
+        if not worker.alive or worker.builds >= self.max_builds:
+            worker.stop()
+            worker = BuilderWorker()
+        
+        with self._lock:
+            if not self._closed and len(self._idle) < self.size:
+                self._idle.append(worker)
+                return
+        worker.stop()
+    
+    def shutdown(self):
+        """Arrête tous les workers inactifs"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+# Lanceur des exécutables onefile à extraction persistante. L'application (build
+# onedir zippé) est rangée dans l'archive PyInstaller du lanceur sous un type que
+# le bootloader n'extrait pas. Au premier lancement d'un build, le lanceur la
+# vérifie (SHA-256), l'extrait dans le cache utilisateur sous un répertoire propre
+# au build et supprime les extractions des builds précédents; ensuite il se
+# contente de contrôler l'extraction et d'exécuter l'application.
+LAUNCHER_CODE = '''
+import os
+import sys
+import shutil
+import struct
+import hashlib
+import zipfile
+
+APP_NAME = __APP_NAME__
+APP_EXECUTABLE = __APP_EXECUTABLE__
+BUILD_HASH = __BUILD_HASH__
+PAYLOAD_NAME = __PAYLOAD_NAME__
+COOKIE_MAGIC = bytes([77, 69, 73, 12, 11, 10, 11, 14])
+COOKIE_FORMAT = "!8sIIII64s"
+TOC_ENTRY_FORMAT = "!IIIIBc"
+MARKER = ".pyapp-extraction"
+
+def cache_root():
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "pyapp", APP_NAME)
+
+def find_payload(executable):
+    with open(executable, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 65536))
+        tail = f.read()
+        position = tail.rfind(COOKIE_MAGIC)
+        if position < 0:
+            raise RuntimeError("archive du lanceur introuvable")
+        cookie_offset = size - len(tail) + position
+        f.seek(cookie_offset)
+        cookie = f.read(struct.calcsize(COOKIE_FORMAT))
+        _, pkg_length, toc_offset, toc_length, _, _ = struct.unpack(COOKIE_FORMAT, cookie)
+        pkg_start = cookie_offset + len(cookie) - pkg_length
+        f.seek(pkg_start + toc_offset)
+        toc = f.read(toc_length)
+
+    header_size = struct.calcsize(TOC_ENTRY_FORMAT)
+    position = 0
+    while position < len(toc):
+        entry_length, offset, length, _, _, _ = struct.unpack(
+            TOC_ENTRY_FORMAT, toc[position:position + header_size])
+        name = toc[position + header_size:position + entry_length].rstrip(b"\\0").decode("utf-8")
+        if name == PAYLOAD_NAME:
+            return pkg_start + offset, length
+        position += entry_length
+    raise RuntimeError("application absente du lanceur")
+
+def is_valid(target):
+    try:
+        with open(os.path.join(target, MARKER), "r", encoding="utf-8") as f:
+            build_hash, *entries = f.read().splitlines()
+        if build_hash != BUILD_HASH:
+            return False
+        for entry in entries:
+            size, name = entry.split(" ", 1)
+            if os.path.getsize(os.path.join(target, name)) != int(size):
+                return False
+        return True
+    except (OSError, ValueError):
+        return False
+
+def extract(executable, target):
+    offset, length = find_payload(executable)
+    staging = f"{target}.{os.getpid()}.tmp"
+    os.makedirs(staging)
+    archive_path = os.path.join(staging, PAYLOAD_NAME)
+
+    digest = hashlib.sha256()
+    with open(executable, "rb") as src, open(archive_path, "wb") as dst:
+        src.seek(offset)
+        remaining = length
+        while remaining:
+            chunk = src.read(min(remaining, 1 << 20))
+            if not chunk:
+                raise RuntimeError("application tronquée")
+            digest.update(chunk)
+            dst.write(chunk)
+            remaining -= len(chunk)
+    if digest.hexdigest() != BUILD_HASH:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise RuntimeError("somme de contrôle de l'application invalide")
+
+    entries = [BUILD_HASH]
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            path = archive.extract(info, staging)
+            mode = (info.external_attr >> 16) & 0o777
+            if mode:
+                os.chmod(path, mode)
+            if not info.is_dir():
+                entries.append(f"{info.file_size} {info.filename}")
+    os.remove(archive_path)
+
+    with open(os.path.join(staging, MARKER), "w", encoding="utf-8") as f:
+        f.write("\\n".join(entries))
+    try:
+        os.rename(staging, target)
+    except OSError:
+        # Extraction concurrente terminée avant celle-ci
+        shutil.rmtree(staging, ignore_errors=True)
+        if not is_valid(target):
+            raise
+
+def remove_stale(root, keep):
+    for name in os.listdir(root):
+        if not name.startswith(keep):
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+def main():
+    root = cache_root()
+    target = os.path.join(root, BUILD_HASH[:16])
+    if not is_valid(target):
+        shutil.rmtree(target, ignore_errors=True)
+        os.makedirs(root, exist_ok=True)
+        extract(sys.executable, target)
+    remove_stale(root, os.path.basename(target))
+
+    # L'application est elle-même gelée par PyInstaller: elle ne doit pas
+    # hériter de l'environnement du bootloader du lanceur
+    env = dict(os.environ)
+    env["PYINSTALLER_RESET_ENVIRONMENT"] = "1"
+    if "LD_LIBRARY_PATH_ORIG" in env:
+        env["LD_LIBRARY_PATH"] = env.pop("LD_LIBRARY_PATH_ORIG")
+
+    app = os.path.join(target, APP_EXECUTABLE)
+    if os.name == "nt":
+        import subprocess
+        sys.exit(subprocess.call([app] + sys.argv[1:], env=env))
+    os.execve(app, [app] + sys.argv[1:], env)
+
+try:
+    main()
+except Exception as e:
+    print(f"{APP_NAME}: démarrage impossible: {e}", file=sys.stderr)
+    sys.exit(1)
+'''
+
+# Le lanceur n'embarque que le strict nécessaire à l'extraction
+LAUNCHER_EXCLUDES = ['_hashlib', 'ssl', '_ssl', 'bz2', '_bz2', 'lzma', '_lzma', 'tkinter', '_tkinter',
+                     'unittest', 'pydoc', 'doctest', 'decimal', '_decimal', 'datetime', '_datetime',
+                     'pickle', '_pickle', 'socket', '_socket', 'unicodedata', 'email', 'http',
+                     'xml', 'json', 'csv', 'logging', 'asyncio', 'multiprocessing']
+
 class PyInstallerBuilder:
     """Constructeur d'exécutables avec PyInstaller"""
     
-    def __init__(self):
+    def __init__(self, worker_pool: Optional[BuilderWorkerPool] = None):
         self.temp_dir = None
         self.build_process = None
+        self.worker_pool = worker_pool
+        self.worker: Optional[BuilderWorker] = None
+        self.cancelled = False
+        self.metrics: Dict[str, Any] = {}
+        self.exclude_report: Optional[Dict[str, Any]] = None
     
     def build_executable(self, source_file: str, config: ProjectConfig, 
-                        output_dir: str = None) -> Tuple[bool, str]:
-        """Construit un exécutable à partir du code source"""
+                        output_dir: str = None, clean: bool = False,
+                        on_output: Optional[Callable[[str], None]] = None,
+                        excludes: Optional[List[str]] = None,
+                        payload: Optional[str] = None) -> Tuple[bool, str]:
+        """Construit un exécutable à partir du code source
+        
+        En mode incrémental, le répertoire de travail du projet est conservé entre
+        les builds pour que PyInstaller réutilise ses sorties (Analysis, PYZ...).
+        clean=True repart de zéro. on_output reçoit chaque ligne de PyInstaller
+        dès qu'elle est lue. excludes liste les modules à ne pas embarquer.
+        payload est une archive rangée telle quelle, sans extraction, dans
+        l'exécutable (lanceur à extraction persistante).
+        """
+        if config.one_file and config.extraction_cache:
+            return self._build_with_extraction_cache(source_file, config, output_dir,
+                                                     clean, on_output, excludes)
+        
+        success, result = self._run_build(source_file, config, output_dir, clean, on_output,
+                                          excludes, payload)
+        # Exclusions importées par un module embarqué: retirées puis reconstruction
+        # (le lanceur à extraction persistante exclut volontairement ses modules)
+        restored: List[str] = []
+        while (success and payload is None and not self.cancelled
+               and self.exclude_report and self.exclude_report['required']):
+            required = self.exclude_report['required']
+            restored.extend(required)
+            ExcludeResolver.remember(config.name, required)
+            message = f"Exclusions retirées (importées par une dépendance): {', '.join(required)}"
+            logger.info(message)
+            if on_output:
+                on_output(message)
+            
+            excludes = [module for module in excludes if module not in required]
+            previous_duration = self.metrics['duration']
+            success, result = self._run_build(source_file, config, output_dir, False, on_output,
+                                              excludes, payload)
+            if self.metrics.get('duration') is not None:
+                self.metrics['duration'] = round(self.metrics['duration'] + previous_duration, 3)
+        if restored:
+            self.exclude_report = dict(self.exclude_report or ExcludeResolver.report(excludes, ''),
+                                       restored=restored)
+        return success, result
+    
+    def _run_build(self, source_file: str, config: ProjectConfig, output_dir: Optional[str],
+                   clean: bool, on_output: Optional[Callable[[str], None]],
+                   excludes: Optional[List[str]], payload: Optional[str]) -> Tuple[bool, str]:
+        """Une exécution de PyInstaller (voir build_executable)"""
+        self.metrics, self.exclude_report = {}, None
         try:
             if output_dir is None:
                 output_dir = OUTPUT_FOLDER
+            # PyInstaller s'exécute dans le répertoire temporaire
+            output_dir = os.path.abspath(output_dir)
             
-            # Création du répertoire temporaire
-            self.temp_dir = tempfile.mkdtemp(prefix="pyapp_build_")
+            # Répertoire de travail: persistant par projet ou temporaire
+            if config.incremental_build:
+                self.temp_dir = self.work_directory(config.name)
+                if clean:
+                    self.clear_work_directory(config.name)
+                os.makedirs(self.temp_dir, exist_ok=True)
+            else:
+                self.temp_dir = tempfile.mkdtemp(prefix="pyapp_build_")
             logger.info(f"Répertoire de build: {self.temp_dir}")
             
             # Copie du fichier source
@@ -1210,38 +4294,60 @@ class PyInstallerBuilder:
             with open(source_file, 'r', encoding='utf-8') as src:
                 content = src.read()
             
-            with open(temp_source, 'w', encoding='utf-8') as dst:
-                dst.write(content)
+            # Un fichier inchangé garde son mtime et n'invalide pas l'Analysis
+            if not self._has_content(temp_source, content):
+                with open(temp_source, 'w', encoding='utf-8') as dst:
+                    dst.write(content)
             
             # Génération du fichier spec si nécessaire
-            spec_file = self._generate_spec_file(temp_source, config)
+            excludes = excludes or []
+            spec_file = self._generate_spec_file(temp_source, config, excludes, payload)
             
             # Construction des arguments PyInstaller
-            args = self._build_pyinstaller_args(temp_source, config, output_dir, spec_file)
+            args = self._build_pyinstaller_args(temp_source, config, output_dir, spec_file,
+                                                clean=clean or not config.incremental_build,
+                                                excludes=excludes)
             
             # Exécution de PyInstaller
+            if self.cancelled:
+                return False, "Construction annulée"
             logger.info(f"Commande PyInstaller: {' '.join(args)}")
             
-            self.build_process = subprocess.Popen(
-                args,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                cwd=self.temp_dir
-            )
+            # Worker pré-chargé si disponible, sinon sous-processus pyinstaller
+            timer = BuildPhaseTimer()
+            self.worker = self.worker_pool.acquire() if self.worker_pool else None
+            if self.worker:
+                output = self.worker.run(args[1:], self.temp_dir)
+            else:
+                self.build_process = subprocess.Popen(
+                    args,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    universal_newlines=True,
+                    cwd=self.temp_dir
+                )
+                output = iter(self.build_process.stdout.readline, '')
             
-            # Lecture de la sortie en temps réel
-            output_lines = []
-            while True:
-                line = self.build_process.stdout.readline()
-                if not line and self.build_process.poll() is not None:
-                    break
-                if line:
-                    output_lines.append(line.strip())
-                    logger.info(f"PyInstaller: {line.strip()}")
+            # Lecture de la sortie en temps réel (seule la fin est gardée pour l'erreur)
+            output_lines = deque(maxlen=BUILD_LOG_TAIL_LINES)
+            for line in output:
+                line = line.strip()
+                timer.feed(line)
+                output_lines.append(line)
+                logger.info(f"PyInstaller: {line}")
+                if on_output:
+                    on_output(line)
             
             # Vérification du résultat
-            return_code = self.build_process.poll()
+            if self.worker:
+                return_code, peak_rss = self.worker.result
+            else:
+                return_code, peak_rss = self._wait_for_process()
+            self.metrics = {
+                'phases': timer.finish(),
+                'duration': round(time.monotonic() - timer.started, 3),
+                'peak_rss': peak_rss
+            }
             output_text = '\n'.join(output_lines)
             
             if return_code == 0:
@@ -1249,6 +4355,12 @@ class PyInstallerBuilder:
                 exe_path = self._find_executable(self.temp_dir, config, output_dir)
                 if exe_path and os.path.exists(exe_path):
                     logger.info(f"Exécutable créé avec succès: {exe_path}")
+                    self.metrics['artifact_size'] = _path_size(
+                        exe_path if config.one_file else os.path.dirname(exe_path))
+                    if excludes:
+                        warn_file = os.path.join(self.temp_dir, 'build', config.name,
+                                                 f"warn-{config.name}.txt")
+                        self.exclude_report = ExcludeResolver.report(excludes, warn_file)
                     return True, exe_path
                 else:
                     return False, "Exécutable introuvable après la construction"
@@ -1260,18 +4372,146 @@ class PyInstallerBuilder:
             return False, f"Erreur: {str(e)}"
         
         finally:
-            # Nettoyage
-            if self.temp_dir and os.path.exists(self.temp_dir):
+            if self.worker:
+                self.worker_pool.release(self.worker)
+                self.worker = None
+            
+            # Nettoyage (le répertoire de travail incrémental est conservé)
+            if not config.incremental_build and self.temp_dir and os.path.exists(self.temp_dir):
                 try:
                     shutil.rmtree(self.temp_dir)
                 except Exception as e:
                     logger.warning(f"Impossible de supprimer le répertoire temporaire: {e}")
     
-    def _generate_spec_file(self, source_file: str, config: ProjectConfig) -> Optional[str]:
-        """Génère un fichier .spec pour PyInstaller"""
-        if not config.icon_path and not config.requirements:
+    def _build_with_extraction_cache(self, source_file: str, config: ProjectConfig,
+                                     output_dir: Optional[str], clean: bool,
+                                     on_output: Optional[Callable[[str], None]],
+                                     excludes: Optional[List[str]]) -> Tuple[bool, str]:
+        """Construit un onefile à extraction persistante
+        
+        L'application est construite en onedir puis zippée dans un lanceur onefile
+        minimal (LAUNCHER_CODE): seul le lanceur est extrait à chaque démarrage,
+        l'application n'est extraite qu'une fois par build.
+        """
+        staging_dir = tempfile.mkdtemp(prefix="pyapp_payload_")
+        try:
+            app_config = replace(config, one_file=False, extraction_cache=False)
+            success, result = self.build_executable(source_file, app_config, staging_dir,
+                                                    clean, on_output, excludes)
+            if not success:
+                return success, result
+            app_metrics, exclude_report = self.metrics, self.exclude_report
+            
+            # Seul le dossier produit par COLLECT est embarqué (pas le reste de staging_dir)
+            app_dir = os.path.join(staging_dir, app_config.name)
+            if not os.path.isdir(app_dir) or os.path.dirname(os.path.abspath(result)) != os.path.abspath(app_dir):
+                return False, f"Build onedir introuvable dans {staging_dir}"
+            payload = os.path.join(staging_dir, EXTRACTION_PAYLOAD_NAME)
+            build_hash = self._zip_directory(app_dir, payload)
+            logger.info(f"Application embarquée: {build_hash[:16]} ({_path_size(payload)} octets)")
+            
+            launcher_source = os.path.join(staging_dir, f"{config.name}.py")
+            with open(launcher_source, 'w', encoding='utf-8') as f:
+                f.write(LAUNCHER_CODE
+                        .replace('__APP_NAME__', repr(secure_filename(config.name) or 'app'))
+                        .replace('__APP_EXECUTABLE__', repr(os.path.basename(result)))
+                        .replace('__BUILD_HASH__', repr(build_hash))
+                        .replace('__PAYLOAD_NAME__', repr(EXTRACTION_PAYLOAD_NAME)))
+            
+            launcher_config = replace(config, extraction_cache=False, incremental_build=False,
+                                      requirements=[])
+            success, result = self.build_executable(launcher_source, launcher_config, output_dir,
+                                                    True, on_output, LAUNCHER_EXCLUDES, payload)
+            if success:
+                launcher_metrics = self.metrics
+                peak_rss = [m['peak_rss'] for m in (app_metrics, launcher_metrics) if m['peak_rss']]
+                self.metrics = {
+                    'phases': dict(app_metrics['phases'], launcher=launcher_metrics['duration']),
+                    'duration': round(app_metrics['duration'] + launcher_metrics['duration'], 3),
+                    'peak_rss': max(peak_rss) if peak_rss else None,
+                    'artifact_size': launcher_metrics['artifact_size']
+                }
+                self.exclude_report = exclude_report
+            return success, result
+        
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    @staticmethod
+    def _zip_directory(directory: str, archive_path: str) -> str:
+        """Zippe un répertoire de façon reproductible; retourne le SHA-256 de l'archive"""
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for root, dirs, files in os.walk(directory, followlinks=True):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    # Date fixe: un bundle identique garde la même empreinte
+                    info = zipfile.ZipInfo(os.path.relpath(path, directory).replace(os.sep, '/'),
+                                           date_time=(1980, 1, 1, 0, 0, 0))
+                    info.external_attr = (os.stat(path).st_mode & 0o777) << 16
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with open(path, 'rb') as src, archive.open(info, 'w') as dst:
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+        
+        digest = hashlib.sha256()
+        with open(archive_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _generate_spec_file(self, source_file: str, config: ProjectConfig,
+                            excludes: Optional[List[str]] = None,
+                            payload: Optional[str] = None) -> Optional[str]:
+        """Génère un fichier .spec pour PyInstaller (onefile: EXE seul, onedir: EXE + COLLECT)
+        
+        Réservé à l'archive embarquée du lanceur, que la ligne de commande ne sait
+        pas ajouter: requirements (--hidden-import) et icône (--icon) passent par
+        les arguments, avec les timings de phases (--log-level=INFO).
+        """
+        if not payload:
             return None
         
+        # Le type PKG est stocké tel quel et ignoré à l'extraction par le bootloader;
+        # le lanceur, extrait à chaque démarrage, est allégé de ses symboles (strip)
+        extra_toc = [(EXTRACTION_PAYLOAD_NAME, payload, 'PKG')] if payload else []
+        exe_options = f"""name='{config.name}',
+          debug={config.debug_mode},
+          bootloader_ignore_signals=False,
+          strip={bool(payload)},
+          upx={config.upx_compress},
+          upx_exclude=[],
+          console={config.include_console},
+          icon='{config.icon_path if config.icon_path else ""}'"""
+        
+        if config.one_file:
+            build_steps = f'''exe = EXE(pyz,
+          a.scripts,
+          a.binaries,
+          a.zipfiles,
+          a.datas,
+          {extra_toc!r},
+          runtime_tmpdir=None,
+          {exe_options})
+'''
+        else:
+            # onedir: binaires et données rassemblés à côté de l'exécutable par COLLECT
+            build_steps = f'''exe = EXE(pyz,
+          a.scripts,
+          [],
+          exclude_binaries=True,
+          {exe_options})
+
+coll = COLLECT(exe,
+               a.binaries,
+               a.zipfiles,
+               a.datas,
+               {extra_toc!r},
+               strip=False,
+               upx={config.upx_compress},
+               upx_exclude=[],
+               name='{config.name}')
+'''
+        
         spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
@@ -1283,7 +4523,7 @@ a = Analysis(['{os.path.basename(source_file)}'],
              hiddenimports={config.requirements},
              hookspath=[],
              runtime_hooks=[],
-             excludes=[],
+             excludes={excludes or []},
              win_no_prefer_redirects=False,
              win_private_assemblies=False,
              cipher=block_cipher,
@@ -1292,22 +4532,7 @@ a = Analysis(['{os.path.basename(source_file)}'],
 pyz = PYZ(a.pure, a.zipped_data,
              cipher=block_cipher)
 
-exe = EXE(pyz,
-          a.scripts,
-          a.binaries,
-          a.zipfiles,
-          a.datas,
-          [],
-          name='{config.name}',
-          debug={str(config.debug_mode).lower()},
-          bootloader_ignore_signals=False,
-          strip=False,
-          upx={str(config.upx_compress).lower()},
-          upx_exclude=[],
-          runtime_tmpdir=None,
-          console={str(config.include_console).lower()},
-          icon='{config.icon_path if config.icon_path else ''}')
-'''
+{build_steps}'''
         
         spec_file = os.path.join(os.path.dirname(source_file), f"{config.name}.spec")
         with open(spec_file, 'w', encoding='utf-8') as f:
@@ -1316,10 +4541,11 @@ exe = EXE(pyz,
         return spec_file
     
     def _build_pyinstaller_args(self, source_file: str, config: ProjectConfig, 
-                               output_dir: str, spec_file: str = None) -> List[str]:
+                               output_dir: str, spec_file: str = None,
+                               clean: bool = True, excludes: Optional[List[str]] = None) -> List[str]:
         """Construit les arguments de PyInstaller"""
         if spec_file:
-            args = ['pyinstaller', spec_file]
+            args = ['pyinstaller', spec_file, '--distpath', output_dir]
         else:
             args = ['pyinstaller']
             
@@ -1329,6 +4555,7 @@ exe = EXE(pyz,
             # Options de base
             args.extend(['--name', config.name])
             args.extend(['--distpath', output_dir])
+            args.extend(['--specpath', os.path.dirname(source_file)])
             
             # Mode one-file
             if config.one_file:
@@ -1350,6 +4577,10 @@ exe = EXE(pyz,
             for req in config.requirements:
                 args.extend(['--hidden-import', req])
             
+            # Modules exclus
+            for module in excludes or []:
+                args.extend(['--exclude-module', module])
+            
             # UPX compression
             if config.upx_compress:
                 args.append('--upx-dir')
@@ -1360,30 +4591,77 @@ exe = EXE(pyz,
                 args.append('--debug')
                 args.append('--log-level=DEBUG')
             else:
-                args.append('--log-level=WARN')
+                # INFO: les lignes "checking <phase>" servent à mesurer les phases
+                args.append('--log-level=INFO')
         
-        # Options communes
-        args.extend(['--clean', '--noconfirm'])
+        # Options communes (chemins explicites: un worker pré-chargé a figé
+        # les valeurs par défaut de PyInstaller sur son propre répertoire courant)
+        args.extend(['--workpath', os.path.join(os.path.dirname(source_file), 'build')])
+        if clean:
+            args.append('--clean')
+        args.append('--noconfirm')
         
         return args
     
+    def _wait_for_process(self) -> Tuple[int, Optional[int]]:
+        """Attend la fin de PyInstaller; retourne son code de sortie et son pic de RSS en octets"""
+        if hasattr(os, 'wait4'):
+            try:
+                _, status, usage = os.wait4(self.build_process.pid, 0)
+                self.build_process.returncode = os.waitstatus_to_exitcode(status)
+                # ru_maxrss est en octets sur macOS, en kilo-octets ailleurs
+                scale = 1 if sys.platform == 'darwin' else 1024
+                return self.build_process.returncode, usage.ru_maxrss * scale
+            except ChildProcessError:
+                pass  # Processus déjà récupéré par cancel_build
+        return self.build_process.wait(), None
+    
+    @staticmethod
+    def work_directory(project_name: str) -> str:
+        """Répertoire de travail persistant d'un projet"""
+        return os.path.abspath(os.path.join(BUILD_WORK_FOLDER, secure_filename(project_name) or 'project'))
+    
+    @classmethod
+    def clear_work_directory(cls, project_name: str) -> bool:
+        """Invalide le cache de build incrémental d'un projet"""
+        work_dir = cls.work_directory(project_name)
+        if not os.path.exists(work_dir):
+            return False
+        shutil.rmtree(work_dir, ignore_errors=True)
+        logger.info(f"Répertoire de travail supprimé: {work_dir}")
+        return True
+    
+    @staticmethod
+    def _has_content(path: str, content: str) -> bool:
+        """Vérifie si un fichier existe avec exactement ce contenu"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read() == content
+        except OSError:
+            return False
+    
     def _find_executable(self, build_dir: str, config: ProjectConfig, output_dir: str) -> Optional[str]:
         """Trouve l'exécutable généré"""
+        exe_name = f"{config.name}.exe" if os.name == 'nt' else config.name
+        # onedir: exécutable dans le dossier du build (un ancien onefile n'est pas repris)
+        relative = exe_name if config.one_file else os.path.join(config.name, exe_name)
         possible_paths = [
-            os.path.join(output_dir, f"{config.name}.exe"),
-            os.path.join(output_dir, config.name, f"{config.name}.exe"),
-            os.path.join(build_dir, "dist", f"{config.name}.exe"),
-            os.path.join(build_dir, "dist", config.name, f"{config.name}.exe"),
+            os.path.join(output_dir, relative),
+            os.path.join(build_dir, "dist", relative),
         ]
         
         for path in possible_paths:
-            if os.path.exists(path):
+            if os.path.isfile(path):
                 return path
         
         return None
     
     def cancel_build(self):
         """Annule la construction en cours"""
+        self.cancelled = True
+        if self.worker:
+            # Le worker interrompu est remplacé lors de sa restitution au pool
+            self.worker.stop()
         if self.build_process and self.build_process.poll() is None:
             self.build_process.terminate()
             try:
@@ -1391,6 +4669,674 @@ exe = EXE(pyz,
             except subprocess.TimeoutExpired:
                 self.build_process.kill()
 
+class BuildCache:
+    """Cache adressé par contenu des exécutables construits"""
+    
+    # Horodatage fixe du wrapper utilisé pour la clé: le wrapper réel contient la date de génération
+    KEY_TIMESTAMP = datetime(2000, 1, 1)
+    INDEX_FILE = 'index.json'
+    
+    def __init__(self, cache_dir: str = BUILD_CACHE_FOLDER, max_bytes: int = BUILD_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._toolchain = self._toolchain_fingerprint()
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+    
+    def compute_key(self, wrapper_code: str, config: ProjectConfig) -> str:
+        """Calcule la clé d'un build à partir du wrapper et des options de construction"""
+        payload = {
+            'wrapper': hashlib.sha256(wrapper_code.encode('utf-8')).hexdigest(),
+            'name': config.name,
+            'one_file': config.one_file,
+            'include_console': config.include_console,
+            'upx_compress': config.upx_compress,
+            'debug_mode': config.debug_mode,
+            'requirements': sorted(config.requirements),
+            'auto_excludes': config.auto_excludes,
+            'extraction_cache': config.one_file and config.extraction_cache,
+            'icon': self._icon_digest(config.icon_path),
+            'toolchain': self._toolchain
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    def get(self, key: str, record: bool = True) -> Optional[str]:
+        """Retourne le chemin de l'artefact en cache, ou None
+        
+        Avec record=False, la consultation n'est pas comptée dans hits/misses
+        (l'appelant la compte avec record_lookup() s'il s'en sert).
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry and os.path.exists(entry['path']):
+                self.entries.move_to_end(key)
+                entry['last_access'] = time.time()
+                path = entry['path']
+            else:
+                if entry:
+                    # Artefact supprimé hors du cache
+                    del self.entries[key]
+                path = None
+            if record:
+                self._count_lookup(path is not None)
+            self._save_index()
+            return path
+    
+    def record_lookup(self, hit: bool):
+        """Compte une consultation faite avec get(record=False)"""
+        with self._lock:
+            self._count_lookup(hit)
+            self._save_index()
+    
+    def _count_lookup(self, hit: bool):
+        """Compte un succès ou un échec (verrou pris)"""
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+    
+    def put(self, key: str, artifact_path: str, one_file: bool = True) -> Optional[str]:
+        """Stocke une copie de l'artefact et retourne son chemin dans le cache"""
+        entry_dir = os.path.join(self.cache_dir, key)
+        staging_dir = f"{entry_dir}.tmp-{uuid.uuid4().hex}"
+        try:
+            # Copie hors verrou: seuls l'index et le renommage sont protégés
+            if one_file:
+                os.makedirs(staging_dir)
+                shutil.copy2(artifact_path, staging_dir)
+                relative_path = os.path.basename(artifact_path)
+            else:
+                bundle_dir = os.path.dirname(artifact_path)
+                shutil.copytree(bundle_dir, os.path.join(staging_dir, os.path.basename(bundle_dir)))
+                relative_path = os.path.join(os.path.basename(bundle_dir), os.path.basename(artifact_path))
+            size = _path_size(staging_dir)
+            
+            with self._lock:
+                if key in self.entries or size > self.max_bytes:
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+                    entry = self.entries.get(key)
+                    return entry['path'] if entry else None
+                
+                if os.path.exists(entry_dir):
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                os.rename(staging_dir, entry_dir)
+                
+                self.entries[key] = {
+                    'path': os.path.join(entry_dir, relative_path),
+                    'size': size,
+                    'last_access': time.time()
+                }
+                self._evict()
+                self._save_index()
+                return self.entries[key]['path']
+        
+        except OSError as e:
+            logger.warning(f"Impossible de mettre en cache {artifact_path}: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return None
+    
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques du cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'size': sum(entry['size'] for entry in self.entries.values()),
+                'max_size': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+    
+    def _evict(self):
+        """Évince les entrées les moins récemment utilisées au-delà du budget disque"""
+        total = sum(entry['size'] for entry in self.entries.values())
+        while total > self.max_bytes and self.entries:
+            key, entry = self.entries.popitem(last=False)
+            total -= entry['size']
+            shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+            logger.info(f"Build évincé du cache: {key}")
+    
+    def _load_index(self):
+        """Charge l'index persisté, en ignorant les entrées disparues"""
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        self.hits = index.get('hits', 0)
+        self.misses = index.get('misses', 0)
+        entries = sorted(index.get('entries', {}).items(), key=lambda item: item[1]['last_access'])
+        for key, entry in entries:
+            if os.path.exists(entry['path']):
+                self.entries[key] = entry
+    
+    def _save_index(self):
+        """Persiste l'index de manière atomique"""
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        temp_path = f"{index_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'hits': self.hits, 'misses': self.misses, 'entries': self.entries}, f)
+            os.replace(temp_path, index_path)
+        except OSError as e:
+            logger.warning(f"Impossible de sauvegarder l'index du cache: {e}")
+    
+    @staticmethod
+    def _toolchain_fingerprint() -> str:
+        """Versions de PyInstaller et de Python qui influencent l'artefact"""
+        try:
+            pyinstaller_version = importlib.metadata.version('pyinstaller')
+        except importlib.metadata.PackageNotFoundError:
+            pyinstaller_version = 'absent'
+        return f"pyinstaller={pyinstaller_version};python={sys.version};platform={sys.platform}"
+    
+    @staticmethod
+    def _icon_digest(icon_path: Optional[str]) -> Optional[str]:
+        """Empreinte du contenu de l'icône, ou son chemin si elle est illisible"""
+        if not icon_path:
+            return None
+        try:
+            with open(icon_path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return icon_path
+
+
+class BuildLog:
+    """Log d'une construction: tampon borné pour le streaming et spool compressé"""
+    
+    def __init__(self, max_lines: int = BUILD_LOG_BUFFER_LINES):
+        self.lines: deque = deque(maxlen=max_lines)
+        self.start_offset = 0  # Offset absolu de la première ligne du tampon
+        self.closed = False
+        self._compressor = zlib.compressobj()
+        self._spool = bytearray()
+        self._condition = threading.Condition()
+    
+    @property
+    def end_offset(self) -> int:
+        return self.start_offset + len(self.lines)
+    
+    def append(self, line: str):
+        """Ajoute une ligne et réveille les lecteurs en attente"""
+        with self._condition:
+            if len(self.lines) == self.lines.maxlen:
+                self.start_offset += 1
+            self.lines.append(line)
+            self._spool += self._compressor.compress(line.encode('utf-8') + b'\n')
+            self._condition.notify_all()
+    
+    def close(self) -> bytes:
+        """Termine le log et retourne le spool compressé complet (libéré ensuite)"""
+        with self._condition:
+            if not self.closed:
+                self.closed = True
+                self._spool += self._compressor.flush()
+                self._condition.notify_all()
+            compressed = bytes(self._spool)
+            self._spool = bytearray()
+            return compressed
+    
+    def read(self, offset: int, timeout: Optional[float] = None) -> Tuple[int, List[str], bool]:
+        """Lit les lignes à partir d'un offset, en attendant si aucune n'est disponible
+        
+        Retourne (offset de la première ligne, lignes, log terminé). L'offset retourné
+        est supérieur à celui demandé si les lignes ont quitté le tampon.
+        """
+        with self._condition:
+            if offset >= self.end_offset and not self.closed:
+                self._condition.wait(timeout)
+            first = max(offset, self.start_offset)
+            lines = list(self.lines)[first - self.start_offset:]
+            return first, lines, self.closed
+
+@dataclass
+class BuildJob:
+    """Tâche de construction soumise à la file d'attente"""
+    id: str
+    project_name: str
+    status: str = "queued"
+    result_path: Optional[str] = None
+    error: Optional[str] = None
+    cached: bool = False
+    history_id: Optional[int] = None
+    metrics: Optional[Dict[str, Any]] = None
+    exclude_report: Optional[Dict[str, Any]] = None
+    submitted_at: str = ""
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    
+    def __post_init__(self):
+        if not self.submitted_at:
+            self.submitted_at = datetime.now().isoformat()
+    
+    @property
+    def finished(self) -> bool:
+        return self.status in ('succeeded', 'failed', 'cancelled')
+
+class BuildQueue:
+    """File d'attente des constructions, exécutées par un pool borné de workers"""
+    
+    def __init__(self, max_workers: int = BUILD_WORKERS, history_size: int = BUILD_HISTORY_SIZE,
+                 cache: Optional[BuildCache] = None, db: Optional[DatabaseManager] = None,
+                 worker_pool: Optional[BuilderWorkerPool] = None):
+        self.max_workers = max(1, max_workers)
+        self.history_size = history_size
+        self.cache = cache
+        self.db = db
+        self.worker_pool = worker_pool
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                           thread_name_prefix="build-worker")
+        self.jobs: "OrderedDict[str, BuildJob]" = OrderedDict()
+        self._builders: Dict[str, PyInstallerBuilder] = {}
+        self._logs: Dict[str, BuildLog] = {}
+        self._lock = threading.Lock()
+    
+    def submit(self, config: ProjectConfig, gui_code: str, cache_key: Optional[str] = None,
+               clean: bool = False, excludes: Optional[List[str]] = None) -> BuildJob:
+        """Soumet une construction; réutilise la tâche active du même projet
+        
+        Un build propre (clean=True) ignore le cache d'exécutables.
+        """
+        # Lecture du cache hors verrou; vérification et enregistrement de la tâche
+        # dans la même section critique (deux soumissions ne lancent qu'un build).
+        # La consultation n'est comptée que si elle crée une tâche.
+        lookup = bool(self.cache and cache_key and not clean)
+        cached_path = self.cache.get(cache_key, record=False) if lookup else None
+        
+        with self._lock:
+            for job in self.jobs.values():
+                if job.project_name == config.name and not job.finished:
+                    return job
+            
+            job = BuildJob(id=uuid.uuid4().hex, project_name=config.name)
+            build_log = BuildLog()
+            if cached_path:
+                job.status = 'succeeded'
+                job.cached = True
+                job.result_path = cached_path
+                job.started_at = job.finished_at = datetime.now().isoformat()
+            self.jobs[job.id] = job
+            self._logs[job.id] = build_log
+            self._prune_history()
+        
+        if lookup:
+            self.cache.record_lookup(cached_path is not None)
+        if cached_path:
+            logger.info(f"Build de {config.name} servi depuis le cache: {cached_path}")
+            build_log.append(f"Exécutable servi depuis le cache: {cached_path}")
+            build_log.close()
+            return job
+        
+        self.executor.submit(self._run_job, job, config, gui_code, cache_key, clean, excludes)
+        logger.info(f"Construction {job.id} mise en file pour {config.name}")
+        return job
+    
+    def get(self, job_id: str) -> Optional[BuildJob]:
+        """Retourne une tâche par son identifiant"""
+        with self._lock:
+            return self.jobs.get(job_id)
+    
+    def get_log(self, job_id: str) -> Optional[BuildLog]:
+        """Retourne le log en mémoire d'une tâche"""
+        with self._lock:
+            return self._logs.get(job_id)
+    
+    def list_jobs(self) -> List[BuildJob]:
+        """Liste les tâches, de la plus récente à la plus ancienne"""
+        with self._lock:
+            return list(reversed(self.jobs.values()))
+    
+    def cancel(self, job_id: str) -> bool:
+        """Annule une tâche en attente ou en cours"""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job or job.finished:
+                return False
+            job.status = 'cancelled'
+            job.finished_at = datetime.now().isoformat()
+            builder = self._builders.get(job_id)
+        
+        if builder:
+            builder.cancel_build()
+        return True
+    
+    def shutdown(self, wait: bool = False):
+        """Arrête le pool de workers"""
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        if self.worker_pool:
+            self.worker_pool.shutdown()
+    
+    def _run_job(self, job: BuildJob, config: ProjectConfig, gui_code: str,
+                 cache_key: Optional[str] = None, clean: bool = False,
+                 excludes: Optional[List[str]] = None):
+        """Exécute une tâche avec son propre constructeur et ses propres fichiers"""
+        builder = PyInstallerBuilder(self.worker_pool)
+        with self._lock:
+            build_log = self._logs[job.id]
+            if job.status == 'cancelled':
+                build_log.close()
+                return
+            job.status = 'running'
+            job.started_at = datetime.now().isoformat()
+            self._builders[job.id] = builder
+        
+        temp_file = os.path.join(UPLOAD_FOLDER, f"temp_{config.name}_{job.id}.py")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(gui_code)
+            
+            if excludes:
+                build_log.append(f"Modules exclus automatiquement: {', '.join(excludes)}")
+            success, result = builder.build_executable(temp_file, config, OUTPUT_FOLDER, clean,
+                                                       on_output=build_log.append,
+                                                       excludes=excludes)
+        except Exception as e:
+            logger.error(f"Erreur de la construction {job.id}: {e}")
+            success, result = False, f"Erreur: {str(e)}"
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        
+        with self._lock:
+            cancelled = job.status == 'cancelled'
+        if success and not cancelled and self.cache and cache_key:
+            self.cache.put(cache_key, result, config.one_file)
+        
+        with self._lock:
+            self._builders.pop(job.id, None)
+            if job.status != 'cancelled':
+                job.finished_at = datetime.now().isoformat()
+                if success:
+                    job.status = 'succeeded'
+                    job.result_path = result
+                else:
+                    job.status = 'failed'
+                    job.error = result
+        
+        if not success and job.status != 'cancelled':
+            build_log.append(result.splitlines()[0] if result else "Construction échouée")
+        job.metrics = builder.metrics or None
+        job.exclude_report = builder.exclude_report
+        if job.exclude_report:
+            build_log.append(f"Octets économisés (estimation): {job.exclude_report['estimated_bytes_saved']}")
+        compressed_log = build_log.close()
+        self._record_history(job, config, compressed_log)
+    
+    def _record_history(self, job: BuildJob, config: ProjectConfig, compressed_log: bytes):
+        """Persiste le log compressé et les métriques de la tâche dans conversion_history"""
+        if not self.db:
+            return
+        try:
+            project_id = self.db.get_project_id(config.name)
+            job.history_id = self.db.add_conversion(project_id, job.status, compressed_log,
+                                                    job.result_path, config.gui_framework,
+                                                    job.metrics)
+        except sqlite3.Error as e:
+            logger.warning(f"Impossible d'enregistrer l'historique de {job.id}: {e}")
+    
+    def _prune_history(self):
+        """Oublie les tâches terminées les plus anciennes au-delà de la limite"""
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.history_size)]:
+            del self.jobs[job_id]
+            self._logs.pop(job_id, None)
+
+class StartupBenchmark:
+    """Benchmark du démarrage à froid des exécutables générés
+
+    Chaque exécutable est lancé plusieurs fois, sans affichage, avec la sonde de
+    démarrage du wrapper active. Le temps jusqu'à la première fenêtre (ou jusqu'à
+    main() pour console/flask) est découpé en:
+    - unpack: du lancement au processus qui exécute Python (extraction onefile;
+      en onedir, simple coût de création du processus)
+    - interpreter_init: bootloader, interpréteur et imports de PyInstaller
+    - imports: imports du wrapper
+    - ui: construction de l'interface jusqu'au premier tour de boucle
+    """
+
+    PHASES = ('unpack', 'interpreter_init', 'imports', 'ui', 'total')
+
+    def __init__(self, runs: int = BENCHMARK_RUNS, timeout: int = BENCHMARK_TIMEOUT,
+                 drop_caches: bool = False):
+        self.runs = runs
+        self.timeout = timeout
+        self.drop_caches = drop_caches
+
+    @staticmethod
+    def resolve_executable(artifact: str) -> Optional[str]:
+        """Exécutable d'un artefact: fichier onefile ou dossier onedir, relatif à OUTPUT_FOLDER"""
+        candidates = [artifact]
+        if not os.path.isabs(artifact):
+            candidates.append(os.path.join(OUTPUT_FOLDER, artifact))
+
+        for path in candidates:
+            if os.path.isdir(path):
+                name = os.path.basename(os.path.normpath(path))
+                path = os.path.join(path, f"{name}.exe" if os.name == 'nt' else name)
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return os.path.abspath(path)
+
+        return None
+
+    def run(self, artifact: str) -> Dict[str, Any]:
+        """Mesure un artefact"""
+        return self._summarize(artifact, *self._measure(artifact))
+
+    def compare(self, artifacts: List[str]) -> Dict[str, Any]:
+        """Mesure plusieurs artefacts et les regroupe par framework et mode (onefile/onedir)"""
+        results = []
+        groups: Dict[str, List[Dict[str, float]]] = {}
+
+        for artifact in artifacts:
+            samples, errors = self._measure(artifact)
+            result = self._summarize(artifact, samples, errors)
+            results.append(result)
+            if samples:
+                group = f"{result['gui_framework']}/{'onefile' if result['one_file'] else 'onedir'}"
+                groups.setdefault(group, []).extend(sample['phases'] for sample in samples)
+
+        comparison = {
+            group: {phase: _percentiles([p[phase] for p in phases]) for phase in self.PHASES}
+            for group, phases in sorted(groups.items())
+        }
+        return {'results': results, 'comparison': comparison}
+
+    def _measure(self, artifact: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Lance l'artefact self.runs fois; retourne (mesures, erreurs)"""
+        executable = self.resolve_executable(artifact)
+        if not executable:
+            return [], [f"Exécutable introuvable: {artifact}"]
+
+        samples, errors = [], []
+        with self._headless_env() as env:
+            for _ in range(self.runs):
+                if self.drop_caches:
+                    self._drop_page_cache()
+                sample = self._launch(executable, env)
+                if 'error' in sample:
+                    errors.append(sample['error'])
+                else:
+                    samples.append(sample)
+
+        return samples, errors
+
+    def _summarize(self, artifact: str, samples: List[Dict[str, Any]],
+                   errors: List[str]) -> Dict[str, Any]:
+        """Résumé d'un artefact: premier lancement et percentiles par phase"""
+        result = {
+            'artifact': artifact,
+            'success': bool(samples),
+            'runs': len(samples),
+            'failures': len(errors),
+        }
+        if errors:
+            result['errors'] = list(dict.fromkeys(errors))[:5]
+        if samples:
+            result.update({
+                'gui_framework': samples[0]['gui_framework'],
+                'one_file': samples[0]['one_file'],
+                'first_run': samples[0]['phases'],
+                'phases': {phase: _percentiles([s['phases'][phase] for s in samples])
+                           for phase in self.PHASES},
+            })
+        return result
+
+    def _launch(self, executable: str, env: Dict[str, str]) -> Dict[str, Any]:
+        """Un lancement avec la sonde active"""
+        fd, probe_file = tempfile.mkstemp(prefix="pyapp_probe_", suffix=".json")
+        os.close(fd)
+
+        try:
+            started = time.time()
+            process = subprocess.Popen(
+                [executable],
+                cwd=os.path.dirname(executable),
+                env=dict(env, **{STARTUP_PROBE_ENV: probe_file}),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                universal_newlines=True
+            )
+            try:
+                _, stderr = process.communicate(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                return {'error': f"Délai dépassé ({self.timeout}s)"}
+
+            with open(probe_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            if not content:
+                # Dernière ligne utile de stderr (hors messages du bootloader)
+                lines = [line for line in stderr.strip().splitlines() if not line.startswith('[PYI-')]
+                detail = lines[-1] if lines else "pas de sonde dans l'exécutable ?"
+                return {'error': f"Aucune mesure (code {process.returncode}): {detail}"}
+
+            return self._phases(json.loads(content), started)
+
+        except (OSError, ValueError, KeyError) as e:
+            return {'error': str(e)}
+        finally:
+            os.unlink(probe_file)
+
+    @staticmethod
+    def _phases(probe: Dict[str, Any], started: float) -> Dict[str, Any]:
+        """Découpe les jalons de la sonde en phases (secondes)"""
+        marks = probe['marks']
+        script_start = marks['script_start']
+        imports_done = marks.get('imports_done', script_start)
+        end = marks[probe['final_mark']]
+
+        # Sans /proc, l'extraction est comptée dans interpreter_init. La date de
+        # création du processus a une résolution de 10ms: elle est bornée.
+        process_start = probe.get('process_start') or started
+        process_start = min(max(process_start, started), script_start)
+
+        return {
+            'gui_framework': probe.get('gui_framework'),
+            'one_file': probe.get('one_file', False),
+            'phases': {
+                'unpack': round(process_start - started, 4),
+                'interpreter_init': round(script_start - process_start, 4),
+                'imports': round(imports_done - script_start, 4),
+                'ui': round(end - imports_done, 4),
+                'total': round(end - started, 4),
+            }
+        }
+
+    @contextmanager
+    def _headless_env(self):
+        """Environnement sans affichage: Qt offscreen, serveur Xvfb si disponible"""
+        env = dict(os.environ)
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        xvfb = None
+
+        if sys.platform.startswith('linux') and not env.get('DISPLAY') and shutil.which('Xvfb'):
+            read_fd, write_fd = os.pipe()
+            xvfb = subprocess.Popen(
+                ['Xvfb', '-displayfd', str(write_fd), '-nolisten', 'tcp'],
+                pass_fds=(write_fd,),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            os.close(write_fd)
+            with os.fdopen(read_fd) as f:
+                display = f.readline().strip()
+            if display:
+                env['DISPLAY'] = f":{display}"
+
+        try:
+            yield env
+        finally:
+            if xvfb:
+                xvfb.terminate()
+                xvfb.wait()
+
+    @staticmethod
+    def _drop_page_cache() -> bool:
+        """Vide le cache de pages (Linux, root) pour un démarrage réellement à froid"""
+        try:
+            os.sync()
+            with open('/proc/sys/vm/drop_caches', 'w') as f:
+                f.write('3\n')
+            return True
+        except OSError:
+            return False
+
+class IngestBuffer(io.BytesIO):
+    """Fichier uploadé reçu en un seul passage
+    
+    Werkzeug y écrit le corps de la requête par blocs: la limite de taille est
+    vérifiée et l'empreinte SHA-256 calculée au fil de l'eau, et le contenu
+    reste en mémoire (ni fichier temporaire, ni relecture).
+    """
+    
+    def __init__(self, limit: int = MAX_FILE_SIZE):
+        super().__init__()
+        self.limit = limit
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+    
+    def write(self, chunk) -> int:
+        self.size += len(chunk)
+        if self.size > self.limit:
+            raise RequestEntityTooLarge(f"Fichier trop volumineux (max {self.limit // (1024 * 1024)}MB)")
+        self._sha256.update(chunk)
+        return super().write(chunk)
+    
+    @property
+    def digest(self) -> str:
+        """SHA-256 des octets reçus"""
+        return self._sha256.hexdigest()
+    
+    def decode(self) -> Tuple[str, Optional[str]]:
+        """Source décodé et, s'il sert tel quel de clé d'analyse, l'empreinte reçue
+        
+        Sans BOM ni retour chariot, un source ASCII ou UTF-8 décodé a exactement
+        les octets reçus: leur SHA-256 est celui d'AnalysisCache.digest().
+        """
+        data = self.getvalue()
+        source = CodeAnalyzer.decode_source(data)
+        reusable = (b'\r' not in data and not data.startswith(codecs.BOM_UTF8)
+                    and ((source.isascii() and len(source) == len(data))
+                         or source.encode('utf-8', errors='surrogatepass') == data))
+        return source, self.digest if reusable else None
+
+class IngestRequest(Request):
+    """Requête Flask dont les fichiers uploadés sont reçus dans un IngestBuffer"""
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return IngestBuffer()
+
 class FlaskWebInterface:
     """Interface web Flask pour le convertisseur"""
     
@@ -1398,12 +5344,30 @@ class FlaskWebInterface:
         self.app = Flask(__name__, template_folder=TEMPLATES_FOLDER, static_folder=STATIC_FOLDER)
         self.app.secret_key = hashlib.md5(b'script_converter').hexdigest()
         self.app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
+        self.app.request_class = IngestRequest
         self.app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
         
         self.db = DatabaseManager()
-        self.analyzer = CodeAnalyzer()
+        self.analysis_cache = AnalysisCache(self.db)
+        self.distribution_index = DistributionIndex(self.db)
+        self.analysis_pool = AnalysisPool()
+        self.analyzer = CodeAnalyzer(self.analysis_cache, self.distribution_index, self.analysis_pool)
+        self.background_analysis = ThreadPoolExecutor(max_workers=BACKGROUND_ANALYSIS_WORKERS,
+                                                      thread_name_prefix='analysis')
+        self.pending_analyses: Dict[str, Any] = {}  # Nom de projet -> Future
+        self._pending_lock = threading.Lock()
+        self.incremental_analyzer = IncrementalAnalyzer(self.analyzer)
+        self.project_analyzer = ProjectAnalyzer(self.analysis_pool)
         self.template_generator = TemplateGenerator()
-        self.builder = PyInstallerBuilder()
+        self.build_cache = BuildCache()
+        worker_pool = None
+        if BUILDER_IN_PROCESS and importlib.util.find_spec('PyInstaller'):
+            worker_pool = BuilderWorkerPool()
+        self.build_queue = BuildQueue(cache=self.build_cache, db=self.db, worker_pool=worker_pool)
+        
+        # Symboles des projets pas encore indexés pour la recherche (bases existantes)
+        if self.db.search_enabled:
+            self.background_analysis.submit(self._index_missing_symbols)
         
         self._setup_routes()
         self._ensure_directories()
@@ -1419,8 +5383,16 @@ class FlaskWebInterface:
         
         @self.app.route('/')
         def index():
-            projects = self.db.list_projects()
-            return render_template('index.html', projects=projects)
+            filters = {'gui_framework': request.args.get('framework') or None,
+                       'author': request.args.get('author') or None}
+            try:
+                projects, next_cursor = self.db.list_projects(INDEX_PROJECTS_SHOWN, request.args.get('cursor'),
+                                                              **filters)
+            except ValueError:
+                projects, next_cursor = self.db.list_projects(INDEX_PROJECTS_SHOWN, **filters)
+            return render_template('index.html', projects=projects, next_cursor=next_cursor,
+                                   framework=filters['gui_framework'] or '', author=filters['author'] or '',
+                                   paged=bool(request.args.get('cursor')))
         
         @self.app.route('/upload', methods=['GET', 'POST'])
         def upload_file():
@@ -1436,11 +5408,27 @@ class FlaskWebInterface:
                 
                 if file and self._allowed_file(file.filename):
                     filename = secure_filename(file.filename)
-                    file_path = os.path.join(self.app.config['UPLOAD_FOLDER'], filename)
-                    file.save(file_path)
+                    # Corps reçu une seule fois: taille, empreinte et contenu en mémoire
+                    buffer = file.stream if isinstance(file.stream, IngestBuffer) else None
+                    
+                    if filename.lower().endswith('.zip'):
+                        return self._upload_project(filename, buffer.getvalue() if buffer else file.read())
+                    
+                    try:
+                        if buffer:
+                            source_code, digest = buffer.decode()
+                        else:
+                            source_code, digest = CodeAnalyzer.decode_source(file.read()), None
+                    except (SyntaxError, UnicodeDecodeError):
+                        flash('Encodage du fichier non reconnu', 'error')
+                        return redirect(request.url)
                     
-                    # Analyse du fichier
-                    analysis = self.analyzer.analyze_file(file_path)
+                    # Détection rapide sur l'en-tête des imports; l'analyse complète
+                    # (même texte, sans écriture sur disque) suit en arrière-plan
+                    gui_framework, header_imports = CodeAnalyzer.detect_framework_fast(source_code)
+                    
+                    # Dépendances tierces résolues vers les distributions installées
+                    dependencies = self.distribution_index.resolve(header_imports)
                     
                     # Configuration par défaut
                     config = ProjectConfig(
@@ -1448,16 +5436,17 @@ class FlaskWebInterface:
                         description=f"Application générée depuis {filename}",
                         author="Utilisateur",
                         version="1.0.0",
-                        gui_framework=analysis.get('gui_framework', 'tkinter')
+                        gui_framework=gui_framework,
+                        requirements=dependencies['requirements']
                     )
                     
-                    # Sauvegarde
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        source_code = f.read()
-                    
-                    self.db.save_project(config, source_code)
+                    # Sauvegarde (l'empreinte du source est aussi sa clé d'analyse)
+                    digest = digest or AnalysisCache.digest(source_code)
+                    self.db.save_project(config, source_code, digest)
+                    self._schedule_analysis(config, source_code, digest)
                     
-                    flash(f'Fichier {filename} téléchargé et analysé avec succès', 'success')
+                    flash(f'Fichier {filename} téléchargé avec succès, analyse détaillée en cours', 'success')
+                    self._flash_missing_dependencies(dependencies)
                     return redirect(url_for('project_config', name=config.name))
                 else:
                     flash('Type de fichier non autorisé', 'error')
@@ -1466,13 +5455,73 @@ class FlaskWebInterface:
         
         @self.app.route('/project/<name>')
         def project_config(name):
-            project_data = self.db.load_project(name)
+            project_data = self.db.load_project_config(name)
             if not project_data:
                 flash('Projet introuvable', 'error')
                 return redirect(url_for('index'))
             
-            config, source_code = project_data
-            return render_template('project_config.html', config=config, source_code=source_code)
+            config, digest = project_data
+            source_preview, source_lines, source_truncated = self._source_preview(digest)
+            
+            # Points chauds: fonctions les plus complexes (analyse en cache),
+            # sauf si l'analyse lancée à l'upload n'est pas encore terminée
+            analysis_pending = self._analysis_pending(name)
+            analysis = None if analysis_pending else self._project_analysis(name, digest)
+            hotspots = analysis.hotspots(HOTSPOTS_SHOWN) if analysis else []
+            return render_template('project_config.html', config=config, source_preview=source_preview,
+                                   source_lines=source_lines, source_truncated=source_truncated,
+                                   hotspots=hotspots, analysis_pending=analysis_pending)
+        
+        @self.app.route('/api/projects/<name>/analysis')
+        def api_project_analysis(name):
+            if self._analysis_pending(name):
+                return jsonify({'success': True, 'status': 'pending'}), 202
+            
+            project_data = self.db.load_project_config(name)
+            if not project_data:
+                return jsonify({'success': False, 'error': 'Projet introuvable'}), 404
+            
+            try:
+                params = AnalysisResult.view_params(request.args)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            
+            config, digest = project_data
+            analysis = self._project_analysis(name, digest)
+            if not analysis:
+                return jsonify({'success': False, 'status': 'failed', 'error': 'Analyse impossible'})
+            return jsonify({'success': True, 'status': 'done', 'gui_framework': config.gui_framework,
+                            'analysis': analysis.render(**params)})
+        
+        @self.app.route('/api/projects/<name>/source')
+        def api_project_source(name):
+            project_data = self.db.load_project_config(name)
+            if not project_data or not project_data[1]:
+                return jsonify({'success': False, 'error': 'Projet introuvable'}), 404
+            
+            # Lecture du BLOB par morceaux: le source n'est jamais entièrement en mémoire
+            return Response(self.db.iter_source(project_data[1]), mimetype='text/x-python',
+                            headers={'Content-Disposition': f'attachment; filename="{secure_filename(name)}.py"'})
+        
+        @self.app.route('/api/projects/<name>/revisions')
+        def api_project_revisions(name):
+            revisions = self.db.list_revisions(name)
+            if revisions is None:
+                return jsonify({'success': False, 'error': 'Projet introuvable'}), 404
+            return jsonify({'success': True, 'revisions': revisions})
+        
+        @self.app.route('/api/projects/<name>/revisions/<int:revision>')
+        def api_project_revision(name, revision):
+            revision_data = self.db.load_revision(name, revision)
+            if not revision_data:
+                return jsonify({'success': False, 'error': 'Révision introuvable'}), 404
+            
+            config, source_code = revision_data
+            if request.args.get('format') == 'raw':
+                return Response(source_code, mimetype='text/x-python', headers={
+                    'Content-Disposition': f'attachment; filename="{secure_filename(name)}-r{revision}.py"'})
+            return jsonify({'success': True, 'revision': revision, 'config': asdict(config),
+                            'source_code': source_code})
         
         @self.app.route('/build/<name>', methods=['POST'])
         def build_project(name):
@@ -1481,6 +5530,9 @@ class FlaskWebInterface:
                 return jsonify({'success': False, 'error': 'Projet introuvable'})
             
             config, source_code = project_data
+            if config.analysis_only:
+                return jsonify({'success': False, 'error': "Projet créé depuis une archive: analyse seule, "
+                                                           "les autres modules ne sont pas conservés"}), 409
             
             # Mise à jour de la configuration
             for field in ['description', 'author', 'version', 'gui_framework', 'theme']:
@@ -1492,30 +5544,112 @@ class FlaskWebInterface:
             config.one_file = 'one_file' in request.form
             config.upx_compress = 'upx_compress' in request.form
             config.debug_mode = 'debug_mode' in request.form
+            config.incremental_build = 'incremental_build' in request.form
+            config.auto_excludes = 'auto_excludes' in request.form
+            config.extraction_cache = 'extraction_cache' in request.form
+            clean_build = 'clean_build' in request.form
             
             # Génération du code GUI
             gui_code = self.template_generator.generate_gui_wrapper(source_code, config)
             
-            # Création du fichier temporaire
-            temp_file = os.path.join(UPLOAD_FOLDER, f"temp_{name}.py")
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(gui_code)
+            # Clé de cache calculée sur un wrapper à horodatage fixe
+            key_code = self.template_generator.generate_gui_wrapper(
+                source_code, config, BuildCache.KEY_TIMESTAMP)
+            cache_key = self.build_cache.compute_key(key_code, config)
             
-            # Construction
-            success, result = self.builder.build_executable(temp_file, config, OUTPUT_FOLDER)
+            # Exclusions déduites des imports du script et du wrapper
+            excludes = ExcludeResolver.resolve(source_code, gui_code, config) if config.auto_excludes else []
             
-            # Nettoyage
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            # Mise en file de la construction (ou réponse directe depuis le cache)
+            job = self.build_queue.submit(config, gui_code, cache_key, clean_build, excludes)
             
-            if success:
-                return jsonify({
-                    'success': True, 
-                    'message': 'Exécutable créé avec succès',
-                    'path': result
-                })
-            else:
-                return jsonify({'success': False, 'error': result})
+            return jsonify({
+                'success': True,
+                'job_id': job.id,
+                'status': job.status,
+                'cached': job.cached,
+                'status_url': url_for('api_build_status', job_id=job.id)
+            }), 200 if job.finished else 202
+        
+        @self.app.route('/api/builds')
+        def api_builds():
+            return jsonify([asdict(job) for job in self.build_queue.list_jobs()])
+        
+        @self.app.route('/api/builds/<job_id>')
+        def api_build_status(job_id):
+            job = self.build_queue.get(job_id)
+            if not job:
+                return jsonify({'error': 'Tâche introuvable'}), 404
+            return jsonify(asdict(job))
+        
+        @self.app.route('/api/projects/<name>/build-cache/clear', methods=['POST'])
+        def api_clear_build_cache(name):
+            cleared = PyInstallerBuilder.clear_work_directory(name)
+            return jsonify({'success': True, 'cleared': cleared})
+        
+        @self.app.route('/api/metrics/builds')
+        def api_build_metrics():
+            days = request.args.get('days', type=int)
+            limit = min(request.args.get('limit', BUILD_METRICS_WINDOW, type=int), BUILD_METRICS_WINDOW)
+            return jsonify(self._summarize_build_metrics(self.db.list_build_metrics(limit, days)))
+        
+        @self.app.route('/api/cache/builds')
+        def api_build_cache():
+            return jsonify(self.build_cache.stats())
+        
+        @self.app.route('/api/cache/distributions')
+        def api_distribution_index():
+            return jsonify(self.distribution_index.stats())
+        
+        @self.app.route('/api/cache/analysis')
+        def api_analysis_cache():
+            return jsonify({**self.analysis_cache.stats(), 'pool': self.analysis_pool.stats()})
+        
+        @self.app.route('/api/builds/<job_id>/logs')
+        def api_build_logs(job_id):
+            build_log = self.build_queue.get_log(job_id)
+            if not build_log:
+                return jsonify({'error': 'Tâche introuvable'}), 404
+            
+            # Reprise après reconnexion: ?offset=N ou en-tête Last-Event-ID
+            offset = request.args.get('offset', type=int)
+            if offset is None:
+                last_event_id = request.headers.get('Last-Event-ID', '')
+                offset = int(last_event_id) + 1 if last_event_id.isdigit() else 0
+            
+            def stream():
+                position = max(0, offset)
+                while True:
+                    first, lines, closed = build_log.read(position, timeout=SSE_KEEPALIVE_SECONDS)
+                    if first > position:
+                        yield f"event: truncated\ndata: {first}\n\n"
+                    for index, line in enumerate(lines):
+                        yield f"id: {first + index}\ndata: {line}\n\n"
+                    position = first + len(lines)
+                    
+                    if closed and not lines:
+                        job = self.build_queue.get(job_id)
+                        status = job.status if job else 'unknown'
+                        yield f"event: end\ndata: {json.dumps({'status': status})}\n\n"
+                        return
+                    if not lines:
+                        yield ": keep-alive\n\n"
+            
+            return Response(stream_with_context(stream()), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        
+        @self.app.route('/api/history/<int:history_id>/log')
+        def api_history_log(history_id):
+            log_output = self.db.get_conversion_log(history_id)
+            if log_output is None:
+                return jsonify({'error': 'Historique introuvable'}), 404
+            return Response(log_output, mimetype='text/plain')
+        
+        @self.app.route('/api/builds/<job_id>/cancel', methods=['POST'])
+        def api_build_cancel(job_id):
+            if self.build_queue.cancel(job_id):
+                return jsonify({'success': True})
+            return jsonify({'success': False, 'error': 'Tâche introuvable ou déjà terminée'}), 404
         
         @self.app.route('/download/<path:filename>')
         def download_file(filename):
@@ -1538,6 +5672,7 @@ class FlaskWebInterface:
         
         @self.app.route('/delete/<name>', methods=['POST'])
         def delete_project(name):
+            self.incremental_analyzer.discard(name)
             if self.db.delete_project(name):
                 flash('Projet supprimé avec succès', 'success')
             else:
@@ -1547,28 +5682,281 @@ class FlaskWebInterface:
         
         @self.app.route('/api/projects')
         def api_projects():
-            return jsonify(self.db.list_projects())
+            try:
+                limit = int(request.args.get('limit', PROJECTS_PAGE_SIZE))
+                if not 0 < limit <= PROJECTS_PAGE_MAX:
+                    raise ValueError(f"limit doit être compris entre 1 et {PROJECTS_PAGE_MAX}")
+                projects, next_cursor = self.db.list_projects(
+                    limit, request.args.get('cursor'),
+                    gui_framework=request.args.get('framework') or None,
+                    author=request.args.get('author') or None)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            return jsonify({'success': True, 'projects': projects, 'next_cursor': next_cursor})
+        
+        @self.app.route('/api/search')
+        def api_search():
+            if not self.db.search_enabled:
+                return jsonify({'success': False, 'error': 'Recherche indisponible (SQLite sans FTS5)'}), 503
+            
+            fields = tuple(filter(None, request.args.get('fields', '').split(','))) or \
+                ('name', 'description', 'author', 'symbols', 'source')
+            try:
+                limit = int(request.args.get('limit', SEARCH_PAGE_SIZE))
+                offset = int(request.args.get('offset', 0))
+                if not 0 < limit <= SEARCH_PAGE_MAX or offset < 0:
+                    raise ValueError(f"Pagination invalide (offset >= 0, 0 < limit <= {SEARCH_PAGE_MAX})")
+                unknown = set(fields) - {'name', 'description', 'author', 'symbols', 'source'}
+                if unknown:
+                    raise ValueError(f"Champs inconnus: {', '.join(sorted(unknown))}")
+                results, total = self.db.search_projects(request.args.get('q', ''), limit, offset, fields)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            
+            return jsonify({'success': True, 'results': results, 'total': total, 'offset': offset,
+                            'limit': limit, 'next_offset': offset + limit if offset + limit < total else None})
         
         @self.app.route('/api/analyze', methods=['POST'])
         def api_analyze():
             if 'code' not in request.json:
                 return jsonify({'error': 'Code manquant'})
+            try:
+                params = AnalysisResult.view_params(request.json)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
             
-            # Analyse du code (simulation)
-            code = request.json['code']
+            # Analyse du code en mémoire
+            analysis = self.analyzer.analyze_source(request.json['code'], '/api/analyze')
             
-            # Sauvegarde temporaire pour analyse
-            temp_file = os.path.join(UPLOAD_FOLDER, "temp_analysis.py")
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(code)
+            if not analysis:
+                return jsonify({})
+            return jsonify({**analysis.render(**params),
+                            'dependencies': self.analyzer.resolve_requirements(analysis)})
+        
+        @self.app.route('/api/analyze/batch', methods=['POST'])
+        def api_analyze_batch():
+            data = request.get_json(silent=True) or {}
+            sources = data.get('sources')
+            if not isinstance(sources, list) or not all(
+                    isinstance(item, dict) and isinstance(item.get('code'), str) for item in sources):
+                return jsonify({'success': False,
+                                'error': 'Liste "sources" attendue: [{"id": ..., "code": ...}]'}), 400
+            if len(sources) > ANALYSIS_BATCH_MAX:
+                return jsonify({'success': False,
+                                'error': f'Au plus {ANALYSIS_BATCH_MAX} sources par lot'}), 413
+            try:
+                params = AnalysisResult.view_params(data)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
             
-            analysis = self.analyzer.analyze_file(temp_file)
+            # Une ligne JSON par source, dans l'ordre où les analyses se terminent
+            def stream():
+                tasks = [((index, item.get('id', index)), item['code']) for index, item in enumerate(sources)]
+                for (index, source_id), analysis, error in self.analyzer.analyze_many(tasks):
+                    line = {'index': index, 'id': source_id, 'success': error is None}
+                    if error is None:
+                        line['analysis'] = analysis.render(**params)
+                    elif isinstance(error, SyntaxError):
+                        line.update(error=f"Erreur de syntaxe: {error.msg}", line=error.lineno)
+                    else:
+                        line['error'] = str(error)
+                    yield json.dumps(line) + '\n'
             
-            # Nettoyage
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            return Response(stream_with_context(stream()), mimetype='application/x-ndjson',
+                            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+        
+        @self.app.route('/api/projects/<name>/analyze', methods=['POST'])
+        def api_analyze_incremental(name):
+            data = request.get_json(silent=True) or {}
+            if not isinstance(data.get('code'), str):
+                return jsonify({'success': False, 'error': 'Code manquant'}), 400
+            
+            # Diff par rapport à la version connue du client (analyse complète sinon)
+            try:
+                payload = self.incremental_analyzer.update(name, data['code'], data.get('version'))
+            except SyntaxError as e:
+                return jsonify({'success': False, 'error': f"Erreur de syntaxe: {e.msg}",
+                                'line': e.lineno}), 400
+            except AnalysisBudgetExceeded as e:
+                return jsonify({'success': False, 'error': str(e)}), 413
+            
+            return jsonify({'success': True, **payload})
+        
+        @self.app.route('/api/analyze/project', methods=['POST'])
+        def api_analyze_project():
+            file = request.files.get('file')
+            if not file:
+                return jsonify({'success': False, 'error': 'Archive zip manquante'}), 400
+            
+            try:
+                graph = self.project_analyzer.analyze_zip(file.read())
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
             
-            return jsonify(analysis)
+            return jsonify({'success': True, **graph})
+    
+    def _upload_project(self, filename: str, data: bytes):
+        """Crée un projet d'analyse depuis une archive zip, à partir de son point d'entrée
+        
+        Seul le source du point d'entrée est conservé: le projet n'est pas
+        constructible (il n'embarquerait pas les autres modules).
+        """
+        try:
+            graph = self.project_analyzer.analyze_zip(data)
+        except ValueError as e:
+            flash(str(e), 'error')
+            return redirect(request.url)
+        
+        # Point d'entrée détecté, sinon unique module racine du graphe
+        candidates = graph['entry_points'] or (graph['roots'] if len(graph['roots']) == 1 else [])
+        if not candidates:
+            flash("Aucun point d'entrée détecté dans l'archive", 'error')
+            return redirect(request.url)
+        entry = graph['modules'][candidates[0]]
+        dependencies = self.distribution_index.resolve(graph['third_party'])
+        
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            source_code = CodeAnalyzer.decode_source(archive.read(entry['path']))
+        
+        config = ProjectConfig(
+            name=os.path.splitext(filename)[0],
+            description=f"Application générée depuis {filename} ({len(graph['modules'])} modules, "
+                        f"point d'entrée {candidates[0]})",
+            author="Utilisateur",
+            version="1.0.0",
+            gui_framework=graph['gui_framework'] if graph['gui_framework'] != 'console' else 'tkinter',
+            requirements=dependencies['requirements'],
+            analysis_only=True
+        )
+        digest = AnalysisCache.digest(source_code)
+        self.db.save_project(config, source_code, digest)
+        self.background_analysis.submit(self._index_symbols, config.name, source_code, digest)
+        
+        message = f"Archive {filename} analysée: {len(graph['modules'])} modules, {graph['edges']} imports internes"
+        if graph['errors']:
+            message += f", {len(graph['errors'])} module(s) illisible(s)"
+        flash(message + " (projet d'analyse, non constructible)", 'success')
+        self._flash_missing_dependencies(dependencies)
+        return redirect(url_for('project_config', name=config.name))
+    
+    def _index_symbols(self, name: str, source_code: str, digest: Optional[str]) -> Optional[AnalysisResult]:
+        """Analyse un source et indexe ses symboles pour la recherche"""
+        digest = digest or AnalysisCache.digest(source_code)
+        analysis = self.analyzer.analyze_source(source_code, name, digest)
+        self.db.update_search_symbols(name, digest, analysis.symbol_names() if analysis else "")
+        return analysis
+    
+    def _index_missing_symbols(self):
+        """Indexe les symboles des projets enregistrés sans (analyse en cache le plus souvent)"""
+        for name, digest in self.db.list_projects_without_symbols():
+            source_code = self.db.load_source(digest)
+            if source_code is not None:
+                self._index_symbols(name, source_code, digest)
+    
+    def _project_analysis(self, name: str, digest: Optional[str]) -> Optional[AnalysisResult]:
+        """Analyse d'un projet: depuis le cache par empreinte, sinon en lisant son source"""
+        if not digest:
+            return None
+        analysis = self.analyzer.cached(digest)
+        if analysis is None:
+            source_code = self.db.load_source(digest)
+            if source_code is not None:
+                analysis = self.analyzer.analyze_source(source_code, name, digest)
+        return analysis
+    
+    def _source_preview(self, digest: Optional[str]) -> Tuple[str, int, bool]:
+        """Début du source, nombre de lignes et troncature, en lisant le source en flux"""
+        head, size, lines = b'', 0, 1
+        max_bytes = SOURCE_PREVIEW_CHARS * 4  # Au plus 4 octets par caractère en UTF-8
+        for chunk in self.db.iter_source(digest) if digest else ():
+            if len(head) < max_bytes:
+                head += chunk[:max_bytes - len(head)]
+            size += len(chunk)
+            lines += chunk.count(b'\n')
+        preview = head.decode('utf-8', errors='ignore')  # Caractère éventuellement coupé en fin
+        truncated = len(preview) > SOURCE_PREVIEW_CHARS or size > len(head)
+        return preview[:SOURCE_PREVIEW_CHARS], lines, truncated
+    
+    def _schedule_analysis(self, config: ProjectConfig, source_code: str, digest: Optional[str]):
+        """Lance l'analyse complète d'un projet uploadé en arrière-plan"""
+        future = self.background_analysis.submit(
+            self._complete_analysis, config.name, source_code, digest,
+            config.gui_framework, list(config.requirements))
+        with self._pending_lock:
+            self.pending_analyses[config.name] = future
+        
+        def forget(done):
+            with self._pending_lock:
+                if self.pending_analyses.get(config.name) is done:
+                    del self.pending_analyses[config.name]
+        future.add_done_callback(forget)
+    
+    def _analysis_pending(self, name: str) -> bool:
+        """Analyse d'arrière-plan en cours pour ce projet"""
+        with self._pending_lock:
+            future = self.pending_analyses.get(name)
+        return future is not None and not future.done()
+    
+    def _complete_analysis(self, name: str, source_code: str, digest: Optional[str],
+                           guessed_framework: str, guessed_requirements: List[str]) -> Optional[AnalysisResult]:
+        """Analyse complète (mise en cache) puis correction des valeurs devinées à l'upload
+        
+        Le framework et les requirements ne sont remplacés que s'ils valent encore
+        ce qu'avait déduit la détection rapide (pas de modification utilisateur).
+        """
+        analysis = self._index_symbols(name, source_code, digest)
+        project_data = self.db.load_project_config(name) if analysis else None
+        if not project_data or project_data[1] != (digest or AnalysisCache.digest(source_code)):
+            return analysis  # Échec d'analyse, ou projet supprimé ou remplacé entre-temps
+        
+        config = project_data[0]
+        changed = False
+        if config.gui_framework == guessed_framework and analysis.gui_framework != guessed_framework:
+            config.gui_framework = analysis.gui_framework
+            changed = True
+        requirements = self.analyzer.resolve_requirements(analysis)['requirements']
+        if config.requirements == guessed_requirements and requirements != guessed_requirements:
+            config.requirements = requirements
+            changed = True
+        if changed:
+            self.db.update_project_config(config)
+            logger.info(f"Projet {name} mis à jour par l'analyse complète "
+                        f"({config.gui_framework}, {len(config.requirements)} requirements)")
+        return analysis
+    
+    @staticmethod
+    def _flash_missing_dependencies(dependencies: Dict[str, Any]):
+        """Prévient avant la construction des modules absents de l'environnement de build"""
+        if dependencies.get('missing'):
+            flash("Modules introuvables dans l'environnement de build (à installer avant de construire): "
+                  + ', '.join(dependencies['missing']), 'warning')
+        if dependencies.get('local'):
+            flash("Modules sans distribution installée, non ajoutés aux requirements: "
+                  + ', '.join(dependencies['local']), 'warning')
+    
+    @staticmethod
+    def _summarize_build_metrics(builds: List[Dict]) -> Dict[str, Any]:
+        """Percentiles par phase, globalement et par framework GUI"""
+        def summarize(group: List[Dict]) -> Dict[str, Any]:
+            phases: Dict[str, List[float]] = {}
+            for build in group:
+                for phase, duration in build['phase_timings'].items():
+                    phases.setdefault(phase, []).append(duration)
+            return {
+                'builds': len(group),
+                'total': _percentiles([b['duration'] for b in group if b['duration'] is not None]),
+                'phases': {phase: _percentiles(values) for phase, values in phases.items()},
+                'artifact_size': _percentiles([b['artifact_size'] for b in group if b['artifact_size'] is not None]),
+                'peak_rss': _percentiles([b['peak_rss'] for b in group if b['peak_rss'] is not None])
+            }
+        
+        frameworks: Dict[str, List[Dict]] = {}
+        for build in builds:
+            frameworks.setdefault(build['gui_framework'] or 'unknown', []).append(build)
+        
+        summary = summarize(builds)
+        summary['frameworks'] = {name: summarize(group) for name, group in frameworks.items()}
+        return summary
     
     def _allowed_file(self, filename: str) -> bool:
         """Vérifie si le fichier est autorisé"""
@@ -1578,7 +5966,11 @@ class FlaskWebInterface:
     def run(self, host='127.0.0.1', port=5000, debug=False):
         """Lance le serveur Flask"""
         logger.info(f"Démarrage du serveur Flask sur http://{host}:{port}")
-        self.app.run(host=host, port=port, debug=debug)
+        try:
+            self.app.run(host=host, port=port, debug=debug)
+        finally:
+            self.build_queue.shutdown()
+            self.db.close()
 
 def setup_directories():
     """Configure tous les répertoires nécessaires"""
@@ -1593,8 +5985,31 @@ def setup_directories():
         os.makedirs(directory, exist_ok=True)
         logger.info(f"Répertoire créé/vérifié: {directory}")
 
+def run_benchmark(artifacts: List[str], runs: int, drop_caches: bool = False) -> int:
+    """Mode benchmark: démarrage à froid des exécutables de OUTPUT_FOLDER"""
+    benchmark = StartupBenchmark(runs=runs, drop_caches=drop_caches)
+    report = benchmark.compare(artifacts)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0 if all(result['success'] for result in report['results']) else 1
+
 def main():
     """Point d'entrée principal du programme"""
+    parser = argparse.ArgumentParser(description="Convertisseur de scripts Python vers applications de bureau")
+    parser.add_argument('--benchmark', nargs='+', metavar='ARTEFACT',
+                        help="Mesure le démarrage à froid d'exécutables générés (chemins ou noms dans output/)")
+    parser.add_argument('--runs', type=int, default=BENCHMARK_RUNS,
+                        help="Nombre de lancements par exécutable")
+    parser.add_argument('--drop-caches', action='store_true',
+                        help="Vide le cache de pages avant chaque lancement (Linux, root)")
+    args = parser.parse_args()
+    
+    file_handler = logging.FileHandler(LOG_FILE)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.getLogger().addHandler(file_handler)
+    
+    if args.benchmark:
+        return run_benchmark(args.benchmark, args.runs, args.drop_caches)
+    
     print("""
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                    SCRIPT TO DESKTOP APP CONVERTER v2.0                      ║
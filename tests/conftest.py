@@ -0,0 +1,5 @@
+import os
+import sys
+
+# app.py est un module unique à la racine du dépôt
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,23 @@
+"""CodeAnalyzer.scan_header_imports: imports de l'en-tête lus par le tokenizer"""
+import pytest
+
+import app
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('import os\nimport sys\n', ('os', 'sys')),
+    ('import os; import tkinter\n', ('os', 'tkinter')),
+    ('import os; from PyQt5 import QtWidgets; import a.b as c, d\n', ('os', 'PyQt5', 'a.b', 'd')),
+    ('import json;\nimport re\n', ('json', 're')),
+    ('"""doc"""; import os\n__all__ = []; import sys\n', ('os', 'sys')),
+    ('import os; print(1); import tkinter\n', ('os',)),
+    ('try:\n    import tkinter; import json\nexcept ImportError:\n    pass\n', ('tkinter', 'json')),
+])
+def test_scan_header_imports(source, expected):
+    assert app.CodeAnalyzer.scan_header_imports(source) == expected
+
+
+def test_semicolon_header_detects_framework():
+    framework, imports = app.CodeAnalyzer.detect_framework_fast('import os; import tkinter as tk\n')
+    assert framework == 'tkinter'
+    assert imports == ('os', 'tkinter')
@@ -0,0 +1,135 @@
+"""IncrementalAnalyzer: une session suit l'analyse complète du même source"""
+import ast
+import random
+
+import pytest
+
+import app
+
+BASE_SOURCE = '''"""Module de test"""
+import os
+import sys as system
+from collections import OrderedDict, deque
+
+CONSTANT = 42
+names = [n for n in range(10) if n % 2]
+
+
+@staticmethod
+def decorated(a, b=1):
+    """Docstring"""
+    if a:
+        for i in range(b):
+            while i:
+                i -= 1
+    return a + b
+
+
+class Base:
+    attribute = 1
+
+    def method(self, x):
+        try:
+            return x / 2
+        except ZeroDivisionError:
+            return None
+
+
+class Child(Base, OrderedDict):
+    def other(self):
+        text = """multi
+ligne"""
+        return text
+
+
+def main():
+    value = decorated(1)
+    print(value, os.getcwd(), system.argv)
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+INSERTED_LINES = [
+    'import json',
+    'from os import path',
+    'x = 1',
+    'def added(y):',
+    '    return y',
+    '    pass',
+    '        pass',
+    'class Added:',
+    '    z = 2',
+    '    def m(self): return 1',
+    '',
+    '# commentaire',
+    'if x:',
+    '    import re',
+    'try:',
+    'except Exception:',
+    '@decorated',
+    'total = sum(i for i in range(3))',
+]
+
+
+def _edit(rnd, lines):
+    """Insertion, suppression, indentation ou désindentation d'une ligne"""
+    operation = rnd.randrange(4)
+    if operation == 0 or not lines:
+        lines.insert(rnd.randint(0, len(lines)), rnd.choice(INSERTED_LINES))
+    elif operation == 1:
+        del lines[rnd.randrange(len(lines))]
+    elif operation == 2:
+        index = rnd.randrange(len(lines))
+        lines[index] = '    ' + lines[index]
+    else:
+        index = rnd.randrange(len(lines))
+        if lines[index].startswith('    '):
+            lines[index] = lines[index][4:]
+    return lines
+
+
+def _parses(source):
+    try:
+        ast.parse(source)
+        return True
+    except SyntaxError:
+        return False
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_session_matches_full_analysis(seed):
+    analyzer = app.CodeAnalyzer()
+    incremental = app.IncrementalAnalyzer(analyzer)
+    rnd = random.Random(seed)
+    lines = BASE_SOURCE.split('\n')
+    version = incremental.update('project', BASE_SOURCE)['version']
+    
+    applied = 0
+    for step in range(250):
+        candidate = _edit(rnd, list(lines))
+        source = '\n'.join(candidate)
+        if not _parses(source):
+            continue
+        payload = incremental.update('project', source, version)
+        version = payload['version']
+        expected = analyzer.analyze_source(source)
+        assert incremental.sessions['project'].result.to_dict() == expected.to_dict(), (step, source)
+        lines = candidate
+        applied += 1
+    assert applied > 50
+
+
+def test_invalid_source_leaves_session_unchanged():
+    analyzer = app.CodeAnalyzer()
+    incremental = app.IncrementalAnalyzer(analyzer)
+    version = incremental.update('project', BASE_SOURCE)['version']
+    before = incremental.sessions['project'].result.to_dict()
+    
+    with pytest.raises(SyntaxError):
+        incremental.update('project', BASE_SOURCE.replace('def main():', 'def main(:'), version)
+    
+    session = incremental.sessions['project']
+    assert session.version == version
+    assert session.result.to_dict() == before
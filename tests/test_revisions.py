@@ -0,0 +1,126 @@
+"""Révisions des projets: deltas SourceDelta et reconstruction de chaque version"""
+import random
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = app.DatabaseManager(str(tmp_path / 'revisions.db'))
+    yield manager
+    manager.close()
+
+
+def _config(name='project', **changes):
+    return app.ProjectConfig(name, changes.pop('description', 'desc'), 'author', '1.0', **changes)
+
+
+def _random_versions(seed, count):
+    """Versions successives d'un source: éditions dispersées, CRLF, \\x0c, réécriture totale"""
+    rnd = random.Random(seed)
+    lines = [f"def f{i}(x):\n    return x * {i}\n" for i in range(400)]
+    versions = [''.join(lines)]
+    for step in range(count - 1):
+        for _ in range(rnd.randint(1, 4)):
+            index = rnd.randrange(len(lines))
+            operation = rnd.random()
+            if operation < 0.3:
+                lines[index] = f"# édition {step}\n" + lines[index]
+            elif operation < 0.5:
+                del lines[index]
+            elif operation < 0.7:
+                lines.insert(index, f"crlf_{step} = {index}\r\n")
+            elif operation < 0.85:
+                lines.insert(index, f"saut\x0cde page {step}\n")
+            else:
+                lines.insert(index, f"cr_seul_{step} = 1\r")
+        source = ''.join(lines)
+        if step == 10:
+            source += "dernière ligne sans fin de ligne \udcff"
+        if step == 20:
+            source = source[::-1]
+        versions.append(source)
+    return versions
+
+
+@pytest.mark.parametrize('seed', [1, 2])
+def test_source_delta_round_trip(seed):
+    versions = _random_versions(seed, 30)
+    for old, new in zip(versions, versions[1:]):
+        old_lines = old.splitlines(keepends=True)
+        ops = app.SourceDelta.compute(old_lines, new.splitlines(keepends=True))
+        assert ''.join(app.SourceDelta.apply(old_lines, ops)) == new
+    assert app.SourceDelta.apply(['a\n'], None) == ['a\n']
+
+
+def test_every_revision_reconstructs(db):
+    versions = _random_versions(3, 50)
+    project_id = db.save_project(_config(), versions[0])
+    history_id = db.add_conversion(project_id, 'success', b'')
+    for number, source in enumerate(versions[1:], 1):
+        assert db.save_project(_config(description=f"v{number}"), source) == project_id
+    
+    revisions = db.list_revisions('project')
+    assert [r['revision'] for r in revisions] == list(range(len(versions), 0, -1))
+    for revision, source in enumerate(versions, 1):
+        config, restored = db.load_revision('project', revision)
+        assert restored == source
+        assert config.description == ('desc' if revision == 1 else f"v{revision - 1}")
+    
+    # Au plus REVISION_SNAPSHOT_INTERVAL - 1 deltas à appliquer
+    snapshots = sorted(r['revision'] for r in revisions if r['snapshot'])
+    for revision in range(1, len(versions) + 1):
+        base = max(s for s in snapshots if s <= revision)
+        assert revision - base < app.REVISION_SNAPSHOT_INTERVAL
+    # Les éditions dispersées sont stockées en deltas, bien plus petits que les copies
+    assert len(snapshots) < len(versions) // 3
+    assert sum(r['stored_size'] for r in revisions) < sum(r['size'] for r in revisions) // 10
+    
+    with db.get_connection() as conn:
+        row = conn.execute("SELECT project_id FROM conversion_history WHERE id = ?", (history_id,)).fetchone()
+    assert row['project_id'] == project_id
+    assert db.load_revision('project', len(versions) + 1) is None
+    assert db.load_revision('missing', 1) is None
+
+
+def test_unchanged_save_adds_no_revision(db):
+    config = _config()
+    db.save_project(config, "a = 1\n")
+    db.save_project(config, "a = 1\n")
+    assert len(db.list_revisions('project')) == 1
+
+
+def test_update_project_config_records_revision(db):
+    db.save_project(_config(), "a = 1\n")
+    db.save_project(_config(), "a = 2\n")
+    config, _ = db.load_project_config('project')
+    config.author = 'someone else'
+    assert db.update_project_config(config)
+    
+    revisions = db.list_revisions('project')
+    assert len(revisions) == 3
+    config, source = db.load_revision('project', 3)
+    assert (config.author, source) == ('someone else', "a = 2\n")
+
+
+def test_legacy_project_seeded_as_first_revision(db):
+    db.save_project(_config(), "legacy = 1\r\n\x0c\n")
+    with db.get_connection() as conn:
+        conn.execute("DELETE FROM project_revisions")
+    
+    db.save_project(_config(description='new'), "legacy = 2\r\n\x0c\n")
+    assert [r['revision'] for r in db.list_revisions('project')] == [2, 1]
+    config, source = db.load_revision('project', 1)
+    assert (config.description, source) == ('desc', "legacy = 1\r\n\x0c\n")
+    config, source = db.load_revision('project', 2)
+    assert (config.description, source) == ('new', "legacy = 2\r\n\x0c\n")
+
+
+def test_delete_project_removes_revisions(db):
+    db.save_project(_config(), "a = 1\n")
+    db.save_project(_config(), "a = 2\n")
+    assert db.delete_project('project')
+    with db.get_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM project_revisions").fetchone()[0] == 0